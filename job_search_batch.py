@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — multi-core batch runner (v0.5.1e Gentle Mode rules)
+# Shards a seed range across worker processes. Every run's seed is derived from
+# (batch seed, run index), so results are identical for any worker count, and
+# workers return only constant-size statistics (job_search_stats.py) — never
+# Player objects. --age/--industry "all" cycles runs over every group and
+# reports each one. --version runs an older release's rules (see
+# job_search_rulesets.py); "all" compares them, and --target sets the industry
+# applied to for the releases that allow a pivot. --tapes plays run i on row i
+# of pre-generated random tapes (job_search_tapes.py) instead of its seed.
+# --ci keeps streaming shards per group until each win rate is pinned down to
+# the requested interval, and stops each group as soon as it is.
+#
+#   python job_search_batch.py --runs 200000 --workers 8 --age Late
+#   python job_search_batch.py --runs 200000 --age all --industry all
+#   python job_search_batch.py --runs 20000 --version all
+#   python job_search_batch.py --runs 20000 --version all --target Finance
+#   python job_search_batch.py --runs 100000 --tapes tapes
+#   python job_search_batch.py --ci 0.5 --age all --industry all
+
+import argparse
+import copy
+import dataclasses
+import math
+import os
+import re
+import time
+import warnings
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+import job_search_rulesets as rulesets
+from job_search_stats import RunStats, StatsSink, wilson_interval
+
+# Runs per shard. Fixed (not derived from the worker count) so the same seeds
+# always land in the same shard.
+SHARD_RUNS = 2_000
+
+Z = 1.96  # 95% intervals
+
+# Shards a group plays under --ci before its interval may stop it. One shard
+# that happens to show no wins (or only wins) has a narrow interval too.
+MIN_SHARDS = 5
+
+# Seeds each shared industry is played on next to the one it copies before
+# their results are shared (see share_industries()).
+SYMMETRY_SEEDS = 32
+
+_MASK64 = (1 << 64) - 1
+
+
+def derive_seed(batch_seed: int, index: int) -> int:
+    """Seed for run ``index`` of a batch (SplitMix64 finalizer over both inputs).
+
+    Neighbouring indexes get unrelated seeds, so each run draws from its own
+    independent stream no matter which worker plays it.
+    """
+    z = (batch_seed * 0x9E3779B97F4A7C15 + index + 1) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def groups(age: str, industry: str) -> List[Tuple[str, str]]:
+    """(age, industry) pairs a batch cycles through; "all" expands to every name."""
+    ages = list(game.AGE_BALANCE) if age == "all" else [age]
+    industries = list(game.INDUSTRIES) if industry == "all" else [industry]
+    return list(product(ages, industries))
+
+
+def _frozen(version: Optional[str]) -> bool:
+    """True for an older release's ruleset, False for the current script."""
+    return version not in (None, rulesets.CURRENT)
+
+
+def _pivots(version: Optional[str]) -> bool:
+    """True if ``version``'s ruleset lets runs apply outside their start industry."""
+    return _frozen(version) and rulesets.VERSIONS[version].pivots
+
+
+def _engine(version: Optional[str], tapes: Optional[str]):
+    """(ruleset, tape) to play on; None for either means the current script / seeds."""
+    rules = rulesets.get_ruleset(version) if version else None
+    tape = None
+    if tapes:
+        from job_search_tapes import open_tapes  # needs NumPy
+        tape = open_tapes(tapes)
+    return rules, tape
+
+
+def _play(i: int, batch_seed: int, age: str, industry: str, policy, rules, tape,
+          target: Optional[str] = None) -> game.RunResult:
+    """Run ``i`` of a batch in one group."""
+    if tape is not None:
+        return tape.simulate_run(i, policy, age, industry)
+    seed = derive_seed(batch_seed, i)
+    if rules is None:
+        return game.simulate_run(policy, seed, age, industry)
+    return rulesets.simulate(rules, policy, seed, age, industry, target=target)
+
+
+def run_shard(batch_seed: int, start: int, stop: int, pairs: List[Tuple[str, str]], policy=None,
+              version: Optional[str] = None, tapes: Optional[str] = None,
+              target: Optional[str] = None) -> StatsSink:
+    """Play runs ``start``..``stop-1`` of a batch and return their statistics.
+
+    Run ``i`` plays ``pairs[i % len(pairs)]`` (see groups()), so the split is
+    fixed by the run index like the seed is.
+    """
+    sink = StatsSink()
+    rules, tape = _engine(version, tapes)
+    for i in range(start, stop):
+        sink.add(_play(i, batch_seed, *pairs[i % len(pairs)], policy, rules, tape, target))
+    return sink
+
+
+# -----------------------------
+# Industry symmetry
+# -----------------------------
+# Industries in the same game.INDUSTRY_CLASS play identically on the same seed,
+# apart from the industry's name and dream job title in the win reason. A grid
+# over them plays one industry per class and age and copies its statistics to
+# the rest, so "--industry all" costs what a single industry does.
+
+def relabel(reason: Optional[str], src: str, dst: str) -> Optional[str]:
+    """A win or loss reason from industry ``src`` as industry ``dst`` words it."""
+    if not reason:
+        return reason
+    names = {src: dst, game.INDUSTRIES[src]["dream_job_title"]: game.INDUSTRIES[dst]["dream_job_title"]}
+    return re.sub("|".join(map(re.escape, sorted(names, key=len, reverse=True))), lambda m: names[m[0]], reason)
+
+
+def relabel_stats(stats: RunStats, src: str, dst: str) -> RunStats:
+    """A copy of industry ``src``'s RunStats as industry ``dst``'s."""
+    out = copy.deepcopy(stats)
+    out.win_reasons = Counter({relabel(r, src, dst): n for r, n in stats.win_reasons.items()})
+    out.loss_reasons = Counter({relabel(r, src, dst): n for r, n in stats.loss_reasons.items()})
+    return out
+
+
+def share_industries(pairs: List[Tuple[str, str]], seed: int = 0, policy=None, version: Optional[str] = None,
+                     tapes: Optional[str] = None) -> Dict[Tuple[str, str], List[Tuple[str, str]]]:
+    """Groups to play, each with the groups that copy its results.
+
+    A group copies the first listed group with the same age whose industry is
+    in the same game.INDUSTRY_CLASS. Before that's trusted, the two play
+    SYMMETRY_SEEDS of the batch's runs side by side with ``policy`` and the
+    given rules; if any pair of runs differs past relabel(), something (a rule
+    or the policy) tells the industries apart: a warning says so and the group
+    is played on its own.
+    """
+    plan: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+    for age, industry in pairs:
+        cls = game.INDUSTRY_CLASS[industry]
+        lead = next((p for p in plan if p[0] == age and game.INDUSTRY_CLASS[p[1]] == cls), None)
+        if lead is None:
+            plan[(age, industry)] = []
+        else:
+            plan[lead].append((age, industry))
+    if not any(plan.values()):
+        return plan
+
+    rules, tape = _engine(version, tapes)
+    broken = []
+    for lead, members in plan.items():
+        if not members:
+            continue
+        base = [_play(i, seed, *lead, policy, rules, tape) for i in range(SYMMETRY_SEEDS)]
+        for member in list(members):
+            for i, want in enumerate(base):
+                got = _play(i, seed, *member, policy, rules, tape)
+                got = dataclasses.replace(got, industry=lead[1],
+                                          win_reason=relabel(got.win_reason, member[1], lead[1]),
+                                          loss_reason=relabel(got.loss_reason, member[1], lead[1]))
+                if got != want:
+                    warnings.warn(f"{member[0]}/{member[1]} no longer plays like {lead[0]}/{lead[1]} "
+                                  f"(run {i} differs); playing it separately", stacklevel=3)
+                    members.remove(member)
+                    broken.append(member)
+                    break
+    plan.update((member, []) for member in broken)
+    return plan
+
+
+def simulate_batch(n_runs: int, workers: Optional[int] = None, *, seed: int = 0, age: str = "Young",
+                   industry: str = "Tech", policy=None, version: Optional[str] = None,
+                   tapes: Optional[str] = None, share: bool = True,
+                   target: Optional[str] = None) -> StatsSink:
+    """Play ``n_runs`` headless runs over ``workers`` processes and merge their statistics.
+
+    ``workers`` defaults to the CPU count; 1 runs inline with no pool. ``policy``
+    must be picklable (a module-level function) when workers > 1. ``version``
+    picks a ruleset from job_search_rulesets.VERSIONS; None or "gentle" plays
+    the current script itself through game.simulate_run(). ``age``/``industry``
+    may be "all" (see groups()). ``tapes`` is a directory from
+    job_search_tapes.py whose row ``i`` replaces run ``i``'s seed; tapes only
+    cover the current rules, not older versions. With ``share``, groups that
+    share_industries() finds interchangeable are played once and copied, which
+    cuts the runs actually played by the same factor. ``target`` is the
+    industry every run applies to, for rulesets that allow a pivot; it turns
+    sharing off, since the start industries then no longer play alike.
+    """
+    if tapes and _frozen(version):
+        raise ValueError("tapes only cover the current rules; drop --version")
+    workers = workers or os.cpu_count() or 1
+    pairs = groups(age, industry)
+    share = share and not target
+    plan = share_industries(pairs, seed, policy, version, tapes) if share else {p: [] for p in pairs}
+    played = list(plan)
+    n_play = -(-n_runs * len(played) // len(pairs))
+    shards = [(seed, lo, min(lo + SHARD_RUNS, n_play), played, policy, version, tapes, target)
+              for lo in range(0, n_play, SHARD_RUNS)]
+    total = StatsSink()
+    if workers == 1:
+        for shard in shards:
+            total += run_shard(*shard)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for stats in pool.map(run_shard, *zip(*shards)):
+                total += stats
+    for lead, members in plan.items():
+        if lead in total.groups:
+            for member in members:
+                total.groups[member] = relabel_stats(total.groups[lead], lead[1], member[1])
+                total.copies[member] = lead
+    return total
+
+
+def margin(stats) -> float:
+    """Half-width of the 95% Wilson interval on a RunStats' win rate."""
+    if not stats.runs:
+        return math.inf
+    lo, hi = wilson_interval(sum(stats.win_reasons.values()), stats.runs, Z)
+    return (hi - lo) / 2
+
+
+def simulate_until(halfwidth: float, workers: Optional[int] = None, *, seed: int = 0, age: str = "Young",
+                   industry: str = "Tech", policy=None, version: Optional[str] = None,
+                   tapes: Optional[str] = None, max_runs: int = 2_000_000,
+                   share: bool = True, target: Optional[str] = None) -> Dict[Tuple[str, str], StatsSink]:
+    """Stream shards per (age, industry) group until its win rate is within ±``halfwidth`` (95%).
+
+    Each group plays runs 0, 1, 2, ... on the batch seeds in SHARD_RUNS-sized
+    shards and is checked after each shard in order, so where it stops, and
+    what it reports, is the same for any ``workers``. A group that's done stops
+    getting shards and has its queued ones cancelled, while the harder groups
+    keep the pool busy. Groups stop at ``max_runs`` even if they're short of
+    the target, and play at least MIN_SHARDS shards before the interval can
+    stop them. Groups that copy another (see share_industries()) come out
+    exactly as if played. Other arguments are as in simulate_batch().
+    """
+    if tapes and _frozen(version):
+        raise ValueError("tapes only cover the current rules; drop --version")
+    workers = workers or os.cpu_count() or 1
+    pairs = groups(age, industry)
+    share = share and not target
+    plan = share_industries(pairs, seed, policy, version, tapes) if share else {p: [] for p in pairs}
+    cells = list(plan)
+    out = {cell: StatsSink() for cell in cells}
+    shards = -(-max_runs // SHARD_RUNS)
+
+    def args(cell, k):
+        lo = k * SHARD_RUNS
+        return (seed, lo, min(lo + SHARD_RUNS, max_runs), [cell], policy, version, tapes, target)
+
+    def fan_out():
+        for lead, members in plan.items():
+            for member in members:
+                stats = out[lead].groups.get(lead, RunStats())
+                out[member] = StatsSink({member: relabel_stats(stats, lead[1], member[1])}, {member: lead})
+        return {pair: out[pair] for pair in pairs}
+
+    def finished(cell, sink):
+        if sink.runs >= max_runs:
+            return True
+        return sink.runs >= MIN_SHARDS * SHARD_RUNS and margin(sink.total()) <= halfwidth
+
+    if workers == 1:
+        for cell in cells:
+            for k in range(shards):
+                out[cell] += run_shard(*args(cell, k))
+                if finished(cell, out[cell]):
+                    break
+        return fan_out()
+
+    live = list(cells)
+    submitted = {cell: 0 for cell in cells}
+    ready = {cell: {} for cell in cells}  # shard index → StatsSink, waiting for earlier shards
+    merged = {cell: 0 for cell in cells}
+    running = {}  # future → (cell, shard index)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while live:
+            # Keep two shards per worker queued, spread round-robin over the open groups
+            while len(running) < 2 * workers:
+                open_cells = [c for c in live if submitted[c] < shards]
+                if not open_cells:
+                    break
+                cell = min(open_cells, key=submitted.get)
+                running[pool.submit(run_shard, *args(cell, submitted[cell]))] = (cell, submitted[cell])
+                submitted[cell] += 1
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                cell, k = running.pop(fut)
+                if cell not in live:
+                    continue
+                ready[cell][k] = fut.result()
+                while merged[cell] in ready[cell]:
+                    out[cell] += ready[cell].pop(merged[cell])
+                    merged[cell] += 1
+                    if finished(cell, out[cell]):
+                        live.remove(cell)
+                        for other, (c, _) in list(running.items()):
+                            if c == cell and other.cancel():
+                                del running[other]
+                        break
+    return fan_out()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run a batch of headless games across CPU cores.")
+    ap.add_argument("--runs", type=int, default=100_000)
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--age", choices=list(game.AGE_BALANCE) + ["all"], default="Young")
+    ap.add_argument("--industry", choices=list(game.INDUSTRIES) + ["all"], default="Tech")
+    ap.add_argument("--version", choices=list(rulesets.NAMES) + ["all"],
+                    help="play an older release's rules; 'all' prints one row per version")
+    ap.add_argument("--target", choices=list(game.INDUSTRIES),
+                    help="industry to apply to, if not --industry (a pivot; v0.1–v0.5 rules only)")
+    ap.add_argument("--tapes", metavar="DIR",
+                    help="play on random tapes from job_search_tapes.py instead of seeds (needs NumPy)")
+    ap.add_argument("--ci", type=float, metavar="POINTS",
+                    help="instead of --runs, play each age/industry group until its 95%% interval on the win "
+                         "rate is within ± this many percentage points")
+    ap.add_argument("--max-runs", type=int, default=2_000_000, help="per-group cap for --ci")
+    ap.add_argument("--every-industry", action="store_true",
+                    help="play every industry even when they're interchangeable (see share_industries())")
+    args = ap.parse_args()
+    if args.tapes and _frozen(args.version):
+        ap.error("--tapes only covers the current rules, not --version")
+    if args.target and args.version != "all" and not _pivots(args.version):
+        ap.error("--target needs a --version that allows a pivot (v0.1–v0.5) or 'all'")
+    if args.ci is not None and args.version == "all":
+        ap.error("--ci runs one ruleset; pick a single --version")
+
+    if args.version == "all":
+        compare_versions(args)
+        return
+    if args.ci is not None:
+        sequential(args)
+        return
+    t0 = time.perf_counter()
+    sink = simulate_batch(args.runs, args.workers, seed=args.seed, age=args.age, industry=args.industry,
+                          version=args.version, tapes=args.tapes, share=not args.every_industry,
+                          target=args.target)
+    dt = time.perf_counter() - t0
+    stats = sink.total()
+    shared = f", {sink.played:,} played" if sink.copies else ""
+    print(f"{stats.runs:,} runs ({args.age}/{args.industry}{shared}) in {dt:.2f}s — {sink.played / dt:,.0f} runs/s")
+    print(f"Win rate: {stats.win_rate:.1%}")
+    for path, count in stats.paths.most_common():
+        print(f"  {path:<30} {count / stats.runs:6.1%}")
+    print(f"Median run ends in week {stats.median_week()}")
+    print()
+    print(sink.report())
+
+
+def sequential(args):
+    """One row per group: runs it took to reach ±--ci, and the win rate it settled on."""
+    target = args.ci / 100
+    t0 = time.perf_counter()
+    sinks = simulate_until(target, args.workers, seed=args.seed, age=args.age, industry=args.industry,
+                           version=args.version, tapes=args.tapes, max_runs=args.max_runs,
+                           share=not args.every_industry, target=args.target)
+    dt = time.perf_counter() - t0
+    total = sum(sink.played for sink in sinks.values())
+    print(f"Target ±{args.ci:g} points (95%): {total:,} runs played in {dt:.2f}s — {total / dt:,.0f} runs/s")
+    print(f"{'Group':<18} {'Runs':>10} {'Win':>6} {'±95%':>6}")
+    for (age, industry), sink in sinks.items():
+        stats = sink.total()
+        note = "" if margin(stats) <= target else "  (hit --max-runs)"
+        if sink.copies:
+            note += f"  (same runs as {sink.copies[age, industry][1]})"
+        print(f"{age + '/' + industry:<18} {stats.runs:>10,} {stats.win_rate:6.1%} {margin(stats):6.2%}{note}")
+
+
+def compare_versions(args):
+    """One row per released version on the same seeds: win rate, top win path, median length.
+
+    With --target, the versions that allow a pivot apply to that industry and
+    the rest stay in --industry (marked "no pivot").
+    """
+    goal = f" → {args.target}" if args.target else ""
+    print(f"{args.runs:,} runs per version ({args.age}/{args.industry}{goal}, random play)")
+    print(f"{'Version':<9} {'Win':>6} {'Loss':>6}  {'Median wk':>9}  Win paths")
+    for version in rulesets.NAMES:
+        pivots = _pivots(version)
+        stats = simulate_batch(args.runs, args.workers, seed=args.seed, age=args.age, industry=args.industry,
+                               version=version, target=args.target if pivots else None).total()
+        paths = ", ".join(f"{p} {n / stats.runs:.1%}" for p, n in stats.paths.most_common()
+                          if p not in ("Loss", "Unfinished"))
+        note = "  (no pivot)" if args.target and not pivots else ""
+        print(f"{version:<9} {stats.win_rate:6.1%} {stats.paths['Loss'] / stats.runs:6.1%}  "
+              f"{stats.median_week():>9}  {paths}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — benchmark suite (v0.5.1e Gentle Mode rules)
+# Times every action, the weekend wrap and the victory check per call, plus
+# whole headless runs per second under random play. Results go to a JSON
+# baseline; `compare` re-measures against one and exits non-zero when run
+# throughput has regressed past the threshold.
+#
+#   python job_search_bench.py run --out bench.json
+#   python job_search_bench.py compare bench.json --threshold 10
+
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+CALLS = 20_000   # calls per repeat for the per-call benchmarks
+RUNS = 2_000     # headless runs per repeat for the throughput benchmark
+REPEATS = 5      # best of N, to shave off scheduler noise
+
+# Per-call benchmarks, each on a fresh mid-run player so the main path runs
+# (enough energy and money that nothing bails out early).
+CALL_BENCHES = {
+    "apply_flow": game.apply_flow,
+    "act_train": game.act_train,
+    "act_network": game.act_network,
+    "act_rest": game.act_rest,
+    "act_selfcare": game.act_selfcare,
+    "act_interview_prep": game.act_interview_prep,
+    "weekend_wrap": game.weekend_wrap,
+    "check_victory_conditions": lambda p, rng: game.check_victory_conditions(p),
+}
+
+
+def bench_player() -> game.Player:
+    p = game.new_player("Mid", "Tech", game.RunRNG(0))
+    p.week, p.day = 3, 3
+    p.energy, p.money, p.confidence = 8, 900, 12
+    return p
+
+
+def time_calls(fn: Callable, calls: int = CALLS, repeats: int = REPEATS) -> float:
+    """Best-of-``repeats`` nanoseconds per call; player setup is not timed."""
+    best = float("inf")
+    for rep in range(repeats):
+        players = [bench_player() for _ in range(calls)]
+        rng = game.RunRNG(rep)
+        t0 = time.perf_counter_ns()
+        for p in players:
+            fn(p, rng)
+        best = min(best, (time.perf_counter_ns() - t0) / calls)
+    return best
+
+
+def time_runs(runs: int = RUNS, repeats: int = REPEATS) -> float:
+    """Best-of-``repeats`` headless random-play runs per second (seeds 0..runs-1)."""
+    best = 0.0
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for seed in range(runs):
+            game.simulate_run(seed=seed)
+        best = max(best, runs / (time.perf_counter() - t0))
+    return best
+
+
+def run_suite(calls: int = CALLS, runs: int = RUNS, repeats: int = REPEATS) -> Dict:
+    game.odds_table()  # build outside the timing
+    results = {}
+    for name, fn in CALL_BENCHES.items():
+        results[name] = {"unit": "ns/call", "value": round(time_calls(fn, calls, repeats), 1)}
+    results["simulate_run"] = {"unit": "runs/s", "value": round(time_runs(runs, repeats), 1)}
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "params": {"calls": calls, "runs": runs, "repeats": repeats},
+        "results": results,
+    }
+
+
+def compare(base: Dict, new: Dict, threshold: float) -> bool:
+    """Print old vs new per benchmark; False if run throughput dropped by more than ``threshold`` %.
+
+    Per-call latencies are flagged but never fail the check: they are too
+    noisy on their own to gate on.
+    """
+    ok = True
+    print(f"{'benchmark':<26} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, cur in new["results"].items():
+        old = base["results"].get(name)
+        if old is None:
+            print(f"{name:<26} {'—':>12} {cur['value']:>12,.1f} {'new':>8}")
+            continue
+        change = (cur["value"] - old["value"]) / old["value"] * 100
+        # Positive "worse" means slower: more ns per call, or fewer runs per second
+        worse = change if cur["unit"] == "ns/call" else -change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION" if cur["unit"] == "runs/s" else "  slower"
+            ok = ok and cur["unit"] != "runs/s"
+        print(f"{name:<26} {old['value']:>12,.1f} {cur['value']:>12,.1f} {change:>+7.1f}%{flag}")
+    return ok
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark the v0.5.1e rules engine.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_run = sub.add_parser("run", help="measure and write a JSON baseline")
+    p_run.add_argument("--out", default="bench.json")
+    p_cmp = sub.add_parser("compare", help="measure and diff against a baseline")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("--threshold", type=float, default=10.0,
+                       help="allowed drop in runs/s, in percent (default 10)")
+    p_cmp.add_argument("--save", metavar="FILE", help="also write the new measurements")
+    for p in (p_run, p_cmp):
+        p.add_argument("--calls", type=int, default=CALLS)
+        p.add_argument("--runs", type=int, default=RUNS)
+        p.add_argument("--repeats", type=int, default=REPEATS)
+    args = ap.parse_args()
+
+    result = run_suite(args.calls, args.runs, args.repeats)
+    if args.cmd == "run":
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        for name, r in result["results"].items():
+            print(f"{name:<26} {r['value']:>12,.1f} {r['unit']}")
+        print(f"Baseline written to {args.out}")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        base = json.load(f)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    if not compare(base, result, args.threshold):
+        print(f"FAIL: run throughput regressed by more than {args.threshold:g}%")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — batched training environment (v0.5.1e Gentle Mode rules)
+# A Gym-style vector environment over job_search_vec.py's lockstep rules: one
+# reset() or step() call moves every environment at once, with no Python loop
+# over them. Each environment draws from its own counter-based stream (a
+# SplitMix64 per lane), so environment i with seed s plays out the same for
+# the same actions whatever else is in the batch.
+#
+#   env = VecEnv(age="Mid")
+#   obs = env.reset(4096, seeds=range(4096))
+#   obs, reward, done, info = env.step(actions)
+#
+#   python job_search_env.py --envs 4096 --steps 200
+
+import argparse
+import time
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+import job_search_vec as vec
+
+# Observation arrays returned by reset() and step(), one row per environment
+OBS_FIELDS = ("energy", "money", "confidence", "resilience", "contracts", "skills", "day", "week",
+              "warm_intro", "interview_prep_active", "mentor_boost", "consecutive_rejections",
+              "unemployed_weeks_paid", "age", "industry")
+
+_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(z: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer, elementwise (same constants as job_search_batch.derive_seed)."""
+    z = (z ^ (z >> np.uint64(30))) * _M1
+    z = (z ^ (z >> np.uint64(27))) * _M2
+    return z ^ (z >> np.uint64(31))
+
+
+class SeedDice:
+    """Stands in for job_search_vec.GenDice with one SplitMix64 stream per lane.
+
+    Lane ``s.run[i]`` advances only when it draws, so its numbers depend on its
+    own seed and actions alone.
+    """
+    def __init__(self, seeds: np.ndarray):
+        self.state = np.asarray(seeds, dtype=np.uint64).copy()
+
+    def uniform(self, lanes: np.ndarray) -> np.ndarray:
+        self.state[lanes] += _GAMMA
+        return (_mix(self.state[lanes]) >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+    def random(self, name: str, s: vec.VecState, idx: np.ndarray, slot: int = 0) -> np.ndarray:
+        return self.uniform(s.run[idx])
+
+    def integers(self, name: str, s: vec.VecState, idx: np.ndarray, lo: int, hi: int, slot: int = 0,
+                 dtype=np.int64) -> np.ndarray:
+        return (lo + np.floor(self.random(name, s, idx, slot) * (hi - lo))).astype(dtype)
+
+
+class VecEnv:
+    """Many headless runs stepped together through job_search_vec's rules.
+
+    ``age``/``industry`` are one name for every environment or a per-environment
+    sequence, as in simulate_vec(). ``step(actions)`` takes one code per
+    environment (an index into game.ACTIONS). The reward is 1.0 on the step a
+    run is won and 0.0 otherwise. A run is done once it is won or lost, or
+    truncated after ``max_weeks``. Done environments sit out later steps
+    until reset, or restart right away with the next seed when ``autoreset``
+    is on; their last observation is then in ``info["final_obs"]``.
+    """
+    def __init__(self, age: Union[str, Iterable] = "Young", industry: Union[str, Iterable] = "Tech", *,
+                 max_weeks: int = game.MAX_SIM_WEEKS, autoreset: bool = False):
+        self.age, self.industry = age, industry
+        self.max_weeks = max_weeks
+        self.autoreset = autoreset
+        self.state: Optional[vec.VecState] = None
+
+    def __len__(self):
+        return len(self.state) if self.state is not None else 0
+
+    def reset(self, n: int, seeds: Optional[Iterable[int]] = None) -> Dict[str, np.ndarray]:
+        """Start ``n`` fresh runs; ``seeds`` (one per environment) default to 0..n-1."""
+        seeds = np.arange(n, dtype=np.uint64) if seeds is None else np.asarray(list(seeds), dtype=np.uint64)
+        if len(seeds) != n:
+            raise ValueError(f"got {len(seeds)} seeds for {n} environments")
+        self.tables = vec.AgeTables()  # picks up the live tunables
+        self.ages = vec._codes(self.age, vec.AGES, n)
+        self.industries = vec._codes(self.industry, vec.INDUSTRY_NAMES, n)
+        self.seeds = seeds
+        self.dice = SeedDice(seeds)
+        self.state = vec.VecState.new(self.ages, self.industries, self.dice)
+        self.done = np.zeros(n, bool)
+        return self.observe()
+
+    def _restart(self, lanes: np.ndarray, seeds: np.ndarray):
+        """Put fresh runs with ``seeds`` into ``lanes``, exactly as reset() would start them."""
+        dice = SeedDice(seeds)
+        fresh = vec.VecState.new(self.ages[lanes], self.industries[lanes], dice)
+        s = self.state
+        for name in vec.VecState.FIELDS:
+            if name != "run":
+                getattr(s, name)[lanes] = getattr(fresh, name)
+        self.dice.state[lanes] = dice.state
+        self.done[lanes] = False
+
+    def observe(self) -> Dict[str, np.ndarray]:
+        """Copies of the observation arrays; changing them doesn't touch the runs."""
+        return {name: getattr(self.state, name).copy() for name in OBS_FIELDS}
+
+    def step(self, actions):
+        """Play one weekday in every environment that's still going.
+
+        Returns ``(obs, reward, done, info)``. ``info["outcome"]`` holds
+        job_search_vec outcome codes, and ``info["truncated"]`` marks runs cut
+        off at ``max_weeks``.
+        """
+        s = self.state
+        actions = np.asarray(actions)
+        if actions.shape != (len(s),):
+            raise ValueError(f"expected {len(s)} actions, got shape {actions.shape}")
+        live = ~self.done
+        bad = live & ((actions < 0) | (actions >= len(game.ACTIONS)))
+        if bad.any():
+            raise ValueError(f"action codes must be 0–{len(game.ACTIONS) - 1}; got {actions[bad][0]}")
+        vec.take_turn(s, np.where(live, actions, -1).astype(np.int8), self.dice, self.tables)
+
+        ended = live & (s.outcome != vec.RUNNING)
+        truncated = live & ~ended & (s.week > self.max_weeks)
+        done = ended | truncated
+        reward = (ended & (s.outcome != vec.LOSS)).astype(np.float32)
+        info = {"outcome": s.outcome.copy(), "truncated": truncated}
+        self.done |= done
+        dones = self.done.copy()
+        if self.autoreset and done.any():
+            info["final_obs"] = self.observe()
+            lanes = np.flatnonzero(done)
+            # Next episode's seed: the lane's current seed, scrambled
+            self.seeds[lanes] = _mix(self.seeds[lanes] + _GAMMA)
+            self._restart(lanes, self.seeds[lanes])
+        return self.observe(), reward, dones, info
+
+
+def obs_matrix(obs: Dict[str, np.ndarray]) -> np.ndarray:
+    """Observation arrays as one float32 matrix (environments × features), skills spread over columns."""
+    cols = [obs[name].reshape(len(obs["energy"]), -1).astype(np.float32) for name in OBS_FIELDS]
+    return np.concatenate(cols, axis=1)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Step a batch of random-play environments and time it.")
+    ap.add_argument("--envs", type=int, default=4096)
+    ap.add_argument("--steps", type=int, default=200)
+    ap.add_argument("--age", choices=vec.AGES, default="Young")
+    ap.add_argument("--industry", choices=vec.INDUSTRY_NAMES, default="Tech")
+    args = ap.parse_args()
+
+    env = VecEnv(args.age, args.industry, autoreset=True)
+    env.reset(args.envs)
+    rng = np.random.default_rng(0)
+    wins = episodes = 0
+    t0 = time.perf_counter()
+    for _ in range(args.steps):
+        _, reward, done, _ = env.step(rng.integers(0, len(game.ACTIONS), args.envs))
+        wins += int(reward.sum())
+        episodes += int(done.sum())
+    dt = time.perf_counter() - t0
+    print(f"{args.envs:,} envs × {args.steps} steps in {dt:.2f}s — {args.envs * args.steps / dt:,.0f} steps/s")
+    if episodes:
+        print(f"{episodes:,} episodes finished, {wins / episodes:.1%} won")
+
+
+if __name__ == "__main__":
+    main()
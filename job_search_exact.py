@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — exact policy evaluation (v0.5.1e Gentle Mode rules)
+# Pushes the whole probability distribution over run states forward one
+# weekday at a time instead of sampling runs, so a fixed policy's win, loss and
+# per-path probabilities and its expected run length come out exact: no
+# sampling noise, and by default no money bucketing as in job_search_solver.py.
+#
+# A state is energy, the rejection/streak counters (saturated where the odds
+# stop changing), contracts and the warm-intro / prep / mentor flags. Each
+# holds a dense block of probability over (confidence, money) to the dollar,
+# so a contract's randint(200, 500) is one running-sum pass over the block
+# rather than 301 branches. Rules mirror the game script as block operations,
+# in take_turn()'s order. States or block edges holding less than --eps are
+# dropped and their mass reported, which bounds every figure.
+#
+# What's tractable: a scripted policy keeps 100-150 states (up to ~4M cells)
+# and solves the full 26 weeks exactly in 3-8s per age (apply-or-rest: Young
+# 8s, Mid 3s, Late 3s). Random play takes every action from every state, so
+# its money spreads across thousands of dollars in ~2,000 states at once: to
+# the dollar it only fits --week-cap 2 (~5s). --money-step N buckets money as
+# the solver does and runs the full 26 weeks in about a minute, but each split
+# between buckets adds spread, so broke runs come out too often: random play's
+# win rate is 0.2 (Young) to 0.5 (Late) points low at $50, and Young's is
+# ~0.6 low at $100. Sampling with job_search_vec.py is the better tool for
+# random play. Blocks past --max-cells stop the run with a MemoryError rather
+# than exhausting memory.
+#
+#   python job_search_exact.py --age all --policy apply-or-rest --check 1000000
+#   python job_search_exact.py --policy random --week-cap 2
+
+import argparse
+import functools
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+import job_search_solver as solver
+import job_search_vec as vec
+
+EPS = 1e-12
+WEEK_CAP = 26
+MAX_CELLS = 32_000_000  # live (confidence, money) cells over all states, about 256 MB of float64
+
+APPLY, NETWORK, TRAIN, REST, SELFCARE, PREP = range(len(game.ACTIONS))
+
+# (weight, lowest confidence, lowest money, mass[confidence, money])
+Part = Tuple[float, int, int, np.ndarray]
+
+
+# -----------------------------
+# Blocks
+# -----------------------------
+
+def merge(parts: List[Part], step: int = 1) -> Tuple[int, int, np.ndarray]:
+    """Sum weighted blocks that start at different (confidence, money) corners.
+
+    Money columns are ``step`` dollars apart and every corner sits on that grid.
+    """
+    if len(parts) == 1:
+        w, c0, m0, a = parts[0]
+        return c0, m0, a * w if w != 1.0 else a
+    c0 = min(p[1] for p in parts)
+    m0 = min(p[2] for p in parts)
+    out = np.zeros((max(p[1] + p[3].shape[0] for p in parts) - c0,
+                    max((p[2] - m0) // step + p[3].shape[1] for p in parts)))
+    for w, c, m, a in parts:
+        j = (m - m0) // step
+        view = out[c - c0:c - c0 + a.shape[0], j:j + a.shape[1]]
+        if w == 1.0:
+            view += a
+        else:
+            view += w * a
+    return c0, m0, out
+
+
+def clamp_conf(c0: int, a: np.ndarray, lo: int, hi: int) -> Tuple[int, np.ndarray]:
+    """Pile confidence rows outside [lo, hi] onto the nearest bound."""
+    top = c0 + a.shape[0] - 1
+    if c0 >= lo and top <= hi:
+        return c0, a
+    if top <= lo:
+        return lo, a.sum(axis=0, keepdims=True)
+    if c0 >= hi:
+        return hi, a.sum(axis=0, keepdims=True)
+    out = a[max(0, lo - c0):a.shape[0] - max(0, top - hi)].copy()
+    if c0 < lo:
+        out[0] += a[:lo - c0].sum(axis=0)
+    if top > hi:
+        out[-1] += a[a.shape[0] - (top - hi):].sum(axis=0)
+    return max(c0, lo), out
+
+
+def spread_money(a: np.ndarray, n: int) -> np.ndarray:
+    """Money plus a uniform integer in [0, n): a box filter along the money axis."""
+    run = np.cumsum(np.pad(a, ((0, 0), (0, n - 1))), axis=1)
+    run[:, n:] = run[:, n:] - run[:, :-n]
+    run /= n
+    # Running-sum differences can round a hair below zero
+    return np.maximum(run, 0.0, out=run)
+
+
+@functools.lru_cache(maxsize=None)
+def money_kernel(lo: int, n: int, step: int) -> Tuple[int, np.ndarray]:
+    """(first bucket offset, probabilities) for money += lo + randint(0, n - 1) on a ``step``-dollar grid.
+
+    Amounts between buckets are split between the two neighbours in proportion
+    to distance, as in job_search_solver.py, so expected money stays exact.
+    The probabilities come reversed, ready to slide along the money axis.
+    """
+    weights: Dict[int, float] = {}
+    for x in range(lo, lo + n):
+        q, r = divmod(x, step)
+        weights[q] = weights.get(q, 0.0) + (1 - r / step) / n
+        if r:
+            weights[q + 1] = weights.get(q + 1, 0.0) + r / step / n
+    first = min(weights)
+    return first, np.array([weights.get(q, 0.0) for q in range(max(weights), first - 1, -1)])
+
+
+def shift_money(m0: int, a: np.ndarray, lo: int, n: int, step: int) -> Tuple[int, np.ndarray]:
+    """A block after money += lo + randint(0, n - 1): its new money corner and mass."""
+    if step == 1:
+        return m0 + lo, spread_money(a, n) if n > 1 else a
+    first, taps = money_kernel(lo, n, step)
+    if len(taps) == 1:
+        return m0 + first * step, a
+    pad = len(taps) - 1
+    padded = np.pad(a, ((0, 0), (pad, pad)))
+    return m0 + first * step, sliding_window_view(padded, len(taps), axis=1) @ taps
+
+
+class StateView:
+    """What a policy sees of one state: job_search_vec.VecState's fields, broadcast.
+
+    ``confidence`` is a column and ``money`` a row spanning the state's block
+    (one entry per money bucket); everything else is a scalar. A vec policy
+    that only combines fields elementwise (np.where, comparisons, arithmetic)
+    runs on it unchanged and returns one action code per (confidence, money)
+    cell.
+    """
+
+    def __init__(self, key: tuple, c0: int, m0: int, shape: Tuple[int, int], age: int, industry: int,
+                 week: int, day: int, step: int = 1):
+        self.energy, k, s, self.contracts, warm, prep, mentor = key
+        self.confidence = np.arange(c0, c0 + shape[0]).reshape(-1, 1)
+        self.money = np.arange(m0, m0 + shape[1] * step, step).reshape(1, -1)
+        self.warm_intro, self.interview_prep_active, self.mentor_boost = bool(warm), bool(prep), bool(mentor)
+        # Counters past their caps act the same and read as the cap
+        self.consecutive_rejections = s
+        self.resilience = k * game.RESILIENCE_GAIN_ON_REJECT
+        self.age, self.industry = age, industry
+        self.week, self.day = week, day
+        self.turns = (week - 1) * 5 + day - 1
+        self.unemployed_weeks_paid = min(week - 1, game.UNEMPLOY_WEEKS_MAX)
+        self.outcome = vec.RUNNING
+
+
+# -----------------------------
+# Policies
+# -----------------------------
+
+# Both leave at least 1 energy: an action that spends down to 0 ends the run
+# (as job_search_tournament's bots avoid too)
+
+def apply_or_rest(s, dice) -> np.ndarray:
+    """Apply whenever it leaves some energy, otherwise rest."""
+    return np.where(s.energy > game.APPLY_COST_ENERGY, APPLY, REST).astype(np.int8)
+
+
+def prep_then_apply(s, dice) -> np.ndarray:
+    """Prep before each apply while it leaves $200 in the bank; rest when low on energy."""
+    prep = (~np.asarray(s.interview_prep_active) & (s.money >= game.INTERVIEW_PREP_COST_MONEY + 200)
+            & (s.energy > game.INTERVIEW_PREP_COST_ENERGY + game.APPLY_COST_ENERGY))
+    act = np.where(prep, PREP, APPLY)
+    return np.where(s.energy <= game.APPLY_COST_ENERGY, REST, act).astype(np.int8)
+
+
+# None is uniform random play, evaluated without calling anything
+POLICIES = {"random": None, "apply-or-rest": apply_or_rest, "prep-then-apply": prep_then_apply}
+
+
+# -----------------------------
+# Evaluation
+# -----------------------------
+
+@dataclass
+class Evaluation:
+    age: str
+    industry: str
+    policy: str
+    week_cap: int
+    eps: float
+    money_step: int
+    paths: Dict[str, float]  # RunResult.path label → probability
+    pruned: float            # mass dropped below eps; with money_step 1, every probability is exact to within this
+    expected_turns: float
+    expected_week: float
+    peak_states: int
+    peak_cells: int
+    seconds: float
+
+    @property
+    def win_prob(self) -> float:
+        return sum(p for path, p in self.paths.items() if path not in ("Loss", "Unfinished"))
+
+    @property
+    def loss_prob(self) -> float:
+        return self.paths.get("Loss", 0.0)
+
+
+class Evaluator:
+    """Exact forward evaluation of one policy for one age bracket and industry.
+
+    ``policy(state, dice)`` is a job_search_vec policy, called with a StateView
+    and dice=None, so it must be deterministic; None is uniform random play.
+    ``money_step`` > 1 buckets money (approximate; see the module header), and
+    a step whose live blocks exceed ``max_cells`` raises MemoryError.
+    Skills are not tracked, so like the solver this refuses rules where
+    Consultant victory is reachable.
+    """
+
+    def __init__(self, age: str = "Young", industry: str = "Tech", policy=None, *, week_cap: int = WEEK_CAP,
+                 eps: float = EPS, money_step: int = 1, max_cells: int = MAX_CELLS):
+        tags = {len(ind["skills"]) for ind in game.INDUSTRIES.values()}
+        if max(tags) >= solver.CONSULTANT_TAGS:
+            raise ValueError("Consultant victory is reachable; exact evaluation does not track skill levels")
+        self.age, self.industry = age, industry
+        self.policy = policy
+        self.week_cap, self.eps = week_cap, eps
+        self.step, self.max_cells = money_step, max_cells
+
+        bal = game.AGE_BALANCE[age]
+        self.rest_gain = game.REST_GAIN_ENERGY + bal["rest_bonus"]
+        self.bills = int(game.BILLS_BY_AGE[age] * bal["rent_mult"])
+        self.rent = int(game.RENT_BY_AGE[age] * bal["rent_mult"])
+        self.benefit = int(game.UNEMPLOY_BENEFIT * bal["unemp_mult"])
+        # Rejections past k_cap all cost the same confidence, as in the solver's Grid
+        self.k_cap = 0
+        while self.k_cap < 50 and solver.rejection_loss(self.k_cap) != solver.rejection_loss(self.k_cap + 1):
+            self.k_cap += 1
+        self._odds()
+
+    def _odds(self):
+        """Apply outcome odds per (warm, prep, mentor, streak assist), as columns over confidence."""
+        table = game.odds_table()
+        odds = np.array(table.entries).reshape(table.shape + (3,))
+        match = len(game.INDUSTRIES[self.industry]["skills"])
+        self.conf_max = table.conf_max
+        self.apply_odds = {}
+        for warm in (0, 1):
+            for prep in (0, 1):
+                for mentor in (0, 1):
+                    for pity in (0, 1):
+                        callback, offer, dream = np.moveaxis(odds[:, match, warm, prep, mentor, pity], -1, 0)
+                        contract = np.minimum(dream + offer, 1.0) - dream
+                        reject = 1.0 - dream - contract
+                        # Averaged over the recruiter's mood
+                        self.apply_odds[warm, prep, mentor, pity] = tuple(
+                            p.mean(axis=-1) for p in (callback * dream, callback * contract,
+                                                      callback * reject, 1 - callback))
+
+    def start(self) -> Tuple[tuple, Tuple[int, int, np.ndarray]]:
+        # Which tags Mid/Late raise doesn't matter: skills never change an outcome here
+        p = game.new_player(self.age, self.industry, game.RunRNG(0))
+        key = (p.energy, 0, 0, p.contracts, 0, 0, 0)
+        return key, (p.confidence,) + shift_money(0, np.ones((1, 1)), p.money, 1, self.step)
+
+    # One weekday, as take_turn(): the action, then the loss and victory checks
+
+    def settle(self, key: tuple, c0: int, m0: int, a: np.ndarray, w: float = 1.0):
+        """check_loss() then check_victory_conditions() on a block that just acted."""
+        if key[0] <= 0:
+            self.end("Loss", w * a.sum())
+            return
+        if c0 <= 0:
+            cut = min(1 - c0, a.shape[0])
+            self.end("Loss", w * a[:cut].sum())
+            c0, a = c0 + cut, a[cut:]
+        if m0 <= 0:
+            cut = min(-m0 // self.step + 1, a.shape[1])
+            self.end("Loss", w * a[:, :cut].sum())
+            m0, a = m0 + cut * self.step, a[:, cut:]
+        if not a.size:
+            return
+        if key[3] >= game.PORTFOLIO_TARGET:
+            self.end("Sustainable Freelance Career", w * a.sum())
+            return
+        self.nxt.setdefault(key, []).append((w, c0, m0, a))
+
+    def end(self, path: str, mass: float):
+        self.paths[path] = self.paths.get(path, 0.0) + mass
+        self.turns_total += mass * self.turns
+        self.week_total += mass * self.week
+
+    def act(self, code: int, key: tuple, c0: int, m0: int, a: np.ndarray, w: float):
+        e, k, s, n, warm, prep, mentor = key
+        if code == APPLY:
+            if e < game.APPLY_COST_ENERGY:
+                return self.settle(key, c0, m0, a, w)
+            e -= game.APPLY_COST_ENERGY
+            rows = np.minimum(np.arange(c0, c0 + a.shape[0]), self.conf_max)
+            dream, contract, reject_cb, no_cb = (p[rows].reshape(-1, 1) for p in
+                                                 self.apply_odds[warm, prep, mentor, int(s >= solver.PITY_STREAK)])
+            # A Dream Job ends the run before the loss check can overrule it
+            self.end("Landed Dream Job", w * float((a * dream).sum()))
+            lo, hi = 200, 500
+            paid_m0, paid = shift_money(m0, a * contract, lo, hi - lo + 1, self.step)
+            self.settle((e, k, 0, n + 1, 0, 0, 0), c0 + 2, paid_m0, paid, w)
+            loss = solver.rejection_loss(k)
+            k1 = min(k + 1, self.k_cap)
+            for odds, streak in ((reject_cb, 1), (no_cb, min(s + 1, solver.PITY_STREAK))):
+                hit_c0, hit = clamp_conf(c0 - loss, a * odds, game.CONFIDENCE_FLOOR, math.inf)
+                self.settle((e, k1, streak, n, 0, 0, 0), hit_c0, m0, hit, w * 0.75)
+                self.settle((e, k1, streak, n, 0, 0, 1), hit_c0, m0, hit, w * 0.25)
+        elif code in (NETWORK, TRAIN):
+            cost = game.NETWORK_COST_ENERGY if code == NETWORK else game.TRAIN_COST_ENERGY
+            if e < cost:
+                return self.settle(key, c0, m0, a, w)
+            after = (e - cost, k, s, n, warm, prep, mentor)
+            if code == NETWORK and not warm:
+                chance = game.NETWORK_WARM_INTRO_CHANCE
+                self.settle(after[:4] + (1,) + after[5:], c0 + 1, m0, a, w * chance)
+                w *= 1 - chance
+            self.settle(after, c0 + 1, m0, a, w)
+        elif code == REST:
+            c1, rested = clamp_conf(c0 + 1, a, 0, 99)
+            self.settle((min(12, e + self.rest_gain),) + key[1:], c1, m0, rested, w)
+        else:
+            cost = game.SELF_CARE_COST_MONEY if code == SELFCARE else game.INTERVIEW_PREP_COST_MONEY
+            if code == PREP and e < game.INTERVIEW_PREP_COST_ENERGY:
+                return self.settle(key, c0, m0, a, w)
+            # Buckets below the cost can't pay it
+            cut = min(max(0, -(-(cost - m0) // self.step)), a.shape[1])
+            if cut:
+                self.settle(key, c0, m0, a[:, :cut], w)
+            if cut == a.shape[1]:
+                return
+            paid_m0, paid = shift_money(m0 + cut * self.step, a[:, cut:], -cost, 1, self.step)
+            if code == SELFCARE:
+                after = (e + game.SELF_CARE_GAIN_ENERGY,) + key[1:]
+                self.settle(after, c0 + game.SELF_CARE_GAIN_CONF, paid_m0, paid, w)
+            else:
+                after = (e - game.INTERVIEW_PREP_COST_ENERGY, k, s, n, warm, 1, mentor)
+                self.settle(after, c0, paid_m0, paid, w)
+
+    def day(self, states: Dict[tuple, tuple], week: int, day: int):
+        age, industry = vec.AGES.index(self.age), vec.INDUSTRY_NAMES.index(self.industry)
+        for key, (c0, m0, a) in states.items():
+            if self.policy is None:
+                for code in range(len(game.ACTIONS)):
+                    self.act(code, key, c0, m0, a, 1 / len(game.ACTIONS))
+                continue
+            view = StateView(key, c0, m0, a.shape, age, industry, week, day, self.step)
+            codes = np.broadcast_to(np.asarray(self.policy(view, None)), a.shape)
+            for code in np.unique(codes):
+                if not 0 <= code < len(game.ACTIONS):
+                    raise ValueError(f"policy picked action code {code}; exact evaluation needs one every day")
+                self.act(int(code), key, c0, m0, np.where(codes == code, a, 0.0), 1.0)
+
+    def wrap(self, key: tuple, c0: int, m0: int, a: np.ndarray, week: int):
+        """weekend_wrap(): weekly costs, then one random event."""
+        shift = -self.bills
+        if week % game.RENT_CYCLE_WEEKS == 0:
+            shift -= self.rent
+        if week - 1 < game.UNEMPLOY_WEEKS_MAX:
+            shift += self.benefit
+        e = key[0]
+        add = self.nxt.setdefault
+
+        lo, hi = game.SURPRISE_BILL_RANGE
+        add(key, []).append((0.15, c0) + shift_money(m0, a, shift - hi, hi - lo + 1, self.step))
+
+        lo, hi = game.TEMP_GIG_MONEY_REWARD
+        gig_m0, gig = shift_money(m0, a, shift + lo, hi - lo + 1, self.step)
+        tired = (max(0, e - game.TEMP_GIG_ENERGY_COST),) + key[1:]
+        add(tired, []).append((0.35 * 0.75, c0, gig_m0, gig))
+        add(tired, []).append((0.35 * 0.25, c0 + 1, gig_m0, gig))
+
+        lo, hi = game.SMALL_GOOD_NEWS_MONEY
+        news_m0, news = shift_money(m0, a, shift + lo, hi - lo + 1, self.step)
+        c_lo, c_hi = game.SMALL_GOOD_NEWS_CONF
+        for dc in range(c_lo, c_hi + 1):
+            add(key, []).append((0.50 / (c_hi - c_lo + 1), c0 + dc, news_m0, news))
+
+    def collect(self) -> Dict[tuple, tuple]:
+        """Merge this step's arrivals per state and drop what's below eps."""
+        out = {}
+        cells = 0
+        for key, parts in self.nxt.items():
+            kept = self.trim(*merge(parts, self.step))
+            if kept is not None:
+                out[key] = kept
+                cells += kept[2].size
+        self.nxt = {}
+        if cells > self.max_cells:
+            raise MemoryError(f"{cells:,} probability cells in week {self.week} is past max_cells "
+                              f"({self.max_cells:,}); raise money_step or eps, or lower week_cap")
+        self.peak_cells = max(self.peak_cells, cells)
+        return out
+
+    def trim(self, c0: int, m0: int, a: np.ndarray) -> Optional[Tuple[int, int, np.ndarray]]:
+        """Drop a state holding less than eps, or as many edge rows/columns of its block
+        from each side as hold less than eps together."""
+        total = a.sum()
+        if total < self.eps:
+            self.pruned += total
+            return None
+
+        def edges(sums: np.ndarray) -> Tuple[int, int]:
+            lo = int(np.searchsorted(np.cumsum(sums), self.eps))
+            hi = len(sums) - int(np.searchsorted(np.cumsum(sums[::-1]), self.eps))
+            return (lo, hi) if lo < hi else (0, len(sums))
+        r0, r1 = edges(a.sum(axis=1))
+        k0, k1 = edges(a.sum(axis=0))
+        if r0 or k0 or r1 < a.shape[0] or k1 < a.shape[1]:
+            kept = a[r0:r1, k0:k1]
+            self.pruned += total - kept.sum()
+            return c0 + r0, m0 + k0 * self.step, kept
+        return c0, m0, a
+
+    def run(self) -> Evaluation:
+        t0 = time.perf_counter()
+        self.paths: Dict[str, float] = {}
+        self.pruned = self.turns_total = self.week_total = 0.0
+        self.peak_cells = 0
+        self.nxt: Dict[tuple, List[Part]] = {}
+        key, block = self.start()
+        states = {key: block}
+        peak = 0
+        self.turns = 0
+        for week in range(1, self.week_cap + 1):
+            self.week = week
+            for day in range(1, 6):
+                peak = max(peak, len(states))
+                self.turns += 1
+                self.day(states, week, day)
+                states = self.collect()
+            for key, (c0, m0, a) in states.items():
+                self.wrap(key, c0, m0, a, week)
+            states = self.collect()
+
+        left = sum(a.sum() for _, _, a in states.values())
+        if left:
+            self.week = self.week_cap + 1
+            self.end("Unfinished", left)
+        mass = sum(self.paths.values())
+        name = next((n for n, p in POLICIES.items() if p is self.policy), getattr(self.policy, "__name__", "policy"))
+        return Evaluation(self.age, self.industry, name, self.week_cap, self.eps, self.step, self.paths,
+                          self.pruned, self.turns_total / mass, self.week_total / mass, peak, self.peak_cells,
+                          time.perf_counter() - t0)
+
+
+def evaluate(age: str = "Young", industry: str = "Tech", policy=None, *, week_cap: int = WEEK_CAP,
+             eps: float = EPS, money_step: int = 1, max_cells: int = MAX_CELLS) -> Evaluation:
+    """Outcome probabilities of ``policy`` (None: random play) from a fresh run; see Evaluator."""
+    return Evaluator(age, industry, policy, week_cap=week_cap, eps=eps, money_step=money_step,
+                     max_cells=max_cells).run()
+
+
+def check_sampled(ev: Evaluation, policy, runs: int, seed: int = 0) -> str:
+    """``policy`` (the one ``ev`` evaluated; None: random play) sampled with
+    job_search_vec.py, as a cross-check of ``ev``."""
+    t0 = time.perf_counter()
+    res = vec.simulate_vec(runs, seed, ev.age, ev.industry, policy, max_weeks=ev.week_cap)
+    dt = time.perf_counter() - t0
+    p = res.won.mean()
+    half = 1.96 * math.sqrt(p * (1 - p) / runs)
+    z = (p - ev.win_prob) / max(math.sqrt(ev.win_prob * (1 - ev.win_prob) / runs), 1e-300)
+    return (f"  sampled ({runs:,} runs, {dt:.1f}s): win {p:.4%} ± {half:.4%} (z = {z:+.2f}), "
+            f"mean length {res.turns.mean():.3f} turns")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Exact win/loss probabilities of a fixed policy by forward propagation.")
+    ap.add_argument("--age", choices=list(vec.AGES) + ["all"], default="Young")
+    ap.add_argument("--industry", choices=vec.INDUSTRY_NAMES, default="Tech")
+    ap.add_argument("--policy", choices=list(POLICIES), default="apply-or-rest",
+                    help="random play only fits small --week-cap or a coarse --money-step (see the header)")
+    ap.add_argument("--week-cap", type=int, default=WEEK_CAP, help="runs still going after this week count as Unfinished")
+    ap.add_argument("--eps", type=float, default=EPS, help="drop states and block edges holding less than this")
+    ap.add_argument("--money-step", type=int, default=1, metavar="DOLLARS",
+                    help="bucket money this coarsely (1: exact; larger is faster but biased)")
+    ap.add_argument("--max-cells", type=int, default=MAX_CELLS,
+                    help="stop with an error once the live blocks hold more cells than this")
+    ap.add_argument("--check", type=int, default=0, metavar="RUNS",
+                    help="also sample this many runs with job_search_vec.py to compare")
+    args = ap.parse_args()
+
+    ages = vec.AGES if args.age == "all" else [args.age]
+    for age in ages:
+        ev = evaluate(age, args.industry, POLICIES[args.policy], week_cap=args.week_cap, eps=args.eps,
+                      money_step=args.money_step, max_cells=args.max_cells)
+        buckets = f", ${ev.money_step} money buckets" if ev.money_step > 1 else ""
+        print(f"{age}/{args.industry}, {ev.policy} play, weeks 1–{ev.week_cap}{buckets}: win {ev.win_prob:.4%}, "
+              f"loss {ev.loss_prob:.4%} ({ev.seconds:.1f}s, up to {ev.peak_states:,} states / "
+              f"{ev.peak_cells:,} cells)")
+        for path, p in sorted(ev.paths.items(), key=lambda kv: -kv[1]):
+            print(f"  {path:<30} {p:9.4%}")
+        print(f"  Expected length {ev.expected_turns:.3f} turns (ends in week {ev.expected_week:.3f} on average); "
+              f"pruned mass {ev.pruned:.1e}")
+        if args.check:
+            print(check_sampled(ev, POLICIES[args.policy], args.check))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — immutable states and an MCTS bot (v0.5.1e Gentle Mode rules)
+# A run's state as a flat tuple of ints, and Model.step(state, action, rng)
+# returning the next one: no Player to copy, nothing mutated, and every state is
+# hashable. The Monte Carlo tree search bot keys its statistics by state in a
+# transposition table, so lines that reach the same state share them.
+#
+# Rules mirror take_turn() (the action, loss and victory checks, then the day
+# advance and weekend wrap) with the knobs read from the game script when a
+# Model is built. Draws come from one random.Random in whatever order is
+# cheapest, so a state's odds match the game but a seed doesn't replay a run.
+#
+#   python job_search_mcts.py --bench
+#   python job_search_mcts.py --runs 20 --iterations 2000 --age Mid
+
+import argparse
+import math
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+# State layout: a plain tuple, indexed by these
+(WEEK, DAY, ENERGY, MONEY, CONF, REJECTIONS, STREAK, CONTRACTS, WARM, PREP, MENTOR, STRONG, END) = range(13)
+
+# END codes; labels match RunResult.path
+RUNNING, DREAM, FREELANCE, CONSULTANT, LOSS = range(5)
+PATHS = ("Unfinished", "Landed Dream Job", "Sustainable Freelance Career", "Consultant Victory", "Loss")
+
+# apply_flow's streak-assist threshold and the Consultant gates are literals in
+# the game script; mirrored here as in job_search_solver.py.
+PITY_STREAK = 3
+CONSULTANT_CONF, CONSULTANT_MONEY, CONSULTANT_TAGS = 16, 1500, 4
+
+State = Tuple[int, ...]
+
+
+class Model:
+    """The rules for one age bracket and industry, as a pure transition function.
+
+    A state holds week, day, energy, money, confidence, the rejection count
+    (capped once resilience stops lowering the hit) and streak, contracts, the
+    warm-intro / prep / mentor flags, a bitmask of the industry's tags trained
+    to level 2, and the END code. Every tag starts at level 1, so the skill
+    match count never changes; other industries' tags are never trained.
+    """
+
+    def __init__(self, age: str = "Young", industry: str = "Tech"):
+        self.age, self.industry = age, industry
+        bal = game.AGE_BALANCE[age]
+        self.tags = game.INDUSTRY_TAGS[industry]
+        self.rest_gain = game.REST_GAIN_ENERGY + bal["rest_bonus"]
+        self.bills, self.rent, self.benefit = game.weekly_amounts(age, game.RENT_CYCLE_WEEKS, 0)
+
+        self.reject_loss = []
+        resilience = 0.0
+        while True:
+            loss = max(1, int(game.REJECTION_CONFIDENCE_LOSS - resilience))
+            if self.reject_loss and loss == self.reject_loss[-1]:
+                break
+            self.reject_loss.append(loss)
+            resilience += game.RESILIENCE_GAIN_ON_REJECT
+        self.k_cap = len(self.reject_loss) - 1
+
+        # Apply odds per (confidence, warm, prep, mentor, pity, emotion), flattened in that order
+        table = game.odds_table()
+        match = len(self.tags)
+        self.n_emotions = table.n_emotions
+        self.conf_max = table.conf_max
+        self.odds = [table.entries[table.index(c, match, w, p, m, s, e)]
+                     for c in range(table.conf_max + 1) for w in (0, 1) for p in (0, 1) for m in (0, 1)
+                     for s in (0, 1) for e in range(table.n_emotions)]
+
+    def start(self, rng: Optional[random.Random] = None) -> State:
+        """A fresh run, as new_player() rolls it."""
+        return self.from_player(game.new_player(self.age, self.industry, game.RunRNG(
+            (rng or random).randrange(2**32))))
+
+    def from_player(self, p) -> State:
+        """The state of a live Player (or a read-only PlayerView of one)."""
+        strong = sum(1 << i for i, tag in enumerate(self.tags) if p.skill(tag) >= 2)
+        k = min(round(p.resilience / game.RESILIENCE_GAIN_ON_REJECT), self.k_cap)
+        end = RUNNING
+        if p.win_reason:
+            end = PATHS.index(p.win_reason.split(":")[0])
+        elif p.loss_reason:
+            end = LOSS
+        return (p.week, p.day, p.energy, p.money, p.confidence, k, min(p.consecutive_rejections, PITY_STREAK),
+                p.contracts, int(p.warm_intro), int(p.interview_prep_active), int(p.mentor_boost), strong, end)
+
+    def step(self, state: State, action: int, rng: random.Random) -> State:
+        """take_turn() on ``state`` with action code ``action`` (an index into game.ACTIONS)."""
+        week, day, e, money, conf, k, streak, n, warm, prep, mentor, strong, _ = state
+        rnd = rng.random
+        if action == 0:
+            if e >= game.APPLY_COST_ENERGY:
+                e -= game.APPLY_COST_ENERGY
+                cell = ((((min(conf, self.conf_max) * 2 + warm) * 2 + prep) * 2 + mentor) * 2
+                        + (streak >= PITY_STREAK)) * self.n_emotions + int(rnd() * self.n_emotions)
+                callback, offer, dream = self.odds[cell]
+                warm = prep = mentor = 0
+                hit = True
+                if rnd() < callback:
+                    streak = 0
+                    r = rnd()
+                    if r < dream:
+                        return (week, day, e, money, conf, k, streak, n, 0, 0, 0, strong, DREAM)
+                    if r < dream + offer:
+                        n += 1
+                        money += 200 + int(rnd() * 301)
+                        conf += 2
+                        hit = False
+                if hit:
+                    conf = max(game.CONFIDENCE_FLOOR, conf - self.reject_loss[k])
+                    k = min(k + 1, self.k_cap)
+                    streak = min(streak + 1, PITY_STREAK)
+                    mentor = int(rnd() < 0.25)
+        elif action == 1:
+            if e >= game.NETWORK_COST_ENERGY:
+                e -= game.NETWORK_COST_ENERGY
+                conf += 1
+                if rnd() < game.NETWORK_WARM_INTRO_CHANCE:
+                    warm = 1
+        elif action == 2:
+            if e >= game.TRAIN_COST_ENERGY:
+                e -= game.TRAIN_COST_ENERGY
+                strong |= 1 << int(rnd() * len(self.tags))
+                conf += 1
+        elif action == 3:
+            e = min(12, e + self.rest_gain)
+            conf = min(99, max(0, conf + 1))
+        elif action == 4:
+            if money >= game.SELF_CARE_COST_MONEY:
+                money -= game.SELF_CARE_COST_MONEY
+                e += game.SELF_CARE_GAIN_ENERGY
+                conf += game.SELF_CARE_GAIN_CONF
+        elif money >= game.INTERVIEW_PREP_COST_MONEY and e >= game.INTERVIEW_PREP_COST_ENERGY:
+            money -= game.INTERVIEW_PREP_COST_MONEY
+            e -= game.INTERVIEW_PREP_COST_ENERGY
+            prep = 1
+        return self.close_day(week, day, e, money, conf, k, streak, n, warm, prep, mentor, strong, rnd)
+
+    def close_day(self, week, day, e, money, conf, k, streak, n, warm, prep, mentor, strong, rnd) -> State:
+        """The rest of take_turn() after the action: loss and victory checks, day advance, weekend wrap."""
+        end = RUNNING
+        if e <= 0 or money <= 0 or conf <= 0:
+            end = LOSS
+        elif n >= game.PORTFOLIO_TARGET:
+            end = FREELANCE
+        elif conf >= CONSULTANT_CONF and money >= CONSULTANT_MONEY and bin(strong).count("1") >= CONSULTANT_TAGS:
+            end = CONSULTANT
+        else:
+            day += 1
+            if day > 5:
+                # weekend_wrap(): weekly_costs(), then random_weekly_event()
+                money -= self.bills
+                if week % game.RENT_CYCLE_WEEKS == 0:
+                    money -= self.rent
+                if week - 1 < game.UNEMPLOY_WEEKS_MAX:
+                    money += self.benefit
+                roll = rnd()
+                if roll < 0.15:
+                    lo, hi = game.SURPRISE_BILL_RANGE
+                    money -= lo + int(rnd() * (hi - lo + 1))
+                elif roll < 0.50:
+                    lo, hi = game.TEMP_GIG_MONEY_REWARD
+                    money += lo + int(rnd() * (hi - lo + 1))
+                    e = max(0, e - game.TEMP_GIG_ENERGY_COST)
+                    if rnd() < 0.25:
+                        conf += 1
+                else:
+                    lo, hi = game.SMALL_GOOD_NEWS_MONEY
+                    money += lo + int(rnd() * (hi - lo + 1))
+                    lo, hi = game.SMALL_GOOD_NEWS_CONF
+                    conf += lo + int(rnd() * (hi - lo + 1))
+                week += 1
+                day = 1
+        return (week, day, e, money, conf, k, streak, n, warm, prep, mentor, strong, end)
+
+    def rollout(self, state: State, rng: random.Random, max_weeks: int = game.MAX_SIM_WEEKS) -> bool:
+        """Random play from ``state`` to the end; True for a win."""
+        step, pick, n = self.step, rng.random, len(game.ACTIONS)
+        while state[END] == RUNNING and state[WEEK] <= max_weeks:
+            state = step(state, int(pick() * n), rng)
+        return RUNNING < state[END] < LOSS
+
+
+class MCTSBot:
+    """UCT search over Model states; usable as a simulate_run() or tournament policy.
+
+    Each decision runs ``iterations`` rounds of selection, expansion, a random
+    rollout and backup, or stops at ``budget`` seconds. Chance is sampled
+    through Model.step, so a child is whatever state the dice produce, and a
+    state reached along any line reuses the statistics already in ``table``.
+    The table lasts for the whole run and is cleared when a new one starts.
+    """
+    def __init__(self, iterations: int = 2000, *, budget: Optional[float] = None, explore: float = 0.7,
+                 seed: Optional[int] = None):
+        self.iterations = iterations
+        self.budget = budget
+        self.explore = explore
+        self.rng = random.Random(seed)
+        self.models: Dict[Tuple[str, str], Model] = {}
+        self.table: Dict[State, List] = {}  # state → [visits, visits per action, wins per action]
+        self.rollouts = 0
+
+    def __call__(self, player, rng=None) -> str:
+        key = (player.age_bracket, player.target_industry)
+        model = self.models.get(key)
+        if model is None:
+            model = self.models[key] = Model(*key)
+        root = model.from_player(player)
+        if root[WEEK] == 1 and root[DAY] == 1:
+            self.table.clear()
+        return game.ACTIONS[self.search(model, root)]
+
+    def search(self, model: Model, root: State) -> int:
+        """Best action code from ``root`` (the most visited one)."""
+        table, rng, step = self.table, self.rng, model.step
+        n_actions = len(game.ACTIONS)
+        deadline = time.perf_counter() + self.budget if self.budget else None
+        for i in range(self.iterations):
+            if deadline and i % 64 == 0 and time.perf_counter() > deadline:
+                break
+            state, path = root, []
+            while state[END] == RUNNING and state[WEEK] <= game.MAX_SIM_WEEKS:
+                node = table.get(state)
+                if node is None:
+                    table[state] = [0, [0] * n_actions, [0] * n_actions]
+                    break
+                a = self._select(node)
+                path.append((node, a))
+                state = step(state, a, rng)
+            won = model.rollout(state, rng)
+            self.rollouts += 1
+            for node, a in path:
+                node[0] += 1
+                node[1][a] += 1
+                node[2][a] += won
+        visits = table[root][1] if root in table else [0] * n_actions
+        return max(range(n_actions), key=visits.__getitem__)
+
+    def _select(self, node: List) -> int:
+        total, visits, wins = node
+        for a, v in enumerate(visits):
+            if not v:
+                return a
+        c = self.explore * (2.0 * math.log(total)) ** 0.5
+        return max(range(len(visits)), key=lambda a: wins[a] / visits[a] + c / visits[a] ** 0.5)
+
+
+def bench(seconds: float = 2.0, age: str = "Young", industry: str = "Tech") -> Tuple[float, float]:
+    """(Random rollouts per second from the start, Player.clone() + simulate per second for comparison)."""
+    model = Model(age, industry)
+    rng = random.Random(0)
+    start = model.start(rng)
+    n, t0 = 0, time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        for _ in range(500):
+            model.rollout(start, rng)
+        n += 500
+    fast = n / (time.perf_counter() - t0)
+
+    player = game.new_player(age, industry, game.RunRNG(0))
+    run_rng = game.RunRNG(0)
+    n, t0 = 0, time.perf_counter()
+    while time.perf_counter() - t0 < seconds:
+        for _ in range(50):
+            p = player.clone()
+            while not p.game_over and p.week <= game.MAX_SIM_WEEKS:
+                game.take_turn(p, game.random_policy(p, run_rng.policy), run_rng)
+        n += 50
+    return fast, n / (time.perf_counter() - t0)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Monte Carlo tree search bot over immutable states.")
+    ap.add_argument("--bench", action="store_true", help="time random rollouts against the Player engine")
+    ap.add_argument("--runs", type=int, default=20, help="games for the bot to play")
+    ap.add_argument("--iterations", type=int, default=2000, help="search iterations per decision")
+    ap.add_argument("--budget", type=float, default=None, help="seconds per decision (caps --iterations)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--age", choices=list(game.AGE_BALANCE), default="Young")
+    ap.add_argument("--industry", choices=list(game.INDUSTRIES), default="Tech")
+    args = ap.parse_args()
+
+    if args.bench:
+        fast, slow = bench(age=args.age, industry=args.industry)
+        print(f"Immutable-state rollouts: {fast:,.0f}/s; Player clone + take_turn: {slow:,.0f}/s "
+              f"({fast / slow:.1f}x)")
+        return
+
+    bot = MCTSBot(args.iterations, budget=args.budget, seed=args.seed)
+    t0 = time.perf_counter()
+    results = [game.simulate_run(bot, seed=args.seed + i, age=args.age, industry=args.industry)
+               for i in range(args.runs)]
+    dt = time.perf_counter() - t0
+    wins = sum(r.won for r in results)
+    print(f"MCTS bot, {args.runs} runs ({args.age}/{args.industry}): win {wins / args.runs:.1%} — "
+          f"{bot.rollouts / dt:,.0f} rollouts/s over {sum(r.turns for r in results):,} decisions")
+    for path, count in Counter(r.path for r in results).most_common():
+        print(f"  {path:<30} {count / args.runs:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
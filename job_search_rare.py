@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — Dream Job rate by importance sampling (v0.5.1e Gentle Mode rules)
+# Plain Monte Carlo learns the Dream Job rate one lucky apply at a time. Here
+# every apply roll is tilted all the way: the Dream branch is never sampled,
+# its probability at that roll is scored exactly, and the run carries on from
+# the callback/contract/rejection outcomes renormalised without it. The run's
+# likelihood ratio is the product of (1 - dream chance) over its applies. Each
+# run then contributes sum(weight before the roll × dream chance), which is
+# unbiased for the Dream Job rate with far less spread than a 0/1 outcome. The
+# other paths are reweighted by the run's final weight.
+#
+# Runs use job_search_mcts.Model's tuple rules.
+#
+#   python job_search_rare.py --age all --runs 20000 --check 200000
+
+import argparse
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+from job_search_mcts import DREAM, END, ENERGY, PATHS, PITY_STREAK, RUNNING, WEEK, Model, State
+
+Z = 1.96  # 95% intervals
+
+
+def apply_without_dream(model: Model, state: State, rng: random.Random) -> Tuple[State, float]:
+    """apply_flow() with the Dream branch taken out: (next state given no Dream Job, chance it was one).
+
+    Only for states with the energy to apply.
+    """
+    week, day, e, money, conf, k, streak, n, warm, prep, mentor, strong, _ = state
+    rnd = rng.random
+    e -= game.APPLY_COST_ENERGY
+    cell = ((((min(conf, model.conf_max) * 2 + warm) * 2 + prep) * 2 + mentor) * 2
+            + (streak >= PITY_STREAK)) * model.n_emotions + int(rnd() * model.n_emotions)
+    callback, offer, dream = model.odds[cell]
+    contract = callback * (min(dream + offer, 1.0) - dream)
+    p_dream = callback * dream
+    warm = prep = mentor = 0
+
+    u = rnd() * (1.0 - p_dream)
+    if u < contract:
+        streak = 0
+        n += 1
+        money += 200 + int(rnd() * 301)
+        conf += 2
+    else:
+        # A rejection after a callback resets the streak first
+        streak = 0 if u < callback - p_dream else streak
+        conf = max(game.CONFIDENCE_FLOOR, conf - model.reject_loss[k])
+        k = min(k + 1, model.k_cap)
+        streak = min(streak + 1, PITY_STREAK)
+        mentor = int(rnd() < 0.25)
+    return model.close_day(week, day, e, money, conf, k, streak, n, warm, prep, mentor, strong, rnd), p_dream
+
+
+def tilted_run(model: Model, rng: random.Random, max_weeks: int = game.MAX_SIM_WEEKS) -> Tuple[float, float, int]:
+    """One random-play run with the Dream branch scored instead of rolled.
+
+    Returns (Dream Job contribution, final likelihood ratio, END code given no Dream Job).
+    """
+    state = model.start(rng)
+    weight, dream = 1.0, 0.0
+    n_actions = len(game.ACTIONS)
+    while state[END] == RUNNING and state[WEEK] <= max_weeks:
+        action = int(rng.random() * n_actions)
+        if action == 0 and state[ENERGY] >= game.APPLY_COST_ENERGY:
+            state, p_dream = apply_without_dream(model, state, rng)
+            dream += weight * p_dream
+            weight *= 1.0 - p_dream
+        else:
+            state = model.step(state, action, rng)
+    return dream, weight, state[END]
+
+
+@dataclass
+class Estimate:
+    """Weighted per-run sums for one group; means and standard errors come from these."""
+    runs: int = 0
+    sums: Dict[str, float] = field(default_factory=dict)
+    squares: Dict[str, float] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def add(self, path: str, y: float):
+        self.sums[path] = self.sums.get(path, 0.0) + y
+        self.squares[path] = self.squares.get(path, 0.0) + y * y
+
+    def mean(self, path: str) -> float:
+        return self.sums.get(path, 0.0) / self.runs
+
+    def stderr(self, path: str) -> float:
+        if self.runs < 2:
+            return math.inf
+        mean = self.mean(path)
+        var = max(0.0, self.squares.get(path, 0.0) / self.runs - mean * mean) * self.runs / (self.runs - 1)
+        return math.sqrt(var / self.runs)
+
+    def speedup(self, path: str) -> float:
+        """How many plain Monte Carlo runs one of these is worth: p(1 - p) over the weighted variance."""
+        p, se = self.mean(path), self.stderr(path)
+        return p * (1 - p) / (se * se * self.runs) if se else math.inf
+
+
+def estimate(runs: int, age: str = "Young", industry: str = "Tech", *, seed: int = 0,
+             max_weeks: int = game.MAX_SIM_WEEKS) -> Estimate:
+    """Random play's path probabilities for one group, Dream Job by importance sampling."""
+    model = Model(age, industry)
+    rng = random.Random(f"{seed}/{age}/{industry}")
+    est = Estimate(runs)
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        dream, weight, end = tilted_run(model, rng, max_weeks)
+        est.add(PATHS[DREAM], dream)
+        est.add(PATHS[end], weight)
+    est.seconds = time.perf_counter() - t0
+    return est
+
+
+def plain(runs: int, age: str, industry: str, seed: int = 0) -> Tuple[float, float, float]:
+    """(Dream Job rate, standard error, seconds) from untilted runs of the same rules."""
+    model = Model(age, industry)
+    rng = random.Random(f"{seed}/{age}/{industry}/plain")
+    t0 = time.perf_counter()
+    hits = 0
+    for _ in range(runs):
+        state = model.start(rng)
+        while state[END] == RUNNING and state[WEEK] <= game.MAX_SIM_WEEKS:
+            state = model.step(state, int(rng.random() * len(game.ACTIONS)), rng)
+        hits += state[END] == DREAM
+    p = hits / runs
+    return p, math.sqrt(p * (1 - p) / runs), time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Dream Job rate under random play by importance sampling.")
+    ap.add_argument("--runs", type=int, default=20_000, help="tilted runs per group")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--age", choices=list(game.AGE_BALANCE) + ["all"], default="all")
+    ap.add_argument("--industry", choices=list(game.INDUSTRIES), default="Tech")
+    ap.add_argument("--check", type=int, default=0, metavar="RUNS",
+                    help="also run this many plain Monte Carlo runs per group to compare")
+    args = ap.parse_args()
+
+    dream = PATHS[DREAM]
+    ages = list(game.AGE_BALANCE) if args.age == "all" else [args.age]
+    print(f"{args.runs:,} tilted runs per group ({args.industry}, random play)")
+    for age in ages:
+        est = estimate(args.runs, age, args.industry, seed=args.seed)
+        line = (f"{age:<6} Dream Job {est.mean(dream):.4%} ± {Z * est.stderr(dream):.4%} "
+                f"({est.seconds:.1f}s, worth {est.speedup(dream):.0f}x as many plain runs)")
+        others = ", ".join(f"{p} {est.mean(p):.2%}" for p in PATHS if p != dream and est.sums.get(p))
+        print(line + "\n       " + others)
+        if args.check:
+            p, se, dt = plain(args.check, age, args.industry, args.seed)
+            z = (p - est.mean(dream)) / math.hypot(se, est.stderr(dream))
+            print(f"       plain ({args.check:,} runs, {dt:.1f}s): {p:.4%} ± {Z * se:.4%} (z = {z:+.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,13 +15,25 @@ def title_screen():
 # Additions in this build:
 # • Humor+Empathy flavor pools combined for richer variety
 # • Age bracket trade-offs displayed during selection
-# • Resource warnings for low Energy & Money (including upcoming weekend bills/rent)
+# • Resource warnings for low Energy & Money, with the exact odds of going broke by the next rent week
+# • Headless engine: simulate_run() plays the same rules with no printing or pauses
+# • Replay log: every run saves its seed and actions; --replay FILE re-runs it headlessly
+# • Advisor (--advisor): each action's win chance at the prompt, exact for today plus random-play rollouts
 # • Keeps: 5-day workweek, monthly-ish rent, simplified win paths, hopeful tuning, UI polish, EOF safety
 
+import argparse
+import base64
+import copy
+import functools
+import json
+import os
 import random
 import sys
-from dataclasses import dataclass, field
-from typing import Optional
+import time
+import zlib
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Tuple
 
 # -----------------------------
 # Tunables (balance knobs)
@@ -80,6 +92,74 @@ INDUSTRRIES = {  # (typo fixed below after definition to maintain compatibility
 # fix name
 INDUSTRIES = INDUSTRRIES
 
+# Skill registry: every tag gets a fixed slot, so a player's skills are one
+# small int array and "which tags are trained" is a bitmask. An industry is the
+# mask of its tags' slots, and matching is a popcount however many tags exist.
+SKILL_TAGS = tuple(sorted({tag for ind in INDUSTRIES.values() for tag in ind["skills"]}))
+SKILL_INDEX = {tag: i for i, tag in enumerate(SKILL_TAGS)}
+# Sorted per industry: set order of strings changes with PYTHONHASHSEED, which
+# would make a seed replay differently per process.
+INDUSTRY_TAGS = {name: tuple(sorted(ind["skills"])) for name, ind in INDUSTRIES.items()}
+INDUSTRY_MASKS = {name: sum(1 << SKILL_INDEX[tag] for tag in tags) for name, tags in INDUSTRY_TAGS.items()}
+
+# Industry symmetry: the rules only ever look at which of an industry's tags are
+# trained, never at their names, so two industries with the same tag count and
+# nothing else but cosmetic text play identically once their sorted tags are
+# lined up. INDUSTRY_CLASS maps each industry to its class's representative
+# (the first one listed); canonical_skills()/canonical_bits() move a player's
+# skills onto the representative's slots. A content change that gives an
+# industry a different tag count or a non-cosmetic field puts it in a class of
+# its own. Rule code that branches on an industry's name isn't visible here;
+# job_search_batch.py also checks a few seeds before sharing results.
+INDUSTRY_COSMETIC = frozenset(("skills", "flavor", "dream_job_title"))
+
+def industry_signature(industry: str) -> tuple:
+    """What the rules can see of an industry: its tag count and any non-cosmetic fields."""
+    ind = INDUSTRIES[industry]
+    return (len(ind["skills"]),) + tuple(sorted((k, repr(v)) for k, v in ind.items() if k not in INDUSTRY_COSMETIC))
+
+def _industry_classes() -> dict:
+    reps, out = {}, {}
+    for name in INDUSTRIES:
+        rep = reps.setdefault(industry_signature(name), name)
+        # Industries sharing a tag can't have their slots swapped apart
+        out[name] = rep if rep == name or not set(INDUSTRY_TAGS[name]) & set(INDUSTRY_TAGS[rep]) else name
+    return out
+
+INDUSTRY_CLASS = _industry_classes()
+# Slot permutation per industry: its tags swap places with its representative's, pairwise in sorted order
+INDUSTRY_SLOTS = {}
+for _name, _rep in INDUSTRY_CLASS.items():
+    _slots = list(range(len(SKILL_TAGS)))
+    for _a, _b in zip(INDUSTRY_TAGS[_name], INDUSTRY_TAGS[_rep]):
+        _slots[SKILL_INDEX[_a]], _slots[SKILL_INDEX[_b]] = SKILL_INDEX[_b], SKILL_INDEX[_a]
+    INDUSTRY_SLOTS[_name] = tuple(_slots)
+del _name, _rep, _slots
+
+def canonical_skills(industry: str, skills) -> Tuple[str, tuple]:
+    """(representative industry, skill levels per SKILL_TAGS slot as the representative would hold them)."""
+    slots = INDUSTRY_SLOTS[industry]
+    out = [0] * len(slots)
+    for i, level in enumerate(skills):
+        out[slots[i]] = level
+    return INDUSTRY_CLASS[industry], tuple(out)
+
+def canonical_bits(industry: str, bits: int) -> int:
+    """A skill_bits/strong_bits mask moved onto the representative's slots."""
+    slots = INDUSTRY_SLOTS[industry]
+    out = 0
+    while bits:
+        low = bits & -bits
+        out |= 1 << slots[low.bit_length() - 1]
+        bits ^= low
+    return out
+
+try:
+    popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def popcount(x: int) -> int:
+        return bin(x).count("1")
+
 RECRUITER_EMOTIONS = [
     ("cheery", +0.07, "sounds genuinely excited to meet you"),
     ("rushed", -0.03, "is juggling back-to-back calls"),
@@ -149,21 +229,93 @@ class Color:
     YELLOW = "\033[93m"
     CYAN = "\033[96m"
 
-def say(msg: str, *, color: Optional[str] = None, bold: bool = False):
+def styled(msg: str, color: Optional[str] = None, bold: bool = False) -> str:
     start = ""
     if bold:
         start += Style.BOLD
     if color:
         start += color
     end = Style.RESET if start else ""
-    print(f"{start}{msg}{end}")
+    return f"{start}{msg}{end}"
+
+def say(msg: str, *, color: Optional[str] = None, bold: bool = False):
+    print(styled(msg, color, bold))
 
 def action_pause():
-    try:
-        input("\n(press ENTER to continue)")
-    except EOFError:
+    TERMINAL.pause()
+
+# Engine messages are str.format() templates plus their fields, so a quiet UI
+# never pays for the formatting: ui.say("Rent due: -${rent}", rent=rent).
+
+class TerminalUI:
+    """Renders engine messages to the terminal (ANSI colors + ENTER pauses).
+
+    Lines collect in a buffer and go out as one write per frame: when the game
+    waits for input (ask/pause) or on flush().
+    """
+    quiet = False  # True: output is dropped, so warn_resources() doesn't compute it
+
+    def __init__(self):
+        self._buf = []
+
+    def say(self, msg: str, *args, color: Optional[str] = None, bold: bool = False, **fields):
+        if args or fields:
+            msg = msg.format(*args, **fields)
+        self._buf.append(styled(msg, color, bold) + "\n")
+
+    def line(self, msg: str, *args, **fields):
+        if args or fields:
+            msg = msg.format(*args, **fields)
+        self._buf.append(msg + "\n")
+
+    def flush(self, tail: str = ""):
+        sys.stdout.write("".join(self._buf) + tail)
+        sys.stdout.flush()
+        self._buf.clear()
+
+    def ask(self, prompt: str = "") -> str:
+        """Flush the frame with ``prompt`` at the end, then read a line (EOFError propagates)."""
+        self.flush(prompt)
+        return input()
+
+    def pause(self):
+        try:
+            self.ask("\n(press ENTER to continue)")
+        except EOFError:
+            pass
+
+    def pick(self, rng: "RunRNG", lines: List[str]) -> str:
+        """A random flavor line, drawn from the run's flavor stream."""
+        return rng.flavor.choice(lines)
+
+    def flavor(self, rng: "RunRNG", lines: List[str]):
+        self.line(self.pick(rng, lines))
+
+class HeadlessUI:
+    """Quiet backend: drops all output without formatting it and never blocks; used by simulate_run()."""
+    quiet = True
+
+    def say(self, msg: str, *args, color: Optional[str] = None, bold: bool = False, **fields):
+        pass
+
+    def line(self, msg: str, *args, **fields):
         pass
 
+    def flush(self, tail: str = ""):
+        pass
+
+    def pause(self):
+        pass
+
+    def pick(self, rng: "RunRNG", lines: List[str]) -> str:
+        return ""  # no draw: flavor has its own stream, so skipping it shifts nothing
+
+    def flavor(self, rng: "RunRNG", lines: List[str]):
+        pass
+
+TERMINAL = TerminalUI()
+HEADLESS = HeadlessUI()
+
 # Optional: better Windows support for ANSI colors
 if sys.platform.startswith("win"):
     try:
@@ -264,6 +416,14 @@ SMALL_GOOD_NEWS_LINES = [
     "A stranger on the bus said 'you got this'. Statistically significant uplift.",
 ]
 
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)."""
+    names = tuple(f.name for f in fields(cls))
+    ns = {k: v for k, v in cls.__dict__.items() if k not in names and k not in ("__dict__", "__weakref__")}
+    ns["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, ns)
+
+@_slotted
 @dataclass
 class Player:
     name: str
@@ -280,19 +440,43 @@ class Player:
     contracts: int = 0
     interview_prep_active: bool = False
     warm_intro: bool = False
-    skills: dict = field(default_factory=lambda: {k: 0 for k in {"coding","product","data","excel","analysis","risk","compliance","patient","ops","design","portfolio","story"}})
+    skills: array = field(default_factory=lambda: array("H", [0]) * len(SKILL_TAGS))  # level per SKILL_TAGS slot
+    skill_bits: int = 0   # slots at level 1+
+    strong_bits: int = 0  # slots at level 2+
     game_over: bool = False
     win_reason: Optional[str] = None
     loss_reason: Optional[str] = None
     consecutive_rejections: int = 0
     mentor_boost: bool = False
+    seed: Optional[int] = None  # what random was seeded with for this run
 
     def any_stat_empty(self) -> bool:
         return self.energy <= 0 or self.money <= 0 or self.confidence <= 0
 
     def industry_skill_match(self, industry: str) -> int:
-        tags = INDUSTRIES[industry]["skills"]
-        return sum(self.skills.get(tag, 0) > 0 for tag in tags)
+        return popcount(self.skill_bits & INDUSTRY_MASKS[industry])
+
+    def trained_tags(self) -> int:
+        """Tags trained to level 2 or more, in any industry."""
+        return popcount(self.strong_bits)
+
+    def skill(self, tag: str) -> int:
+        return self.skills[SKILL_INDEX[tag]]
+
+    def add_skill(self, tag: str, amount: int = 1):
+        # Skills only ever go up, so the masks only ever gain bits
+        i = SKILL_INDEX[tag]
+        level = self.skills[i] + amount
+        self.skills[i] = level
+        if level >= 1:
+            self.skill_bits |= 1 << i
+        if level >= 2:
+            self.strong_bits |= 1 << i
+
+    def clone(self) -> "Player":
+        c = copy.copy(self)
+        c.skills = array("H", self.skills)
+        return c
 
     def status_line(self) -> str:
         return (f"Week {self.week} Day {self.day}/5 | Energy {self.energy} | Money ${self.money} | "
@@ -320,7 +504,64 @@ def choose(prompt, options):
             return int(s) - 1
         print("Pick a number from the list.")
 
-def intro(seed: Optional[int] = None) -> Player:
+class RunRNG:
+    """A run's random streams, each seeded from the run seed.
+
+    ``play`` rolls every outcome of an action, ``events`` the weekend event,
+    ``flavor`` only picks text and ``policy`` is for bots choosing actions.
+    Keeping them apart means editing a flavor list, or a UI that skips flavor
+    altogether, never changes what a seed plays out to.
+
+    The rules draw through one name per subsystem (``setup``, ``emotion``,
+    ``apply``, ``train``, ``network``, ``mentor``); here they all share
+    ``play``, while a random tape (job_search_tapes.py) gives each its own.
+    at() is called at the start of every turn so a tape can seek to the day.
+    """
+    __slots__ = ("seed", "play", "events", "policy", "_flavor",
+                 "setup", "emotion", "apply", "train", "network", "mentor")
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**32)
+        self.seed = seed
+        self.play = random.Random(f"{seed}/play")
+        self.events = random.Random(f"{seed}/events")
+        self.policy = random.Random(f"{seed}/policy")
+        self._flavor = None
+        self.setup = self.emotion = self.apply = self.train = self.network = self.mentor = self.play
+
+    def at(self, week: int, day: int):
+        pass
+
+    @property
+    def flavor(self) -> random.Random:
+        # Made on first use: headless runs never draw flavor
+        if self._flavor is None:
+            self._flavor = random.Random(f"{self.seed}/flavor")
+        return self._flavor
+
+def new_player(age: str, industry: str, rng: RunRNG, name: str = "Player") -> Player:
+    """Create a Player with the age bracket trade-offs applied (no I/O); ``rng`` rolls them."""
+    p = Player(name=name, age_bracket=age, start_industry=industry, target_industry=industry)
+
+    # Age bracket trade-offs
+    for tag in INDUSTRY_TAGS[industry]:
+        p.add_skill(tag)
+
+    if age == "Mid":
+        p.add_skill(rng.setup.choice(INDUSTRY_TAGS[industry]))
+        p.confidence += 1
+    elif age == "Late":
+        tags = list(INDUSTRY_TAGS[industry])
+        rng.setup.shuffle(tags)
+        for t in tags[:2]:
+            p.add_skill(t)
+        p.confidence += 2
+        p.money += 100
+    return p
+
+def intro(seed: Optional[int] = None) -> Tuple[Player, RunRNG]:
+    """Set up a run interactively; returns the player and the run's random streams."""
     say("=== Job Search Roguelike — v0.5.1e ===", bold=True)
     print("One action per weekday. Weekends auto-wrap bills & events.\n")
     if seed is None:
@@ -330,8 +571,9 @@ def intro(seed: Optional[int] = None) -> Player:
         except (ValueError, EOFError):
             seed = None
     if seed is not None:
-        random.seed(seed)
         print(f"(Using seed {seed})\n")
+    # With no seed typed, RunRNG still picks one so the run can be saved and replayed
+    rng = RunRNG(seed)
 
     try:
         name = input("Your name: ").strip() or "Player"
@@ -352,24 +594,8 @@ def intro(seed: Optional[int] = None) -> Player:
     start_ind = ind_names[start_idx]
     target_ind = start_ind  # target == start, by design
 
-    # Create player
-    p = Player(name=name, age_bracket=age, start_industry=start_ind, target_industry=target_ind)
-
-    # Age bracket trade-offs
-    for tag in INDUSTRIES[start_ind]["skills"]:
-        p.skills[tag] = p.skills.get(tag, 0) + 1
-
-    if age == "Mid":
-        extra = random.choice(list(INDUSTRIES[start_ind]["skills"]))
-        p.skills[extra] += 1
-        p.confidence += 1
-    elif age == "Late":
-        tags = list(INDUSTRIES[start_ind]["skills"])
-        random.shuffle(tags)
-        for t in tags[:2]:
-            p.skills[t] += 1
-        p.confidence += 2
-        p.money += 100
+    p = new_player(age, start_ind, rng, name=name)
+    p.seed = rng.seed
 
     print("\nFlavor:", INDUSTRIES[target_ind]["flavor"])
     say(f"\nStarting stats → {p.status_line()}", color=Color.CYAN, bold=True)
@@ -377,308 +603,831 @@ def intro(seed: Optional[int] = None) -> Player:
     print(" • Dream Job offer in your industry")
     print(f" • Sustainable Freelance Career: secure {PORTFOLIO_TARGET}+ contracts")
     print(" • Consultant: strong network, skills, and savings\n")
-    return p
-
-def weekly_costs(player: Player):
-    m = AGE_BALANCE[player.age_bracket]["rent_mult"]
-    bills = int(BILLS_BY_AGE[player.age_bracket] * m)
+    return p, rng
+
+def weekly_amounts(age: str, week: int, paid: int) -> Tuple[int, int, int]:
+    """(bills, rent, benefit) due at the end of ``week``; rent and benefit are 0 when not due."""
+    m = AGE_BALANCE[age]["rent_mult"]
+    bills = int(BILLS_BY_AGE[age] * m)
+    rent = int(RENT_BY_AGE[age] * m) if week % RENT_CYCLE_WEEKS == 0 else 0
+    benefit = int(UNEMPLOY_BENEFIT * AGE_BALANCE[age]["unemp_mult"]) if paid < UNEMPLOY_WEEKS_MAX else 0
+    return bills, rent, benefit
+
+def weekly_costs(player: Player, ui=HEADLESS):
+    bills, rent, benefit = weekly_amounts(player.age_bracket, player.week, player.unemployed_weeks_paid)
     player.money -= bills
-    say(f"Weekly bills: -${bills}", color=Color.YELLOW, bold=True)
+    ui.say("Weekly bills: -${bills}", bills=bills, color=Color.YELLOW, bold=True)
 
-    if player.week % RENT_CYCLE_WEEKS == 0:
-        rent = int(RENT_BY_AGE[player.age_bracket] * m)
+    if rent:
         player.money -= rent
-        say(f"Rent due (week {player.week}): -${rent}", color=Color.RED, bold=True)
+        ui.say("Rent due (week {week}): -${rent}", week=player.week, rent=rent, color=Color.RED, bold=True)
 
-    if player.unemployed_weeks_paid < UNEMPLOY_WEEKS_MAX:
-        um = AGE_BALANCE[player.age_bracket]["unemp_mult"]
-        benefit = int(UNEMPLOY_BENEFIT * um)
+    if benefit:
         player.money += benefit
         player.unemployed_weeks_paid += 1
-        say(f"Unemployment benefit: +${benefit} (week {player.unemployed_weeks_paid}/{UNEMPLOY_WEEKS_MAX})", color=Color.GREEN, bold=True)
+        ui.say("Unemployment benefit: +${benefit} (week {paid}/{weeks})", benefit=benefit,
+               paid=player.unemployed_weeks_paid, weeks=UNEMPLOY_WEEKS_MAX, color=Color.GREEN, bold=True)
 
-def random_weekly_event(player: Player):
-    roll = random.random()
+def random_weekly_event(player: Player, rng: RunRNG, ui=HEADLESS):
+    roll = rng.events.random()
     if roll < 0.15:
-        amt = random.randint(*SURPRISE_BILL_RANGE)
+        amt = rng.events.randint(*SURPRISE_BILL_RANGE)
         player.money -= amt
-        line = random.choice(SURPRISE_BILL_LINES)
-        say(f"{line} -${amt}", color=Color.RED, bold=True)
+        line = ui.pick(rng, SURPRISE_BILL_LINES)
+        ui.say("{line} -${amt}", line=line, amt=amt, color=Color.RED, bold=True)
     elif roll < 0.50:
-        pay = random.randint(*TEMP_GIG_MONEY_REWARD)
+        pay = rng.events.randint(*TEMP_GIG_MONEY_REWARD)
         player.money += pay
         player.energy = max(0, player.energy - TEMP_GIG_ENERGY_COST)
-        base = f"Event: Temp gig → +${pay}, Energy -{TEMP_GIG_ENERGY_COST}"
-        if random.random() < 0.25:
+        base = "Event: Temp gig → +${pay}, Energy -{cost}"
+        if rng.events.random() < 0.25:
             player.confidence += 1
             base += ", Confidence +1"
-        say(base, color=Color.CYAN, bold=True)
-        print(random.choice(TEMP_GIG_LINES))
+        ui.say(base, pay=pay, cost=TEMP_GIG_ENERGY_COST, color=Color.CYAN, bold=True)
+        ui.flavor(rng, TEMP_GIG_LINES)
     else:
-        m = random.randint(*SMALL_GOOD_NEWS_MONEY)
-        c = random.randint(*SMALL_GOOD_NEWS_CONF)
+        m = rng.events.randint(*SMALL_GOOD_NEWS_MONEY)
+        c = rng.events.randint(*SMALL_GOOD_NEWS_CONF)
         player.money += m
         player.confidence += c
-        say(f"Event: Small good news → +${m} money, +{c} confidence", color=Color.GREEN, bold=True)
-        print(random.choice(SMALL_GOOD_NEWS_LINES))
+        ui.say("Event: Small good news → +${m} money, +{c} confidence", m=m, c=c, color=Color.GREEN, bold=True)
+        ui.flavor(rng, SMALL_GOOD_NEWS_LINES)
 
-def warn_resources(player: Player, *, upcoming_wrap: bool = False):
-    """Warn when resources are low or about to dip below zero on weekend wrap."""
+# -----------------------------
+# Cash-flow forecast
+# -----------------------------
+# Odds of Money reaching $0 at a coming weekend wrap, assuming the weekdays in
+# between neither earn nor spend. Each wrap is weekly_costs() then one
+# random_weekly_event(), and Money at or below $0 after it ends the run at the
+# next check. The odds are worked out backward once per run of weekly nets,
+# for every balance at once, so the daily lookup is a single index however
+# Money moved since.
+
+FORECAST_WARN_ODDS = 0.05  # warn from this chance of going broke
+
+def _event_money() -> tuple:
+    """random_weekly_event()'s money change as (chance, low, high) uniform ranges."""
+    lo, hi = SURPRISE_BILL_RANGE
+    return ((0.15, -hi, -lo), (0.35,) + tuple(TEMP_GIG_MONEY_REWARD), (0.50,) + tuple(SMALL_GOOD_NEWS_MONEY))
+
+@functools.lru_cache(maxsize=512)
+def _broke_odds(nets: Tuple[int, ...], events: tuple) -> Tuple[float, ...]:
+    """Chance of Money at or below $0 after any of these wraps, indexed by starting balance.
+
+    ``nets`` is each wrap's bills/rent/benefit total in order. Index 0 (already
+    broke) is 1.0; balances past the end can't go broke in time.
+    """
+    d_lo = min(e[1] for e in events)
+    d_hi = max(e[2] for e in events)
+    odds = [1.0]
+    for net in reversed(nets):
+        n = max(1, len(odds) - net - d_lo)
+        # Prefix sums of "broke from here" over every balance the wrap can reach
+        y0 = net + d_lo
+        run = [0.0]
+        for y in range(y0, n + net + d_hi):
+            run.append(run[-1] + (1.0 if y <= 0 else odds[y] if y < len(odds) else 0.0))
+        new = [1.0] * n
+        for m in range(1, n):
+            at = m + net - y0
+            new[m] = sum(p * (run[at + hi + 1] - run[at + lo]) / (hi - lo + 1) for p, lo, hi in events)
+        odds = tuple(new)
+    return tuple(odds)
+
+def broke_odds(player: Player, weeks: int) -> float:
+    """Chance Money reaches $0 at one of the next ``weeks`` weekend wraps."""
+    if player.money <= 0:
+        return 1.0
+    nets = []
+    for i in range(weeks):
+        bills, rent, benefit = weekly_amounts(player.age_bracket, player.week + i, player.unemployed_weeks_paid + i)
+        nets.append(benefit - bills - rent)
+    odds = _broke_odds(tuple(nets), _event_money())
+    return odds[player.money] if player.money < len(odds) else 0.0
+
+def warn_resources(player: Player, *, upcoming_wrap: bool = False, ui=HEADLESS):
+    """Warn when resources are low or Money may hit $0 at a coming weekend wrap."""
+    if ui.quiet:
+        return
     # Energy warning
     if player.energy <= 2:
-        say("Warning: Low Energy. Consider Rest or Self‑Care.", color=Color.YELLOW, bold=True)
+        ui.say("Warning: Low Energy. Consider Rest or Self‑Care.", color=Color.YELLOW, bold=True)
     # Money warning immediate
     if player.money <= 100:
-        say("Warning: Low Money. Consider a Temp Gig week or lighter spending.", color=Color.YELLOW, bold=True)
-    # Predict weekend bills/rent if wrap incoming
+        ui.say("Warning: Low Money. Consider a Temp Gig week or lighter spending.", color=Color.YELLOW, bold=True)
+    # This weekend's wrap, then everything through the next rent week
     if upcoming_wrap:
-        projected = player.money - BILLS_BY_AGE[player.age_bracket]
-        rent_due = (player.week % RENT_CYCLE_WEEKS == 0)
-        if rent_due:
-            projected -= RENT_BY_AGE[player.age_bracket]
-        if projected <= 0:
-            msg = "Warning: Upcoming bills "
-            msg += "+ rent " if rent_due else ""
-            msg += "may push Money below $0 this weekend."
-            say(msg, color=Color.YELLOW, bold=True)
-
-def act_rest(player: Player):
+        odds = broke_odds(player, 1)
+        if odds >= FORECAST_WARN_ODDS:
+            rent_due = player.week % RENT_CYCLE_WEEKS == 0
+            ui.say("Warning: {odds:.0%} chance bills {rent}push Money to $0 this weekend.", odds=odds,
+                   rent="+ rent " if rent_due else "", color=Color.YELLOW, bold=True)
+    rent_week = (player.week // RENT_CYCLE_WEEKS + 1) * RENT_CYCLE_WEEKS
+    odds = broke_odds(player, rent_week - player.week + 1)
+    if odds >= FORECAST_WARN_ODDS:
+        ui.say("Forecast: {odds:.0%} chance you drop to $0 by week {week}'s rent.", odds=odds, week=rent_week,
+               color=Color.YELLOW, bold=True)
+
+def act_rest(player: Player, rng: RunRNG, ui=HEADLESS):
     gain = REST_GAIN_ENERGY + AGE_BALANCE[player.age_bracket]["rest_bonus"]
     before = player.energy
     player.energy = min(12, player.energy + gain)
     actual = player.energy - before
     player.confidence = clamp(player.confidence + 1, 0, 99)
-    say(f"You rest. Energy +{actual}, Confidence +1", color=Color.GREEN, bold=True)
-    print(random.choice(AFTER_REST))
+    ui.say("You rest. Energy +{gain}, Confidence +1", gain=actual, color=Color.GREEN, bold=True)
+    ui.flavor(rng, AFTER_REST)
 
-def act_train(player: Player):
+def act_train(player: Player, rng: RunRNG, ui=HEADLESS):
     if player.energy < TRAIN_COST_ENERGY:
-        say("Too tired to train.", color=Color.RED, bold=True)
+        ui.say("Too tired to train.", color=Color.RED, bold=True)
         return
     player.energy -= TRAIN_COST_ENERGY
-    tag = random.choice(list(INDUSTRIES[player.target_industry]["skills"]))
-    player.skills[tag] = player.skills.get(tag, 0) + TRAIN_GAIN_SKILL
+    tag = rng.train.choice(INDUSTRY_TAGS[player.target_industry])
+    player.add_skill(tag, TRAIN_GAIN_SKILL)
     player.confidence += 1
-    say(f"You train {tag}. Skill +{TRAIN_GAIN_SKILL}, Confidence +1, Energy -{TRAIN_COST_ENERGY}", color=Color.CYAN, bold=True)
-    print(random.choice(AFTER_TRAIN))
+    ui.say("You train {tag}. Skill +{gain}, Confidence +1, Energy -{cost}", tag=tag, gain=TRAIN_GAIN_SKILL,
+           cost=TRAIN_COST_ENERGY, color=Color.CYAN, bold=True)
+    ui.flavor(rng, AFTER_TRAIN)
 
-def act_network(player: Player):
+def act_network(player: Player, rng: RunRNG, ui=HEADLESS):
     if player.energy < NETWORK_COST_ENERGY:
-        say("Too tired to network.", color=Color.RED, bold=True)
+        ui.say("Too tired to network.", color=Color.RED, bold=True)
         return
     player.energy -= NETWORK_COST_ENERGY
     player.confidence += 1
-    if random.random() < NETWORK_WARM_INTRO_CHANCE:
+    if rng.network.random() < NETWORK_WARM_INTRO_CHANCE:
         player.warm_intro = True
-        say("You networked into a WARM INTRO for next Apply!", color=Color.GREEN, bold=True)
+        ui.say("You networked into a WARM INTRO for next Apply!", color=Color.GREEN, bold=True)
     else:
-        say("You networked. Confidence +1, Energy -2", color=Color.CYAN, bold=True)
-    print(random.choice(AFTER_NETWORK))
+        ui.say("You networked. Confidence +1, Energy -2", color=Color.CYAN, bold=True)
+    ui.flavor(rng, AFTER_NETWORK)
 
-def act_selfcare(player: Player):
+def act_selfcare(player: Player, rng: RunRNG, ui=HEADLESS):
     if player.money < SELF_CARE_COST_MONEY:
-        say("Not enough money for self-care.", color=Color.RED, bold=True)
+        ui.say("Not enough money for self-care.", color=Color.RED, bold=True)
         return
     post = player.money - SELF_CARE_COST_MONEY
     if post <= 0:
-        say("Heads up: Self‑Care would drop Money to $0. Proceed mindfully.", color=Color.YELLOW, bold=True)
+        ui.say("Heads up: Self‑Care would drop Money to $0. Proceed mindfully.", color=Color.YELLOW, bold=True)
     player.money -= SELF_CARE_COST_MONEY
     player.energy += SELF_CARE_GAIN_ENERGY
     player.confidence += SELF_CARE_GAIN_CONF
-    say(f"Self-care day: -${SELF_CARE_COST_MONEY}, Energy +{SELF_CARE_GAIN_ENERGY}, Confidence +{SELF_CARE_GAIN_CONF}", color=Color.GREEN, bold=True)
-    print(random.choice(AFTER_SELFCARE))
+    ui.say("Self-care day: -${cost}, Energy +{energy}, Confidence +{conf}", cost=SELF_CARE_COST_MONEY,
+           energy=SELF_CARE_GAIN_ENERGY, conf=SELF_CARE_GAIN_CONF, color=Color.GREEN, bold=True)
+    ui.flavor(rng, AFTER_SELFCARE)
 
-def act_interview_prep(player: Player):
+def act_interview_prep(player: Player, rng: RunRNG, ui=HEADLESS):
     if player.money < INTERVIEW_PREP_COST_MONEY or player.energy < INTERVIEW_PREP_COST_ENERGY:
-        say("You lack money or energy for interview prep.", color=Color.RED, bold=True)
+        ui.say("You lack money or energy for interview prep.", color=Color.RED, bold=True)
         return
     post = player.money - INTERVIEW_PREP_COST_MONEY
     if post <= 0:
-        say("Heads up: Interview Prep would drop Money to $0. Proceed mindfully.", color=Color.YELLOW, bold=True)
+        ui.say("Heads up: Interview Prep would drop Money to $0. Proceed mindfully.", color=Color.YELLOW, bold=True)
     player.money -= INTERVIEW_PREP_COST_MONEY
     player.energy -= INTERVIEW_PREP_COST_ENERGY
     player.interview_prep_active = True
-    say(f"You prepare for interviews: -${INTERVIEW_PREP_COST_MONEY}, Energy -{INTERVIEW_PREP_COST_ENERGY}, next interview gets +{int(INTERVIEW_PREP_TEMP_BOOST*100)}%", color=Color.CYAN, bold=True)
-    print(random.choice(AFTER_PREP))
+    ui.say("You prepare for interviews: -${cost}, Energy -{energy}, next interview gets +{boost}%",
+           cost=INTERVIEW_PREP_COST_MONEY, energy=INTERVIEW_PREP_COST_ENERGY,
+           boost=int(INTERVIEW_PREP_TEMP_BOOST*100), color=Color.CYAN, bold=True)
+    ui.flavor(rng, AFTER_PREP)
 
-def rejection_hit(player: Player):
+def rejection_hit(player: Player, rng: RunRNG, ui=HEADLESS):
     loss = max(1, int(REJECTION_CONFIDENCE_LOSS - player.resilience))
     player.confidence = max(CONFIDENCE_FLOOR, player.confidence - loss)
     player.resilience += RESILIENCE_GAIN_ON_REJECT
     player.consecutive_rejections += 1
-    if random.random() < 0.25:
+    if rng.mentor.random() < 0.25:
         player.mentor_boost = True
-        say("A mentor reviewed your résumé. Next Apply gets a quiet boost.", color=Color.GREEN, bold=True)
-    say(f"Rejection. Confidence -{loss}. Your resilience grows (+{RESILIENCE_GAIN_ON_REJECT}).", color=Color.YELLOW, bold=True)
-    print(random.choice(AFTER_REJECTION))
+        ui.say("A mentor reviewed your résumé. Next Apply gets a quiet boost.", color=Color.GREEN, bold=True)
+    ui.say("Rejection. Confidence -{loss}. Your resilience grows (+{gain}).", loss=loss,
+           gain=RESILIENCE_GAIN_ON_REJECT, color=Color.YELLOW, bold=True)
+    ui.flavor(rng, AFTER_REJECTION)
 
-def offer_received(player: Player, job_title: str, industry: str, dream: bool=False):
+def offer_received(player: Player, job_title: str, industry: str, rng: RunRNG, dream: bool=False, ui=HEADLESS):
     if dream:
         player.win_reason = f"Landed Dream Job: {job_title} in {industry}"
         player.game_over = True
-        say(f"▶ Victory! {player.win_reason}", color=Color.GREEN, bold=True)
-        print("Well done. You turned persistence into opportunity.")
+        ui.say("▶ Victory! {reason}", reason=player.win_reason, color=Color.GREEN, bold=True)
+        ui.line("Well done. You turned persistence into opportunity.")
         return
     player.contracts += 1
-    gain = random.randint(200, 500)
+    gain = rng.apply.randint(200, 500)
     player.money += gain
     player.confidence += 2
-    say(f"Offer! You secured a short contract in {industry}: +${gain}, Contracts {player.contracts}", color=Color.GREEN, bold=True)
-    print(random.choice(AFTER_CONTRACT))
-
-def apply_flow(player: Player):
-    if player.energy < APPLY_COST_ENERGY:
-        say("Too tired to apply.", color=Color.RED, bold=True)
-        return
+    ui.say("Offer! You secured a short contract in {industry}: +${gain}, Contracts {n}", industry=industry,
+           gain=gain, n=player.contracts, color=Color.GREEN, bold=True)
+    ui.flavor(rng, AFTER_CONTRACT)
 
-    player.energy -= APPLY_COST_ENERGY
-    emotion, mod, flavor = random.choice(RECRUITER_EMOTIONS)
-    say(f"You apply to a {player.target_industry} role.", bold=True)
-    print(f"Recruiter is {emotion} — {flavor}.")
-
-    match_count = player.industry_skill_match(player.target_industry)
-    warm = 0.15 if player.warm_intro else 0.0
-    prep = INTERVIEW_PREP_TEMP_BOOST if player.interview_prep_active else 0.0
-    pity = 0.10 if player.consecutive_rejections >= 3 else 0.0
-    mentor = 0.07 if player.mentor_boost else 0.0
+# -----------------------------
+# Apply odds table
+# -----------------------------
+# Every (callback, offer, dream) probability apply_flow can use, precomputed per
+# (confidence, match_count, warm, prep, mentor, pity, recruiter emotion). The
+# headless engine, job_search_vec.py and job_search_solver.py all read this one
+# table; odds_table() rebuilds it whenever an odds tunable has changed.
+# Checking the tunables costs more than the lookup itself, so it happens once
+# per run or batch (simulate_run(), simulate_vec(), Advisor.advise()) and
+# apply_flow() reads the table held since. Code that edits a tunable between
+# direct apply_flow()/take_turn() calls calls refresh_odds() afterwards.
+
+def _odds_key() -> tuple:
+    tags = max(len(tags) for tags in INDUSTRY_TAGS.values())
+    return (BASE_CALLBACK_ODDS, CONF_CALLBACK_SCALE, BASE_OFFER_ODDS, CONF_OFFER_SCALE,
+            SKILL_MATCH_BONUS, INTERVIEW_PREP_TEMP_BOOST, BASE_DREAM_ODDS, DREAM_BONUS_STRONG,
+            tuple(e[1] for e in RECRUITER_EMOTIONS), tags)
+
+class OddsTable:
+    """Flat (callback, offer, dream) table; see index() for the layout.
+
+    Confidence past ``conf_max`` reads the ``conf_max`` row: by then every
+    clamp has saturated, so the odds no longer change.
+    """
+
+    def __init__(self, key: tuple):
+        self.key = key
+        mods, tags = key[-2], key[-1]
+        self.n_match = tags + 1
+        self.n_emotions = len(mods)
+        # Lowest confidence at which both clamps hit their ceiling for every emotion
+        worst = min(mods + (0.0,))
+        sat = [14]
+        if CONF_CALLBACK_SCALE > 0:
+            sat.append((0.90 - BASE_CALLBACK_ODDS - worst * 0.5) / CONF_CALLBACK_SCALE)
+        if CONF_OFFER_SCALE > 0:
+            sat.append((0.85 - BASE_OFFER_ODDS - worst) / CONF_OFFER_SCALE)
+        self.conf_max = max(0, int(max(sat)) + 1)
+        self.entries = [
+            _apply_odds(conf, match, warm, prep, mentor, pity, mod)
+            for conf in range(self.conf_max + 1)
+            for match in range(self.n_match)
+            for warm in (False, True)
+            for prep in (False, True)
+            for mentor in (False, True)
+            for pity in (False, True)
+            for mod in mods
+        ]
+
+    @property
+    def shape(self) -> tuple:
+        return (self.conf_max + 1, self.n_match, 2, 2, 2, 2, self.n_emotions)
+
+    def index(self, conf: int, match: int, warm: bool, prep: bool, mentor: bool, pity: bool, emotion: int) -> int:
+        conf = clamp(conf, 0, self.conf_max)
+        return ((((((conf * self.n_match + match) * 2 + warm) * 2 + prep) * 2 + mentor) * 2 + pity)
+                * self.n_emotions + emotion)
+
+def _apply_odds(conf, match_count, warm, prep, mentor, pity, mod):
     callback_odds = clamp(
         BASE_CALLBACK_ODDS
-        + player.confidence * CONF_CALLBACK_SCALE
+        + conf * CONF_CALLBACK_SCALE
         + match_count * SKILL_MATCH_BONUS
-        + warm + mentor + pity
+        + (0.15 if warm else 0.0) + (0.07 if mentor else 0.0) + (0.10 if pity else 0.0)
         + mod * 0.5,
         0.01, 0.90
     )
+    offer_odds = clamp(
+        BASE_OFFER_ODDS
+        + conf * CONF_OFFER_SCALE
+        + match_count * SKILL_MATCH_BONUS
+        + (INTERVIEW_PREP_TEMP_BOOST if prep else 0.0)
+        + mod,
+        0.02, 0.85
+    )
+    dream_bonus = DREAM_BONUS_STRONG if (match_count >= 2 and conf >= 14) else 0.0
+    dream_odds = clamp(BASE_DREAM_ODDS + dream_bonus, 0.0, 0.35)
+    return callback_odds, offer_odds, dream_odds
+
+_odds: Optional[OddsTable] = None
+
+def odds_table() -> OddsTable:
+    """The current odds table, rebuilt first if any odds tunable has changed."""
+    global _odds
+    key = _odds_key()
+    if _odds is None or _odds.key != key:
+        _odds = OddsTable(key)
+    return _odds
+
+def refresh_odds():
+    """Drop the held odds table; the next apply rebuilds it from the current tunables."""
+    global _odds
+    _odds = None
+
+def apply_flow(player: Player, rng: RunRNG, ui=HEADLESS):
+    if player.energy < APPLY_COST_ENERGY:
+        ui.say("Too tired to apply.", color=Color.RED, bold=True)
+        return
+
+    player.energy -= APPLY_COST_ENERGY
+    e = rng.emotion.randrange(len(RECRUITER_EMOTIONS))  # same draw as choice()
+    emotion, _, flavor = RECRUITER_EMOTIONS[e]
+    ui.say("You apply to a {industry} role.", industry=player.target_industry, bold=True)
+    ui.line("Recruiter is {emotion} — {flavor}.", emotion=emotion, flavor=flavor)
+
+    table = _odds or odds_table()
+    callback_odds, offer_odds, dream_odds = table.entries[table.index(
+        player.confidence, player.industry_skill_match(player.target_industry), player.warm_intro,
+        player.interview_prep_active, player.mentor_boost, player.consecutive_rejections >= 3, e)]
 
     player.warm_intro = False
     player.interview_prep_active = False
     player.mentor_boost = False
 
-    if random.random() < callback_odds:
-        say("Callback! You got an interview.", color=Color.GREEN, bold=True)
+    if rng.apply.random() < callback_odds:
+        ui.say("Callback! You got an interview.", color=Color.GREEN, bold=True)
         player.consecutive_rejections = 0
-        offer_odds = clamp(
-            BASE_OFFER_ODDS
-            + player.confidence * CONF_OFFER_SCALE
-            + match_count * SKILL_MATCH_BONUS
-            + prep
-            + mod,
-            0.02, 0.85
-        )
-        dream_bonus = DREAM_BONUS_STRONG if (match_count >= 2 and player.confidence >= 14) else 0.0
-        dream_odds = clamp(BASE_DREAM_ODDS + dream_bonus, 0.0, 0.35)
-        r = random.random()
+        r = rng.apply.random()
         if r < dream_odds:
             title = INDUSTRIES[player.target_industry]["dream_job_title"]
-            offer_received(player, title, player.target_industry, dream=True)
+            offer_received(player, title, player.target_industry, rng, dream=True, ui=ui)
         elif r < dream_odds + offer_odds:
-            offer_received(player, "Contract Offer", player.target_industry, dream=False)
+            offer_received(player, "Contract Offer", player.target_industry, rng, dream=False, ui=ui)
         else:
-            rejection_hit(player)
-        print(random.choice(AFTER_CALLBACK))
+            rejection_hit(player, rng, ui)
+        ui.flavor(rng, AFTER_CALLBACK)
     else:
-        rejection_hit(player)
+        rejection_hit(player, rng, ui)
 
-def check_victory_conditions(player: Player):
+def check_victory_conditions(player: Player, ui=HEADLESS):
     if player.game_over:
         return
     # Sustainable Freelance Career
     if player.contracts >= PORTFOLIO_TARGET:
         player.win_reason = f"Sustainable Freelance Career: {player.contracts} contracts."
         player.game_over = True
-        say(f"▶ Victory! {player.win_reason}", color=Color.GREEN, bold=True)
-        print("Your freelance projects added up to a steady path.")
+        ui.say("▶ Victory! {reason}", reason=player.win_reason, color=Color.GREEN, bold=True)
+        ui.line("Your freelance projects added up to a steady path.")
         return
     # Consultant victory: network + skills + savings
-    trained_tags = sum(1 for v in player.skills.values() if v >= 2)
-    if player.confidence >= 16 and trained_tags >= 4 and player.money >= 1500:
+    if player.confidence >= 16 and player.trained_tags() >= 4 and player.money >= 1500:
         player.win_reason = "Consultant Victory: strong skills, network, and runway."
         player.game_over = True
-        say(f"▶ Victory! {player.win_reason}", color=Color.GREEN, bold=True)
-        print("You built enough stability to choose your clients and pace.")
+        ui.say("▶ Victory! {reason}", reason=player.win_reason, color=Color.GREEN, bold=True)
+        ui.line("You built enough stability to choose your clients and pace.")
 
-def check_loss(player: Player):
+def check_loss(player: Player, ui=HEADLESS):
     if player.any_stat_empty():
         player.loss_reason = "You ran out of a core resource (Energy, Money, or Confidence)."
         player.game_over = True
-        say(f"✖ This chapter ends. {player.loss_reason}", color=Color.RED, bold=True)
-        print("Running out doesn’t erase what you built. Carry it into the next run.")
-
-def show_actions(player: Player):
-    print("\nActions (1 per day):")
-    print("  1) Apply (Energy -2)  — Try for callbacks/offers")
-    print("  2) Network (Energy -2) — Chance for warm intro next Apply")
-    print("  3) Train (Energy -2)   — Improve a skill in your industry, +Confidence")
-    print("  4) Rest                — Recover Energy, small Confidence")
-    print("  5) Self-Care ($50)     — +Energy +Confidence")
-    print("  6) Interview Prep ($60, Energy -2) — Big boost to next interview")
+        ui.say("✖ This chapter ends. {reason}", reason=player.loss_reason, color=Color.RED, bold=True)
+        ui.line("Running out doesn’t erase what you built. Carry it into the next run.")
+
+ACTION_MENU = (
+    "\nActions (1 per day):\n"
+    "  1) Apply (Energy -2)  — Try for callbacks/offers\n"
+    "  2) Network (Energy -2) — Chance for warm intro next Apply\n"
+    "  3) Train (Energy -2)   — Improve a skill in your industry, +Confidence\n"
+    "  4) Rest                — Recover Energy, small Confidence\n"
+    "  5) Self-Care ($50)     — +Energy +Confidence\n"
+    "  6) Interview Prep ($60, Energy -2) — Big boost to next interview"
+)
+
+def show_actions(player: Player, ui=TERMINAL):
+    ui.line(ACTION_MENU)
     # Resource warnings near the menu
     upcoming_wrap = (player.day == 5)  # weekend next
-    warn_resources(player, upcoming_wrap=upcoming_wrap)
+    warn_resources(player, upcoming_wrap=upcoming_wrap, ui=ui)
 
-def weekend_wrap(player: Player):
-    say("\n— Weekend wrap —", color=Color.CYAN, bold=True)
-    weekly_costs(player)
-    random_weekly_event(player)
+def weekend_wrap(player: Player, rng: RunRNG, ui=HEADLESS):
+    ui.say("\n— Weekend wrap —", color=Color.CYAN, bold=True)
+    weekly_costs(player, ui)
+    random_weekly_event(player, rng, ui)
     player.week += 1
     player.day = 1
-    print(random.choice(AFTER_WEEK_WRAP))
+    ui.flavor(rng, AFTER_WEEK_WRAP)
     # Post-wrap warnings
-    warn_resources(player, upcoming_wrap=False)
+    warn_resources(player, upcoming_wrap=False, ui=ui)
+
+# -----------------------------
+# Headless engine
+# -----------------------------
+# Menu order matches the numbers typed at the prompt ("1" → apply, ...).
+ACTIONS = ("apply", "network", "train", "rest", "selfcare", "prep")
+
+ACTION_FUNCS = {
+    "apply": apply_flow,
+    "network": act_network,
+    "train": act_train,
+    "rest": act_rest,
+    "selfcare": act_selfcare,
+    "prep": act_interview_prep,
+}
+
+# Safety cap so a pathological policy can't spin forever in a headless run
+MAX_SIM_WEEKS = 260
+
+def take_turn(player: Player, action: Optional[str], rng: RunRNG, ui=HEADLESS):
+    """Play one weekday: the action, loss/victory checks, then the day advance.
+
+    ``action`` is a key of ACTION_FUNCS, or None for an invalid pick (the
+    checks still run but the day does not advance, same as the prompt).
+    """
+    did_action = action is not None
+    rng.at(player.week, player.day)
+    if did_action:
+        ACTION_FUNCS[action](player, rng, ui)
+
+    check_loss(player, ui)
+    if not player.game_over:
+        check_victory_conditions(player, ui)
+
+    if not player.game_over and did_action:
+        ui.pause()
+        player.day += 1
+        if player.day > 5:
+            weekend_wrap(player, rng, ui)
+
+@dataclass
+class RunResult:
+    seed: Optional[int]
+    age_bracket: str
+    industry: str
+    win_reason: Optional[str]
+    loss_reason: Optional[str]
+    week: int
+    day: int
+    turns: int
+    energy: int
+    money: int
+    confidence: int
+    contracts: int
+
+    @property
+    def won(self) -> bool:
+        return self.win_reason is not None
+
+    @property
+    def path(self) -> str:
+        """Short outcome label: the win path, "Loss", or "Unfinished"."""
+        if self.win_reason:
+            return self.win_reason.split(":")[0]
+        return "Loss" if self.loss_reason else "Unfinished"
+
+def random_policy(player: Player, rng) -> str:
+    return rng.choice(ACTIONS)
+
+def simulate_run(policy=None, seed: Optional[int] = None, age: str = "Young",
+                 industry: str = "Tech", *, max_weeks: int = MAX_SIM_WEEKS, rng=None) -> RunResult:
+    """Play one full run with no printing, pauses, or ANSI formatting.
+
+    ``policy(player, rng)`` returns an action key from ACTIONS each weekday;
+    it defaults to uniform random play and gets the run's ``policy`` stream.
+    The run draws only from its own RunRNG(seed), seeded like intro(), so a
+    seed plus the same action sequence reproduces an interactive run exactly,
+    whatever else is running. No flavor text is drawn. Passing ``rng`` (e.g.
+    a tape from job_search_tapes.py) replaces RunRNG(seed).
+    """
+    policy = policy or random_policy
+    odds_table()  # pick up any tunable changes since the last run
+    rng = rng or RunRNG(seed)
+    player = new_player(age, industry, rng)
+    turns = 0
+    while not player.game_over and player.week <= max_weeks:
+        rng.at(player.week, player.day)
+        take_turn(player, policy(player, rng.policy), rng)
+        turns += 1
+    return RunResult(
+        seed=seed,
+        age_bracket=player.age_bracket,
+        industry=player.start_industry,
+        win_reason=player.win_reason,
+        loss_reason=player.loss_reason,
+        week=player.week,
+        day=player.day,
+        turns=turns,
+        energy=player.energy,
+        money=player.money,
+        confidence=player.confidence,
+        contracts=player.contracts,
+    )
+
+# -----------------------------
+# Replay log
+# -----------------------------
+# A run is fully determined by its seed, age bracket, industry and the sequence
+# of picks, since every die is drawn from the run's RunRNG(seed). Picks pack
+# at 3 bits each: codes 0–5 index ACTIONS, NO_ACTION is an invalid pick (the
+# checks still run). A 16-bit state hash after each turn pins down the first
+# turn where a replay diverges.
+
+REPLAY_DIR = "replays"
+REPLAY_FORMAT = 2  # 2: separate play/events/flavor streams
+NO_ACTION = len(ACTIONS)
+ACTION_BITS = 3
+
+def state_hash(player: Player) -> int:
+    """16-bit digest of everything the rules read or write."""
+    key = (player.week, player.day, player.energy, player.money, player.confidence, player.resilience,
+           player.unemployed_weeks_paid, player.contracts, player.interview_prep_active, player.warm_intro,
+           player.mentor_boost, player.consecutive_rejections, player.game_over, player.win_reason,
+           player.loss_reason, list(zip(SKILL_TAGS, player.skills)))
+    return zlib.crc32(repr(key).encode()) & 0xFFFF
+
+def pack_actions(codes: List[int]) -> bytes:
+    bits = 0
+    for i, code in enumerate(codes):
+        bits |= code << (i * ACTION_BITS)
+    return bits.to_bytes((len(codes) * ACTION_BITS + 7) // 8, "little")
+
+def unpack_actions(data: bytes, count: int) -> List[int]:
+    bits = int.from_bytes(data, "little")
+    mask = (1 << ACTION_BITS) - 1
+    return [(bits >> (i * ACTION_BITS)) & mask for i in range(count)]
 
-def game_loop(player: Player):
+@dataclass
+class ReplayLog:
+    seed: int
+    age: str
+    industry: str
+    actions: List[int] = field(default_factory=list)  # one code per turn
+    hashes: List[int] = field(default_factory=list)   # state_hash() after each turn
+
+    def record(self, action: Optional[str], player: Player):
+        self.actions.append(NO_ACTION if action is None else ACTIONS.index(action))
+        self.hashes.append(state_hash(player))
+
+    def save(self, path: str):
+        doc = {
+            "format": REPLAY_FORMAT,
+            "seed": self.seed,
+            "age": self.age,
+            "industry": self.industry,
+            "turns": len(self.actions),
+            "actions": base64.b64encode(pack_actions(self.actions)).decode("ascii"),
+            "hashes": base64.b64encode(b"".join(h.to_bytes(2, "little") for h in self.hashes)).decode("ascii"),
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(doc, f)
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayLog":
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+        if doc.get("format") != REPLAY_FORMAT:
+            raise ValueError(f"unsupported replay format: {doc.get('format')!r}")
+        raw = base64.b64decode(doc["hashes"])
+        return cls(seed=doc["seed"], age=doc["age"], industry=doc["industry"],
+                   actions=unpack_actions(base64.b64decode(doc["actions"]), doc["turns"]),
+                   hashes=[int.from_bytes(raw[i:i + 2], "little") for i in range(0, len(raw), 2)])
+
+def save_replay(log: ReplayLog) -> Optional[str]:
+    """Write ``log`` under REPLAY_DIR; returns the path, or None if it can't be written."""
+    path = os.path.join(REPLAY_DIR, f"run-{time.strftime('%Y%m%d-%H%M%S')}-{log.seed}.json")
+    try:
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        log.save(path)
+    except OSError:
+        return None
+    return path
+
+def replay(log: ReplayLog) -> Tuple[Player, Optional[Tuple[int, int, int]]]:
+    """Re-run ``log`` headlessly. Returns the final player and, if the state hash
+    ever disagrees, (turn, week, day) of the first turn that did."""
+    rng = RunRNG(log.seed)
+    player = new_player(log.age, log.industry, rng)
+    player.seed = log.seed
+    for turn, (code, expected) in enumerate(zip(log.actions, log.hashes), 1):
+        week, day = player.week, player.day
+        take_turn(player, ACTIONS[code] if code < NO_ACTION else None, rng)
+        if state_hash(player) != expected:
+            return player, (turn, week, day)
+    return player, None
+
+def replay_main(path: str) -> int:
+    try:
+        log = ReplayLog.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Can't replay {path}: {e}")
+        return 2
+    odds_table()  # build outside the timing
+    t0 = time.perf_counter()
+    player, diverged = replay(log)
+    dt = time.perf_counter() - t0
+    if diverged:
+        turn, week, day = diverged
+        print(f"Replay diverged at turn {turn} (week {week}, day {day}).")
+        return 1
+    print(f"Replay OK: {len(log.actions)} turns in {dt * 1000:.1f} ms (seed {log.seed}, {log.age}/{log.industry}).")
+    print(player.status_line())
+    print("Result:", player.win_reason or player.loss_reason or "Unfinished")
+    return 0
+
+# -----------------------------
+# Advisor
+# -----------------------------
+# Optional panel (--advisor) under the action menu with each action's win
+# chance if the rest of the run is played at random. The chance that today's
+# action ends the run is worked out exactly from the odds table and the end-of-
+# day checks; the remainder comes from random-play rollouts that get past today.
+# Rollouts run on the advisor's own RunRNG, never the run's, and their tallies
+# are pooled per state key so a state seen again starts from what's known.
+# Each prompt gets a hard time budget.
+
+ADVISOR_BUDGET = 0.05      # seconds of rollouts per prompt
+ADVISOR_ROLLOUTS = 1000    # per state and action; a full pool answers instantly
+ADVISOR_MONEY_STEP = 25    # balances this close pool their rollouts
+ADVISOR_STATES = 20_000    # pooled states kept, least recently used dropped first
+
+class _Forced:
+    """Stand-in for a RunRNG stream (and the RunRNG itself) whose draws are fixed."""
+    def __init__(self, roll: float = 1.0, pick: int = 0):
+        self.roll, self.pick = roll, pick
+        self.setup = self.emotion = self.apply = self.train = self.network = self.mentor = self
+
+    def random(self) -> float:
+        return self.roll
+
+    def choice(self, seq):
+        return seq[self.pick]
+
+def _day_end(player: Player) -> Optional[str]:
+    """"win", "loss" or None after take_turn()'s loss and victory checks; changes ``player``."""
+    check_loss(player)
+    if not player.game_over:
+        check_victory_conditions(player)
+    return "win" if player.win_reason else "loss" if player.loss_reason else None
+
+def _apply_day_odds(player: Player) -> Tuple[float, float]:
+    table = odds_table()
+    n = table.n_emotions
+    match = player.industry_skill_match(player.target_industry)
+    pity = player.consecutive_rejections >= 3
+    win = contract = 0.0
+    for e in range(n):
+        callback, offer, dream = table.entries[table.index(
+            player.confidence, match, player.warm_intro, player.interview_prep_active, player.mentor_boost, pity, e)]
+        win += callback * dream / n
+        contract += callback * (min(dream + offer, 1.0) - dream) / n
+    rest = 1.0 - win - contract
+    loss = 0.0
+
+    # A rejection, with or without a callback first
+    q = player.clone()
+    q.energy -= APPLY_COST_ENERGY
+    q.confidence = max(CONFIDENCE_FLOOR, q.confidence - max(1, int(REJECTION_CONFIDENCE_LOSS - q.resilience)))
+    end = _day_end(q)
+    win += rest if end == "win" else 0.0
+    loss += rest if end == "loss" else 0.0
+
+    # A contract: offer_received()'s randint(200, 500)
+    pays = range(200, 501)
+    for pay in pays:
+        q = player.clone()
+        q.energy -= APPLY_COST_ENERGY
+        q.contracts += 1
+        q.money += pay
+        q.confidence += 2
+        end = _day_end(q)
+        if end == "win":
+            win += contract / len(pays)
+        elif end == "loss":
+            loss += contract / len(pays)
+    return win, loss
+
+def day_odds(player: Player, action: str) -> Tuple[float, float]:
+    """Exact chances that taking ``action`` today ends the run in a win, and in a loss."""
+    if action == "apply" and player.energy >= APPLY_COST_ENERGY:
+        return _apply_day_odds(player)
+    # Only training's tag pick can change how the day's checks come out
+    picks = range(len(INDUSTRY_TAGS[player.target_industry])) if action == "train" else (0,)
+    win = loss = 0.0
+    for pick in picks:
+        q = player.clone()
+        ACTION_FUNCS[action](q, _Forced(pick=pick))
+        end = _day_end(q)
+        win += (end == "win") / len(picks)
+        loss += (end == "loss") / len(picks)
+    return win, loss
+
+def advice_key(player: Player) -> tuple:
+    """What the advisor pools rollouts by: the state, with money rounded and only the rent phase of the week.
+
+    Industries in the same INDUSTRY_CLASS share pools.
+    """
+    industry = player.target_industry
+    return (player.age_bracket, INDUSTRY_CLASS[industry], player.week % RENT_CYCLE_WEEKS,
+            min(player.unemployed_weeks_paid, UNEMPLOY_WEEKS_MAX), player.day, player.energy,
+            player.money // ADVISOR_MONEY_STEP, player.confidence,
+            round(player.resilience / RESILIENCE_GAIN_ON_REJECT), min(player.consecutive_rejections, 3),
+            player.contracts, player.warm_intro, player.interview_prep_active, player.mentor_boost,
+            canonical_bits(industry, player.skill_bits), canonical_bits(industry, player.strong_bits))
+
+@dataclass
+class Advice:
+    action: str
+    win: float     # estimated win chance if the rest of the run is played at random
+    margin: float  # 95% half-width of ``win``; 0.0 when it's exact
+    rollouts: int
+
+class Advisor:
+    """Per-action win chances for the advisor panel, within ``budget`` seconds per call.
+
+    ``policy(player, rng)`` plays the rollouts after today, as in simulate_run().
+    """
+    def __init__(self, budget: float = ADVISOR_BUDGET, *, seed: Optional[int] = None, policy=None,
+                 max_rollouts: int = ADVISOR_ROLLOUTS):
+        self.budget = budget
+        self.rng = RunRNG(seed)
+        self.policy = policy or random_policy
+        self.max_rollouts = max_rollouts
+        self.pool = {}  # advice_key → [[wins, rollouts] per action]; dicts keep insertion order
+
+    def tallies(self, player: Player) -> List[List[int]]:
+        key = advice_key(player)
+        tally = self.pool.pop(key, None) or [[0, 0] for _ in ACTIONS]
+        self.pool[key] = tally
+        if len(self.pool) > ADVISOR_STATES:
+            del self.pool[next(iter(self.pool))]
+        return tally
+
+    def rollout(self, player: Player, action: str) -> Optional[bool]:
+        """Play ``action`` then the policy to the end; None if the run ended today."""
+        rng = self.rng
+        p = player.clone()
+        take_turn(p, action, rng)
+        if p.game_over:
+            return None
+        while not p.game_over and p.week <= MAX_SIM_WEEKS:
+            take_turn(p, self.policy(p, rng.policy), rng)
+        return p.win_reason is not None
+
+    def advise(self, player: Player) -> List[Advice]:
+        odds_table()  # a rebuild isn't part of the budget; game_loop() builds it before the first prompt
+        deadline = time.perf_counter() + self.budget
+        ends = [day_odds(player, action) for action in ACTIONS]
+        tally = self.tallies(player)
+        todo = [i for i, (win, loss) in enumerate(ends) if win + loss < 1.0 - 1e-12]
+        turn = 0
+        while todo and time.perf_counter() < deadline:
+            i = todo[turn % len(todo)]
+            if tally[i][1] >= self.max_rollouts:
+                todo.remove(i)
+                continue
+            turn += 1
+            won = self.rollout(player, ACTIONS[i])
+            if won is not None:
+                tally[i][0] += won
+                tally[i][1] += 1
+        out = []
+        for action, (win, loss), (wins, runs) in zip(ACTIONS, ends, tally):
+            go_on = max(0.0, 1.0 - win - loss)
+            p = wins / runs if runs else 0.5
+            margin = go_on * (1.96 * (p * (1 - p) / runs) ** 0.5 if runs else 0.5)
+            out.append(Advice(action, win + go_on * p, margin if go_on > 1e-12 else 0.0, runs))
+        return out
+
+def show_advice(player: Player, advisor: Advisor, ui=TERMINAL):
+    advice = advisor.advise(player)
+    best = max(range(len(advice)), key=lambda i: advice[i].win)
+    ui.say("Advisor — win chance if you then play at random:", color=Color.CYAN, bold=True)
+    for i, a in enumerate(advice):
+        ui.line("  {n}) {action:<9}{win:5.0%} ±{margin:.0%}{best}", n=i + 1, action=a.action.capitalize(),
+                win=a.win, margin=a.margin, best="  ◀" if i == best else "")
+
+def game_loop(player: Player, rng: RunRNG, advisor: Optional[Advisor] = None):
+    odds_table()
+    ui = TERMINAL
+    log = ReplayLog(player.seed, player.age_bracket, player.start_industry)
     while not player.game_over:
-        say("\n" + "=" * 48, color=Color.CYAN, bold=True)
-        print(player.status_line())
-        show_actions(player)
+        ui.say("\n" + "=" * 48, color=Color.CYAN, bold=True)
+        ui.line(player.status_line())
+        show_actions(player, ui)
+        if advisor:
+            show_advice(player, advisor, ui)
         try:
-            choice = input("> ").strip()
+            choice = ui.ask("> ").strip()
         except EOFError:
             break
 
-        did_action = False
-
-        if choice == "1":
-            apply_flow(player); did_action = True
-        elif choice == "2":
-            act_network(player); did_action = True
-        elif choice == "3":
-            act_train(player); did_action = True
-        elif choice == "4":
-            act_rest(player); did_action = True
-        elif choice == "5":
-            act_selfcare(player); did_action = True
-        elif choice == "6":
-            act_interview_prep(player); did_action = True
+        action = None
+        if choice in ("1", "2", "3", "4", "5", "6"):
+            action = ACTIONS[int(choice) - 1]
         else:
-            say("Pick 1–6.", color=Color.YELLOW, bold=True)
+            ui.say("Pick 1–6.", color=Color.YELLOW, bold=True)
 
-        check_loss(player)
-        if not player.game_over:
-            check_victory_conditions(player)
-
-        if not player.game_over and did_action:
-            action_pause()
-            player.day += 1
-            if player.day > 5:
-                weekend_wrap(player)
+        take_turn(player, action, rng, ui)
+        log.record(action, player)
 
     # Exit screen and option to restart
-    say("\n=== Run Summary ===", bold=True)
-    print(player.status_line())
+    ui.say("\n=== Run Summary ===", bold=True)
+    ui.line(player.status_line())
     if player.win_reason:
-        print("Result:", player.win_reason)
-        print("This journey wasn’t easy — you faced uncertainty and kept going. Well done.")
+        ui.line("Result: " + player.win_reason)
+        ui.line("This journey wasn’t easy — you faced uncertainty and kept going. Well done.")
     elif player.loss_reason:
-        print("Result:", player.loss_reason)
-        print("You applied, learned, and built resilience. You’re not starting from zero next time.")
-
-def start_game():
+        ui.line("Result: " + player.loss_reason)
+        ui.line("You applied, learned, and built resilience. You’re not starting from zero next time.")
+    if log.actions and player.seed is not None:
+        path = save_replay(log)
+        if path:
+            ui.line(f"Replay saved to {path} (play it back with --replay {path})")
+    ui.flush()
+
+def start_game(advisor: Optional[Advisor] = None):
     title_screen()
     while True:
         try:
-            p = intro()
-            game_loop(p)
+            p, rng = intro()
+            game_loop(p, rng, advisor)
             ans = input("\nStart a new run? (y/n): ").strip().lower()
         except EOFError:
             ans = "n"
@@ -687,8 +1436,14 @@ def start_game():
     press_any_key_to_exit()
 
 def main():
+    ap = argparse.ArgumentParser(description="Job Search Roguelike v0.5.1e")
+    ap.add_argument("--replay", metavar="FILE", help="re-run a saved replay headlessly and verify it")
+    ap.add_argument("--advisor", action="store_true", help="show each action's estimated win chance at every prompt")
+    args = ap.parse_args()
+    if args.replay:
+        sys.exit(replay_main(args.replay))
     try:
-        start_game()
+        start_game(Advisor() if args.advisor else None)
     except KeyboardInterrupt:
         print("\nInterrupted.")
         press_any_key_to_exit()
@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — rulesets for every released version
+# One lean simulation core (no printing, one explicit random.Random per run)
+# with a pluggable ruleset per frozen script, V0 through v0.5.1e. Each ruleset
+# reads its balance knobs from its own script at construction, and encodes the
+# rule code of that release: turn structure, events and win paths. The current
+# Gentle Mode script has no ruleset: "gentle" plays game.simulate_run() itself,
+# so a rule edit there can't leave a stale copy behind.
+#
+#   python job_search_batch.py --version all --runs 20000
+
+import abc
+import importlib
+import random
+from typing import Dict, Optional, Tuple
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+# Safety cap on actions per run, for policies that never end a week in the
+# versions where "End week" is an action of its own.
+MAX_TURNS = 10_000
+
+
+class State:
+    """Run state shared by every ruleset. Field names follow game.Player, so
+    policies written for simulate_run() can read it too."""
+    __slots__ = ("age_bracket", "start_industry", "target_industry", "week", "day", "energy", "money",
+                 "confidence", "resilience", "unemployed_weeks_paid", "contracts", "skills",
+                 "interview_prep_active", "warm_intro", "mentor_boost", "consecutive_rejections",
+                 "leads", "game_over", "win_reason", "loss_reason")
+
+    def __init__(self, age: str, start: str, target: str, energy: int, money: int, confidence: int):
+        self.age_bracket, self.start_industry, self.target_industry = age, start, target
+        self.week, self.day = 1, 1
+        self.energy, self.money, self.confidence = energy, money, confidence
+        self.resilience = 0.0
+        self.unemployed_weeks_paid = self.contracts = self.consecutive_rejections = self.leads = 0
+        self.skills: Dict[str, int] = {}
+        self.interview_prep_active = self.warm_intro = self.mentor_boost = False
+        self.game_over = False
+        self.win_reason: Optional[str] = None
+        self.loss_reason: Optional[str] = None
+
+    def any_stat_empty(self) -> bool:
+        return self.energy <= 0 or self.money <= 0 or self.confidence <= 0
+
+    def win(self, reason: str):
+        self.win_reason = reason
+        self.game_over = True
+
+    def lose(self, reason: str):
+        self.loss_reason = reason
+        self.game_over = True
+
+
+def clamp(v, lo, hi):
+    return max(lo, min(hi, v))
+
+
+class Ruleset(abc.ABC):
+    """Base for one released version. ``script`` names the game script whose
+    module-level knobs the ruleset snapshots in setup()."""
+    name = ""
+    script = ""
+    actions: Tuple[str, ...] = ()
+    pivots = False  # whether new_state() honours a target industry other than the start one
+
+    def __init__(self):
+        self.setup(importlib.import_module(self.script))
+        self._act = {a: getattr(self, "act_" + a) for a in self.actions}
+
+    def setup(self, m):
+        pass
+
+    @abc.abstractmethod
+    def new_state(self, age: str, industry: str, target: str, rng: random.Random) -> State:
+        """A fresh run's state, as the release's new_player() built it."""
+
+    @abc.abstractmethod
+    def turn(self, s: State, action: str, rng: random.Random):
+        """Play one action, then the release's end-of-turn checks."""
+
+
+# -----------------------------
+# V0: 0–100 stats, one action per week, generated jobs
+# -----------------------------
+
+class V0Rules(Ruleset):
+    name = "V0"
+    script = "job_search_roguelike_V0"
+    actions = ("apply", "network", "train", "rest")
+
+    JOB_SKILLS = ["Excel", "Coding", "Writing", "Negotiation", "Project", "Compliance"]
+    JOB_TITLES = ["Analyst", "Associate", "Coordinator", "Manager"]
+    TRAINING = [("Excel", 150), ("Coding", 400), ("Negotiation", 200), ("Compliance", 100), ("Project", 150)]
+
+    def setup(self, m):
+        self.threshold = m.salary_threshold()
+
+    def new_state(self, age, industry, target, rng):
+        s = State(age, industry, target, energy=70, money=2000, confidence=60)
+        s.skills = {"Writing": 1}
+        return s
+
+    def act_apply(self, s, rng):
+        s.energy -= 8
+        salary = rng.randint(50000, 150000)
+        overlap = len(set(rng.sample(self.JOB_SKILLS, k=2)) & s.skills.keys())
+        rng.choice(self.JOB_TITLES)
+        cb = int(clamp(20 + overlap * 15 + (s.confidence - 50) * 0.2, 5, 80))
+        if rng.random() < cb / 100.0:
+            hm = int(clamp(40 + overlap * 15 + (s.confidence - 50) * 0.2, 10, 90))
+            panel = int(clamp(35 + (s.energy - 50) * 0.1, 5, 95))
+            if rng.random() < hm / 100.0 and rng.random() < panel / 100.0:
+                if salary >= self.threshold:
+                    s.win(f"Dream Job: ${salary} offer")
+                else:
+                    s.money += salary // 26
+                    s.confidence = clamp(s.confidence + 5, 0, 100)
+            else:
+                s.confidence = clamp(s.confidence - 5, 0, 100)
+        else:
+            s.confidence = clamp(s.confidence - 3, 0, 100)
+
+    def act_network(self, s, rng):
+        s.energy -= 6
+        s.leads = clamp(s.leads + rng.choice([0, 1, 1, 2]), 0, 5)
+        s.confidence = clamp(s.confidence + rng.choice([+1, +2, -1]), 0, 100)
+
+    def act_train(self, s, rng):
+        s.energy -= 8
+        skill, cost = rng.choice(self.TRAINING)
+        if s.money < cost:
+            return
+        s.money -= cost
+        s.skills[skill] = 1
+        s.confidence = clamp(s.confidence + 2, 0, 100)
+
+    def act_rest(self, s, rng):
+        s.energy = clamp(s.energy + rng.randint(10, 20), 0, 100)
+        s.confidence = clamp(s.confidence + 1, 0, 100)
+
+    def turn(self, s, action, rng):
+        # main() runs bills and the end check at the top of each week; here they
+        # close out the week the action was taken in, which is the same order.
+        self._act[action](s, rng)
+        if s.game_over:
+            return
+        s.week += 1
+        if s.week % 4 == 0:
+            s.money -= 1000
+        if s.money <= -100:
+            s.lose("Evicted (money).")
+        elif s.energy <= 0:
+            s.lose("Burnout (energy).")
+        elif s.confidence <= 0:
+            s.lose("Gave up (confidence).")
+
+
+# -----------------------------
+# v0.1–v0.5: "End week" is an action; any other action is free of the calendar
+# -----------------------------
+
+class V01Rules(Ruleset):
+    """v0.1: age brackets, industries, an offer wins outright."""
+    name = "v0.1"
+    script = "job_search_roguelike_v01"
+    actions = ("apply", "network", "train", "rest", "end_week")
+    pivots = True
+    REJECT_NO_CALLBACK = 4
+    REJECT_AFTER_CALLBACK = 3
+
+    def setup(self, m):
+        self.bills = dict(m.BILLS_BY_AGE)
+        self.tags = {name: sorted(ind["skills"]) for name, ind in m.INDUSTRIES.items()}
+        self.base_callback = m.BASE_CALLBACK_ODDS
+        self.base_offer = m.BASE_OFFER_ODDS
+        self.conf_callback = self.conf_offer = getattr(m, "CONF_SCALE", None)
+        self.skill_bonus = m.SKILL_MATCH_BONUS
+
+    def new_state(self, age, industry, target, rng):
+        s = State(age, industry, target, energy=10, money=400, confidence=10)
+        s.skills = {t: 1 for t in self.tags[industry]}
+        return s
+
+    def match(self, s) -> int:
+        return sum(s.skills.get(t, 0) > 0 for t in self.tags[s.target_industry])
+
+    def emotion(self, rng) -> float:
+        return 0.0
+
+    def offer_won(self, s, r, offer_odds, rng) -> bool:
+        """Resolve an interview; True if it ended the run or paid out."""
+        if r < offer_odds:
+            s.win(f"Job Offer: {s.target_industry}")
+            return True
+        return False
+
+    def rejection(self, s, loss, rng):
+        s.confidence -= loss
+
+    def act_apply(self, s, rng):
+        if s.energy < 2:
+            return
+        s.energy -= 2
+        mod = self.emotion(rng)
+        m = self.match(s)
+        cb = clamp(self.base_callback + s.confidence * self.conf_callback + m * self.skill_bonus + mod * 0.5,
+                   0.02, 0.9)
+        if rng.random() < cb:
+            offer = clamp(self.base_offer + s.confidence * self.conf_offer + m * self.skill_bonus + mod, 0.02, 0.85)
+            if not self.offer_won(s, rng.random(), offer, rng):
+                self.rejection(s, self.REJECT_AFTER_CALLBACK, rng)
+        else:
+            self.rejection(s, self.REJECT_NO_CALLBACK, rng)
+
+    def act_network(self, s, rng):
+        if s.energy < 2:
+            return
+        s.energy -= 2
+        s.confidence += 1
+
+    def act_train(self, s, rng):
+        if s.energy < 2:
+            return
+        s.energy -= 2
+        tag = rng.choice(self.tags[s.target_industry])
+        s.skills[tag] = s.skills.get(tag, 0) + 1
+        s.confidence += 1
+
+    def act_rest(self, s, rng):
+        s.energy += 4
+        s.confidence += 1
+
+    def weekly(self, s, rng):
+        s.money -= self.bills[s.age_bracket]
+        r = rng.random()
+        if r < 0.33:
+            s.money -= rng.randint(20, 60)
+        elif r < 0.66:
+            s.money += rng.randint(20, 60)
+        else:
+            s.confidence += 1
+
+    def act_end_week(self, s, rng):
+        self.weekly(s, rng)
+        s.week += 1
+
+    def check_wins(self, s):
+        pass
+
+    def turn(self, s, action, rng):
+        self._act[action](s, rng)
+        # A win from the action stands even if a stat also hit zero
+        if s.any_stat_empty() and not s.game_over:
+            s.lose("A core stat hit zero.")
+        if not s.game_over:
+            self.check_wins(s)
+
+
+class V02Rules(V01Rules):
+    """v0.2: recruiter emotions, richer weekly events."""
+    name = "v0.2"
+    script = "job_search_roguelike_v02"
+    REJECT_AFTER_CALLBACK = 4
+    GIG = ((60, 140), 2)
+
+    def setup(self, m):
+        super().setup(m)
+        self.emotion_mods = [e[1] for e in m.RECRUITER_EMOTIONS]
+
+    def emotion(self, rng):
+        return rng.choice(self.emotion_mods)
+
+    def event(self, s, rng):
+        r = rng.random()
+        if r < 0.33:
+            s.money -= rng.randint(40, 120)
+        elif r < 0.66:
+            (lo, hi), energy = self.GIG
+            s.money += rng.randint(lo, hi)
+            s.energy = max(0, s.energy - energy)
+        else:
+            s.money += rng.randint(20, 80)
+            s.confidence += rng.randint(1, 3)
+
+    def weekly(self, s, rng):
+        s.money -= self.bills[s.age_bracket]
+        self.event(s, rng)
+
+
+class V03Rules(V02Rules):
+    """v0.3: 6-week rent, unemployment benefit, resilience, 26-week survival win."""
+    name = "v0.3"
+    script = "job_search_roguelike_v03"
+    GIG = ((70, 150), 3)
+
+    def setup(self, m):
+        super().setup(m)
+        self.rent = dict(m.RENT_BY_AGE)
+        self.rent_cycle = m.RENT_CYCLE_WEEKS
+        self.benefit, self.benefit_weeks = m.UNEMPLOY_BENEFIT, m.UNEMPLOY_WEEKS_MAX
+        self.weeks_to_survive = getattr(m, "WEEKS_TO_SURVIVE", None)
+        self.reject_loss = getattr(m, "REJECTION_CONF_LOSS", None) or m.REJECTION_CONFIDENCE_LOSS
+        self.resilience_gain = getattr(m, "RESILIENCE_GAIN", None) or m.RESILIENCE_GAIN_ON_REJECT
+
+    def rejection(self, s, loss, rng):
+        # Resilience replaces the fixed per-path loss from here on
+        s.confidence -= max(1, int(self.reject_loss - s.resilience))
+        s.resilience += self.resilience_gain
+
+    def weekly(self, s, rng):
+        s.money -= self.bills[s.age_bracket]
+        if s.week % self.rent_cycle == 0:
+            s.money -= self.rent[s.age_bracket]
+        if s.unemployed_weeks_paid < self.benefit_weeks:
+            s.money += self.benefit
+            s.unemployed_weeks_paid += 1
+        self.event(s, rng)
+
+    def check_wins(self, s):
+        if s.week > self.weeks_to_survive:
+            s.win(f"Survival Victory: {self.weeks_to_survive} weeks")
+
+
+class V04Rules(V03Rules):
+    """v0.4: contracts, a dream slice of each offer, Portfolio/Pivot/Consultant wins."""
+    name = "v0.4"
+    script = "job_search_roguelike_v04"
+
+    def setup(self, m):
+        super().setup(m)
+        self.portfolio = m.PORTFOLIO_TARGET
+
+    def offer_won(self, s, r, offer_odds, rng):
+        if r < offer_odds * 0.35:
+            s.win(f"Dream Offer: {s.target_industry}")
+        elif r < offer_odds:
+            s.contracts += 1
+            s.money += rng.randint(200, 500)
+            s.confidence += 2
+        else:
+            return False
+        return True
+
+    def check_wins(self, s):
+        if s.week > self.weeks_to_survive:
+            s.win(f"Survival Victory: {self.weeks_to_survive} weeks")
+        elif s.contracts >= self.portfolio:
+            s.win(f"Portfolio Victory: {s.contracts} contracts")
+        elif s.contracts >= 1 and s.target_industry != s.start_industry:
+            s.win(f"Pivot Victory: broke into {s.target_industry}")
+        elif s.confidence >= 16 and sum(v >= 2 for v in s.skills.values()) >= 4 and s.money >= 1500:
+            s.win("Consultant Victory: skills+network+savings")
+
+
+class V05Rules(V04Rules):
+    """v0.5: self-care, interview prep, warm intros, separate dream odds."""
+    name = "v0.5"
+    script = "job_search_roguelike_v05"
+    actions = ("apply", "network", "train", "rest", "selfcare", "prep", "end_week")
+    WARM_BONUS = 0.10
+    CALLBACK_FLOOR = 0.01
+
+    def setup(self, m):
+        super().setup(m)
+        self.conf_callback, self.conf_offer = m.CONF_CALLBACK_SCALE, m.CONF_OFFER_SCALE
+        self.warm_chance = m.NETWORK_WARM_INTRO_CHANCE
+        self.prep_boost = m.INTERVIEW_PREP_TEMP_BOOST
+        self.prep_money, self.prep_energy = m.INTERVIEW_PREP_COST_MONEY, m.INTERVIEW_PREP_COST_ENERGY
+        self.care_money, self.care_energy, self.care_conf = (
+            m.SELF_CARE_COST_MONEY, m.SELF_CARE_GAIN_ENERGY, m.SELF_CARE_GAIN_CONF)
+        self.rest_gain = m.REST_GAIN_ENERGY
+        self.apply_energy, self.network_energy, self.train_energy = (
+            m.APPLY_COST_ENERGY, m.NETWORK_COST_ENERGY, m.TRAIN_COST_ENERGY)
+        self.train_gain = m.TRAIN_GAIN_SKILL
+        self.bill_range, self.gig_range, self.gig_energy = (
+            m.SURPRISE_BILL_RANGE, m.TEMP_GIG_MONEY_REWARD, m.TEMP_GIG_ENERGY_COST)
+        self.news_money, self.news_conf = m.SMALL_GOOD_NEWS_MONEY, m.SMALL_GOOD_NEWS_CONF
+
+    def dream_odds(self, m, s):
+        return clamp(0.03 + (0.08 if (m >= 2 and s.confidence >= 14) else 0.0), 0.0, 0.35)
+
+    def callback_extra(self, s) -> float:
+        return self.WARM_BONUS if s.warm_intro else 0.0
+
+    def clear_flags(self, s):
+        s.warm_intro = False
+        s.interview_prep_active = False
+
+    def contract(self, s, rng):
+        s.contracts += 1
+        s.money += rng.randint(200, 500)
+        s.confidence += 2
+
+    def act_apply(self, s, rng):
+        if s.energy < self.apply_energy:
+            return
+        s.energy -= self.apply_energy
+        mod = rng.choice(self.emotion_mods)
+        m = self.match(s)
+        cb = clamp(self.base_callback + s.confidence * self.conf_callback + m * self.skill_bonus
+                   + self.callback_extra(s) + mod * 0.5, self.CALLBACK_FLOOR, 0.90)
+        prep = self.prep_boost if s.interview_prep_active else 0.0
+        self.clear_flags(s)
+        if rng.random() < cb:
+            self.on_callback(s)
+            offer = clamp(self.base_offer + s.confidence * self.conf_offer + m * self.skill_bonus + prep + mod,
+                          0.02, 0.85)
+            dream = self.dream_odds(m, s)
+            r = rng.random()
+            if r < dream:
+                s.win(f"Landed Dream Job: {s.target_industry}")
+            elif r < dream + offer:
+                self.contract(s, rng)
+            else:
+                self.rejection(s, 0, rng)
+        else:
+            self.rejection(s, 0, rng)
+
+    def on_callback(self, s):
+        pass
+
+    def act_network(self, s, rng):
+        if s.energy < self.network_energy:
+            return
+        s.energy -= self.network_energy
+        s.confidence += 1
+        if rng.random() < self.warm_chance:
+            s.warm_intro = True
+
+    def act_train(self, s, rng):
+        if s.energy < self.train_energy:
+            return
+        s.energy -= self.train_energy
+        tag = rng.choice(self.tags[s.target_industry])
+        s.skills[tag] = s.skills.get(tag, 0) + self.train_gain
+        s.confidence += 1
+
+    def act_rest(self, s, rng):
+        s.energy += self.rest_gain
+        s.confidence = clamp(s.confidence + 1, 0, 99)
+
+    def act_selfcare(self, s, rng):
+        if s.money < self.care_money:
+            return
+        s.money -= self.care_money
+        s.energy += self.care_energy
+        s.confidence += self.care_conf
+
+    def act_prep(self, s, rng):
+        if s.money < self.prep_money or s.energy < self.prep_energy:
+            return
+        s.money -= self.prep_money
+        s.energy -= self.prep_energy
+        s.interview_prep_active = True
+
+    EVENT_ODDS = (0.25, 0.50)
+
+    def event(self, s, rng):
+        r = rng.random()
+        if r < self.EVENT_ODDS[0]:
+            s.money -= rng.randint(*self.bill_range)
+        elif r < self.EVENT_ODDS[1]:
+            s.money += rng.randint(*self.gig_range)
+            s.energy = max(0, s.energy - self.gig_energy)
+            self.gig_bonus(s, rng)
+        else:
+            s.money += rng.randint(*self.news_money)
+            s.confidence += rng.randint(*self.news_conf)
+
+    def gig_bonus(self, s, rng):
+        pass
+
+    def turn(self, s, action, rng):
+        self._act[action](s, rng)
+        if s.any_stat_empty():
+            s.lose("You ran out of a core stat (Energy, Money, or Confidence).")
+        if not s.game_over:
+            self.check_wins(s)
+
+
+# -----------------------------
+# v0.5.1e: one action per weekday, weekends wrap automatically
+# -----------------------------
+
+class V051eRules(V05Rules):
+    """v0.5.1e: 5-day weeks, streak assist, mentor boosts, age trade-offs, Freelance win."""
+    name = "v0.5.1e"
+    script = "job_search_roguelike_v05_1e"
+    actions = game.ACTIONS
+    pivots = False
+    WARM_BONUS = 0.15
+    EVENT_ODDS = (0.15, 0.50)
+
+    def setup(self, m):
+        super().setup(m)
+        self.base_dream, self.dream_strong = m.BASE_DREAM_ODDS, m.DREAM_BONUS_STRONG
+        self.conf_floor = m.CONFIDENCE_FLOOR
+
+    def new_state(self, age, industry, target, rng):
+        s = State(age, industry, industry, energy=10, money=400, confidence=10)
+        s.skills = {t: 1 for t in self.tags[industry]}
+        if age == "Mid":
+            s.skills[rng.choice(self.tags[industry])] += 1
+            s.confidence += 1
+        elif age == "Late":
+            tags = list(self.tags[industry])
+            rng.shuffle(tags)
+            for t in tags[:2]:
+                s.skills[t] += 1
+            s.confidence += 2
+            s.money += 100
+        return s
+
+    def dream_odds(self, m, s):
+        return clamp(self.base_dream + (self.dream_strong if (m >= 2 and s.confidence >= 14) else 0.0), 0.0, 0.35)
+
+    def callback_extra(self, s):
+        return ((self.WARM_BONUS if s.warm_intro else 0.0) + (0.07 if s.mentor_boost else 0.0)
+                + (0.10 if s.consecutive_rejections >= 3 else 0.0))
+
+    def clear_flags(self, s):
+        s.warm_intro = s.interview_prep_active = s.mentor_boost = False
+
+    def on_callback(self, s):
+        s.consecutive_rejections = 0
+
+    def rejection(self, s, loss, rng):
+        s.confidence = max(self.conf_floor, s.confidence - max(1, int(self.reject_loss - s.resilience)))
+        s.resilience += self.resilience_gain
+        s.consecutive_rejections += 1
+        if rng.random() < 0.25:
+            s.mentor_boost = True
+
+    def gig_bonus(self, s, rng):
+        if rng.random() < 0.25:
+            s.confidence += 1
+
+    def check_wins(self, s):
+        if s.contracts >= self.portfolio:
+            s.win(f"Sustainable Freelance Career: {s.contracts} contracts.")
+        elif s.confidence >= 16 and sum(v >= 2 for v in s.skills.values()) >= 4 and s.money >= 1500:
+            s.win("Consultant Victory: strong skills, network, and runway.")
+
+    def turn(self, s, action, rng):
+        # game.take_turn(): the action, loss check, victory check, then the day advances
+        self._act[action](s, rng)
+        if s.any_stat_empty():
+            s.lose("You ran out of a core resource (Energy, Money, or Confidence).")
+        if not s.game_over:
+            self.check_wins(s)
+        if not s.game_over:
+            s.day += 1
+            if s.day > 5:
+                self.weekly(s, rng)
+                s.week += 1
+                s.day = 1
+
+
+VERSIONS = {r.name: r for r in (V0Rules, V01Rules, V02Rules, V03Rules, V04Rules, V05Rules, V051eRules)}
+
+# The current script, played by game.simulate_run() rather than a ruleset
+CURRENT = "gentle"
+NAMES = tuple(VERSIONS) + (CURRENT,)
+
+
+def get_ruleset(version: str) -> Optional[Ruleset]:
+    """A fresh ruleset for ``version``, with knobs read from its script as they stand now.
+
+    None for CURRENT: the game script is its own engine.
+    """
+    return None if version == CURRENT else VERSIONS[version]()
+
+
+def simulate(rules: Ruleset, policy=None, seed: Optional[int] = None, age: str = "Young",
+             industry: str = "Tech", *, target: Optional[str] = None,
+             max_weeks: int = game.MAX_SIM_WEEKS) -> game.RunResult:
+    """Play one run under ``rules``; the rules-agnostic twin of game.simulate_run().
+
+    ``policy(state, rng)`` returns one of ``rules.actions``; the default picks
+    uniformly. ``target`` is the industry applied to (defaults to ``industry``;
+    only v0.1–v0.5 let it differ, which is what unlocks their Pivot win).
+    """
+    rng = random.Random(seed)
+    s = rules.new_state(age, industry, target or industry, rng)
+    actions = rules.actions
+    turns = 0
+    while not s.game_over and s.week <= max_weeks and turns < MAX_TURNS:
+        rules.turn(s, policy(s, rng) if policy else rng.choice(actions), rng)
+        turns += 1
+    return game.RunResult(
+        seed=seed,
+        age_bracket=s.age_bracket,
+        industry=s.start_industry,
+        win_reason=s.win_reason,
+        loss_reason=s.loss_reason,
+        week=s.week,
+        day=s.day,
+        turns=turns,
+        energy=s.energy,
+        money=s.money,
+        confidence=s.confidence,
+        contracts=s.contracts,
+    )
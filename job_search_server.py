@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — asyncio session server (v0.5.1e Gentle Mode rules)
+# Hosts many games at once over a plain line protocol, so a workshop can play
+# with `nc HOST PORT`. Every connection drives its own Player through the
+# headless engine; only reading the next line waits, and a turn itself never
+# blocks, so one core serves thousands of sessions. Each frame the server
+# sends ends with a prompt line "> ".
+#
+#   python job_search_server.py serve --port 7777
+#   python job_search_server.py loadtest --sessions 2000 --games 2
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List, Optional, Sequence
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+PROMPT = "> "
+IDLE_TIMEOUT = 30 * 60  # seconds a session may sit at a prompt before it's closed
+BACKLOG = 4096          # pending connections; the default of 100 drops bursts of joins
+
+
+class SessionUI(game.TerminalUI):
+    """TerminalUI that hands its frame back instead of writing it to stdout.
+
+    pause() is a no-op: the next prompt already waits for the player.
+    """
+    def take(self, tail: str = "") -> str:
+        text = "".join(self._buf) + tail
+        self._buf.clear()
+        return text
+
+    def frame(self) -> bytes:
+        """Pending output plus the prompt line, as sent to the client."""
+        text = self.take()
+        if not text.endswith("\n"):
+            text += "\n"
+        return (text + PROMPT).encode()
+
+    def pause(self):
+        pass
+
+
+class Session:
+    """One connection's game: the same screens as intro() and game_loop(), over a socket.
+
+    Each run rolls its own RunRNG, so sessions never touch each other's dice.
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.ui = SessionUI()
+
+    async def ask(self, prompt: str = "") -> str:
+        """Send the pending frame plus ``prompt`` and wait for a line (EOFError on disconnect)."""
+        if prompt:
+            self.ui.line(prompt)
+        self.writer.write(self.ui.frame())
+        await self.writer.drain()
+        line = await asyncio.wait_for(self.reader.readline(), IDLE_TIMEOUT)
+        if not line:
+            raise EOFError
+        return line.decode(errors="replace").strip()
+
+    async def choose(self, prompt: str, options: Sequence[str]) -> int:
+        self.ui.line(prompt)
+        for i, opt in enumerate(options, 1):
+            self.ui.line(f"  {i}. {opt}")
+        while True:
+            s = await self.ask()
+            if s.isdigit() and 1 <= int(s) <= len(options):
+                return int(s) - 1
+            self.ui.line("Pick a number from the list.")
+
+    async def new_run(self) -> game.Player:
+        ui = self.ui
+        ui.say("=== Job Search Roguelike — v0.5.1e ===", bold=True)
+        ui.line("One action per weekday. Weekends auto-wrap bills & events.")
+        name = await self.ask("Your name:") or "Player"
+        ages = list(game.AGE_BALANCE)
+        age = ages[await self.choose("Choose your age bracket:", ages)]
+        industries = list(game.INDUSTRIES)
+        industry = industries[await self.choose("Pick your current industry:", industries)]
+        self.rng = game.RunRNG()
+        p = game.new_player(age, industry, self.rng, name=name)
+        p.seed = self.rng.seed
+        ui.line("\nFlavor: " + game.INDUSTRIES[industry]["flavor"])
+        ui.say(f"Starting stats → {p.status_line()}", color=game.Color.CYAN, bold=True)
+        return p
+
+    async def play(self, player: game.Player):
+        ui = self.ui
+        while not player.game_over:
+            ui.say("\n" + "=" * 48, color=game.Color.CYAN, bold=True)
+            ui.line(player.status_line())
+            game.show_actions(player, ui)
+            choice = await self.ask()
+            action = None
+            if choice in ("1", "2", "3", "4", "5", "6"):
+                action = game.ACTIONS[int(choice) - 1]
+            else:
+                ui.say("Pick 1–6.", color=game.Color.YELLOW, bold=True)
+            game.take_turn(player, action, self.rng, ui)
+
+        ui.say("\n=== Run Summary ===", bold=True)
+        ui.line(player.status_line())
+        ui.line("Result: " + (player.win_reason or player.loss_reason or "Unfinished"))
+
+    async def run(self):
+        try:
+            while True:
+                await self.play(await self.new_run())
+                if (await self.ask("\nStart a new run? (y/n)")).lower() != "y":
+                    break
+            self.writer.write(self.ui.take("Thanks for playing!\n").encode())
+            await self.writer.drain()
+        except (EOFError, ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.writer.close()
+
+
+async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    await Session(reader, writer).run()
+
+
+async def start_server(host: str = "127.0.0.1", port: int = 7777) -> asyncio.AbstractServer:
+    game.odds_table()
+    return await asyncio.start_server(handle, host, port, backlog=BACKLOG)
+
+
+async def serve(host: str, port: int):
+    server = await start_server(host, port)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Serving Job Search Roguelike on {addrs} — connect with: nc {host} {port}")
+    async with server:
+        await server.serve_forever()
+
+
+# -----------------------------
+# Load test
+# -----------------------------
+
+async def scripted_session(host: str, port: int, seed: int, games: int, latencies: List[float],
+                           think: float = 0.0):
+    """Play ``games`` random-play runs over one connection, timing each turn.
+
+    A turn's latency runs from sending the pick to receiving the whole next frame.
+    ``think`` is the mean pause in seconds before each pick (0 = flat out).
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    prompt = ("\n" + PROMPT).encode()
+
+    async def send(line: str) -> str:
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+        return (await reader.readuntil(prompt)).decode()
+
+    try:
+        await reader.readuntil(prompt)
+        for g in range(games):
+            await send(f"bot{seed}")
+            await send(str(rng.randint(1, len(game.AGE_BALANCE))))
+            frame = await send(str(rng.randint(1, len(game.INDUSTRIES))))
+            while "Start a new run?" not in frame:
+                if think:
+                    await asyncio.sleep(rng.uniform(0, 2 * think))
+                t0 = time.perf_counter()
+                frame = await send(str(rng.randint(1, len(game.ACTIONS))))
+                latencies.append(time.perf_counter() - t0)
+            if g < games - 1:
+                await send("y")
+        writer.write(b"n\n")
+        await writer.drain()
+        await reader.read()
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def loadtest(sessions: int, games: int, connect: Optional[str], seed: int, think: float = 0.0) -> int:
+    server = None
+    if connect:
+        host, _, port = connect.rpartition(":")
+        port = int(port)
+    else:
+        server = await start_server("127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+    latencies: List[float] = []
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(scripted_session(host, port, seed + i, games, latencies, think)
+                                     for i in range(sessions)), return_exceptions=True)
+    dt = time.perf_counter() - t0
+    if server:
+        server.close()
+        await server.wait_closed()
+
+    failed = [r for r in results if isinstance(r, BaseException)]
+    latencies.sort()
+    print(f"{sessions:,} concurrent sessions × {games} games: {len(latencies):,} turns in {dt:.2f}s "
+          f"— {len(latencies) / dt:,.0f} turns/s")
+    if latencies:
+        print(f"Turn latency p50 {percentile(latencies, 0.50) * 1000:.2f} ms, "
+              f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+    if failed:
+        print(f"{len(failed)} sessions failed, first: {failed[0]!r}")
+        return 1
+    return 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Host concurrent game sessions over a line protocol.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_serve = sub.add_parser("serve", help="accept players (try: nc HOST PORT)")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=7777)
+    p_load = sub.add_parser("loadtest", help="play scripted sessions and report turn latency")
+    p_load.add_argument("--sessions", type=int, default=1000, help="concurrent connections")
+    p_load.add_argument("--games", type=int, default=1, help="runs played per connection")
+    p_load.add_argument("--connect", metavar="HOST:PORT",
+                        help="test a running server (default: start one in this process)")
+    p_load.add_argument("--seed", type=int, default=0)
+    p_load.add_argument("--think", type=float, default=0.0, metavar="SECONDS",
+                        help="mean pause before each pick, like a human player (default 0: flat out)")
+    args = ap.parse_args()
+
+    if args.cmd == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return
+    raise SystemExit(asyncio.run(loadtest(args.sessions, args.games, args.connect, args.seed, args.think)))
+
+
+if __name__ == "__main__":
+    main()
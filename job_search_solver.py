@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — optimal-play solver (v0.5.1e Gentle Mode rules)
+# Treats a run as a finite Markov decision process and computes, by backward
+# value iteration over every (week, day) up to a week cap, the best achievable
+# win probability and the action that achieves it in each state.
+#
+# State per weekday: energy, money (bucketed), confidence (capped), the
+# rejection/streak counters, contracts, and the warm-intro / prep / mentor
+# flags. Industries only differ by tag names, so one solve per age bracket
+# covers all four of them (the solver refuses to run if game.INDUSTRY_CLASS
+# says otherwise).
+#
+# Accuracy: money buckets and caps can only make a run look worse, so every
+# figure reads a little low. Against 2M sampled runs (job_search_vec.py, 26
+# weeks), random play comes out at 21.71 / 20.92 / 22.99% for Young / Mid /
+# Late against 21.92 / 21.33 / 23.46% (±0.06). The confidence and energy caps
+# account for 0.02-0.05 points of that; the rest is money split between $50
+# buckets, which job_search_exact.py --money-step 50 shows too (21.76 / 20.94
+# / 23.01%). Optimal play's figures move by under 0.001 points from
+# confidence cap 30 to 60.
+#
+# Runtime misses the "a few seconds" target: on one core each age takes 20-25s
+# for the policy (about a third of it the forward pass that blanks unreachable
+# states, and zlib) and as long again for --random, so ~70s for all three
+# ages and ~2.5 minutes with --random.
+#
+#   python job_search_solver.py --week-cap 26 --export policy.npz
+
+import argparse
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+AGES = ("Young", "Mid", "Late")
+
+# Grid defaults: money buckets of $50 between -$500 and $2,000, confidence up to
+# 30 and energy up to 16. Values past a cap are held at the cap, which can only
+# cost value: odds keep rising with confidence up to game.odds_table().conf_max.
+# Optimal play loses under 0.001 points to that at 30, but random play drifts
+# upward and reads a point low, so it is evaluated with confidence up to 60.
+MONEY_STEP = 50
+MONEY_MIN = -500
+MONEY_MAX = 2000
+CONF_CAP = 30
+RANDOM_CONF_CAP = 60
+ENERGY_CAP = 16
+WEEK_CAP = 26
+
+# apply_flow's streak-assist threshold and check_victory_conditions' Consultant
+# gates are literals in the game script; mirrored here.
+PITY_STREAK = 3
+CONSULTANT_TAGS = 4
+
+# Axes of every value array
+E, M, C, RK, N, WARM, PREP, MENTOR = range(8)
+
+
+def rejection_loss(rejections: int) -> int:
+    """Confidence lost on the next rejection after ``rejections`` earlier ones."""
+    resilience = 0.0
+    for _ in range(rejections):
+        resilience += game.RESILIENCE_GAIN_ON_REJECT
+    return max(1, int(game.REJECTION_CONFIDENCE_LOSS - resilience))
+
+
+def _money_kernel(shift: float, lo: int = 0, hi: int = 0) -> List[Tuple[int, float]]:
+    """Bucket offsets and probabilities for money += shift + randint(lo, hi).
+
+    Amounts that fall between buckets are split between the two neighbours in
+    proportion to distance, so the expected money change is exact.
+    """
+    weights: Dict[int, float] = {}
+    span = hi - lo + 1
+    for x in range(lo, hi + 1):
+        q, r = divmod(shift + x, MONEY_STEP)
+        frac = r / MONEY_STEP
+        weights[int(q)] = weights.get(int(q), 0.0) + (1 - frac) / span
+        if frac:
+            weights[int(q) + 1] = weights.get(int(q) + 1, 0.0) + frac / span
+    return sorted(weights.items())
+
+
+class Grid:
+    """Discretised state space for one age bracket."""
+
+    def __init__(self, age: str, *, conf_cap: int = CONF_CAP, energy_cap: int = ENERGY_CAP):
+        if len(set(game.INDUSTRY_CLASS.values())) != 1:
+            raise ValueError("industries aren't interchangeable (see game.INDUSTRY_CLASS); the solver needs "
+                             "one solve to cover them all")
+        self.tags = len(game.INDUSTRY_TAGS[next(iter(game.INDUSTRIES))])
+        if self.tags >= CONSULTANT_TAGS:
+            raise ValueError("Consultant victory is reachable; the solver does not track skill levels")
+        # Every tag starts at 1 and skills never drop, so match_count is constant.
+        self.match_count = self.tags
+        self.age = age
+        bal = game.AGE_BALANCE[age]
+
+        self.money = np.arange(MONEY_MIN, MONEY_MAX + 1, MONEY_STEP)
+        self.conf = np.arange(game.CONFIDENCE_FLOOR, conf_cap + 1)
+        self.rest_gain = game.REST_GAIN_ENERGY + bal["rest_bonus"]
+        self.energy = self._energy_values(energy_cap)
+
+        # Rejection counter is capped once resilience stops lowering the hit;
+        # the streak counter is capped at the streak-assist threshold.
+        k_cap = 0
+        while k_cap < 50 and rejection_loss(k_cap) != rejection_loss(k_cap + 1):
+            k_cap += 1
+        self.rk = [(k, s) for k in range(k_cap + 1) for s in range(PITY_STREAK + 1)
+                   if s <= k or k == k_cap]
+        self.n_contracts = game.PORTFOLIO_TARGET
+        self.shape = (len(self.energy), len(self.money), len(self.conf), len(self.rk),
+                      self.n_contracts, 2, 2, 2)
+
+        self.bills = int(game.BILLS_BY_AGE[age] * bal["rent_mult"])
+        self.rent = int(game.RENT_BY_AGE[age] * bal["rent_mult"])
+        self.benefit = int(game.UNEMPLOY_BENEFIT * bal["unemp_mult"])
+
+    def _energy_values(self, cap: int) -> np.ndarray:
+        """Every energy level the rules can reach from the start, up to ``cap``."""
+        seen, todo = set(), [10]
+        costs = {game.APPLY_COST_ENERGY, game.NETWORK_COST_ENERGY, game.TRAIN_COST_ENERGY,
+                 game.INTERVIEW_PREP_COST_ENERGY}
+        while todo:
+            e = todo.pop()
+            if e in seen:
+                continue
+            seen.add(e)
+            nxt = [min(12, e + self.rest_gain), min(cap, e + game.SELF_CARE_GAIN_ENERGY),
+                   max(0, e - game.TEMP_GIG_ENERGY_COST)]
+            nxt += [e - c for c in costs if e >= c]
+            todo.extend(x for x in nxt if x not in seen)
+        return np.array(sorted(seen))
+
+    def energy_map(self, fn) -> np.ndarray:
+        vals = np.clip([fn(int(e)) for e in self.energy], self.energy[0], self.energy[-1])
+        return np.searchsorted(self.energy, vals)
+
+    def conf_map(self, fn) -> np.ndarray:
+        vals = np.clip([fn(int(c)) for c in self.conf], self.conf[0], self.conf[-1])
+        return np.searchsorted(self.conf, vals)
+
+    def rk_index(self, k: int, s: int) -> int:
+        k_cap = self.rk[-1][0]
+        return self.rk.index((min(k, k_cap), min(s, PITY_STREAK)))
+
+    def index(self, p: game.Player) -> Tuple[int, ...]:
+        """Grid cell nearest to a live player's state."""
+        rejections = round(p.resilience / game.RESILIENCE_GAIN_ON_REJECT)
+        return (int(np.argmin(np.abs(self.energy - p.energy))),
+                int(np.argmin(np.abs(self.money - p.money))),
+                int(np.searchsorted(self.conf, game.clamp(p.confidence, self.conf[0], self.conf[-1]))),
+                self.rk_index(rejections, p.consecutive_rejections),
+                min(p.contracts, self.n_contracts - 1),
+                int(p.warm_intro), int(p.interview_prep_active), int(p.mentor_boost))
+
+    def start_index(self) -> Tuple[int, ...]:
+        # Which tag Mid/Late raise doesn't matter: skills don't enter the grid
+        return self.index(game.new_player(self.age, next(iter(game.INDUSTRIES)), game.RunRNG(0)))
+
+
+def _take(a: np.ndarray, idx: np.ndarray, axis: int) -> np.ndarray:
+    return np.take(a, idx, axis=axis)
+
+
+def _money_matrix(kernel, size: int) -> np.ndarray:
+    """A _money_kernel as a (size, size) matrix; moves past either end stay at the end."""
+    rows = np.arange(size)
+    out = np.zeros((size, size), dtype=np.float32)
+    for off, p in kernel:
+        np.add.at(out, (rows, np.clip(rows + off, 0, size - 1)), p)
+    return out
+
+
+def _money_expect(a: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Expected value over a money move, as one batched matmul over the money axis.
+
+    ``a`` has energy on axis 0 and money on axis 1 (the value-array layout).
+    """
+    flat = a.reshape(a.shape[0], a.shape[1], -1)
+    return np.matmul(matrix, flat).reshape(a.shape)
+
+
+def _unless(q: np.ndarray, other, e_cut: int = 0, m_cut: int = 0) -> np.ndarray:
+    """``q`` with its first ``e_cut`` energy and ``m_cut`` money slabs taken from ``other``, in place."""
+    q[:e_cut] = other if np.isscalar(other) else other[:e_cut]
+    q[:, :m_cut] = other if np.isscalar(other) else other[:, :m_cut]
+    return q
+
+
+# The forward helpers below go from states to the states they can lead to.
+# The last energy, money or confidence index stands for every value past the
+# cap, so after a drop it can land anywhere from its usual target up to the cap.
+
+def _spread(mask: np.ndarray, idx: np.ndarray, axis: int) -> np.ndarray:
+    """Forward image of ``_take(·, idx, axis)`` on a boolean mask: cell i lands on idx[i]."""
+    out = np.zeros_like(mask)
+    src, dst = np.moveaxis(mask, axis, 0), np.moveaxis(out, axis, 0)
+    for i, j in enumerate(idx):
+        dst[j] |= src[i]
+    dst[idx[-1]:] |= src[-1]
+    return out
+
+
+def _money_spread(mask: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Forward image of ``_money_expect(·, matrix)`` on a boolean mask."""
+    out = _money_expect(mask.astype(np.float32), matrix.T) > 0
+    out[:, np.flatnonzero(matrix[-1])[0]:] |= mask[:, -1:]
+    return out
+
+
+def _capped(rows) -> Tuple[np.ndarray, np.ndarray]:
+    """Destinations per index of a capped axis, for _fan(): a table (rows
+    padded by repeating) and the top index's own targets, everything from its
+    lowest target up."""
+    rows = [np.atleast_1d(r) for r in rows]
+    width = max(len(r) for r in rows[:-1])
+    return np.array([np.resize(r, width) for r in rows]), np.arange(rows[-1].min(), len(rows))
+
+
+def _targets(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Every money bucket each row of a money matrix draws on, for _fan()."""
+    return _capped([np.flatnonzero(r) for r in matrix])
+
+
+def _fan(cells: np.ndarray, axis: int, table: np.ndarray, top: Optional[np.ndarray] = None) -> np.ndarray:
+    """Each cell (a row of grid indices) once per entry of ``table[cell[axis]]`` on
+    ``axis``; with ``top``, cells on the last index take those entries instead."""
+    if top is None:
+        out = np.repeat(cells, table.shape[1], axis=0)
+        out[:, axis] = table[cells[:, axis]].ravel()
+        return out
+    at_top = cells[:, axis] == len(table) - 1
+    capped = np.repeat(cells[at_top], len(top), axis=0)
+    capped[:, axis] = np.tile(top, at_top.sum())
+    return np.concatenate([_fan(cells[~at_top], axis, table), capped])
+
+
+class Stepper:
+    """One weekday of the rules as array operations on a Grid."""
+
+    def __init__(self, g: Grid):
+        self.g = g
+        e, c = g.energy, g.conf
+        # Energy and money ascend along their axes, so "can't afford it" is
+        # always the first few slabs: count them instead of building masks.
+        self.tired = {cost: int(np.searchsorted(e, cost)) for cost in
+                      {game.APPLY_COST_ENERGY, game.NETWORK_COST_ENERGY, game.TRAIN_COST_ENERGY,
+                       game.INTERVIEW_PREP_COST_ENERGY}}
+        self.broke = {cost: int(np.searchsorted(g.money, cost)) for cost in
+                      (game.SELF_CARE_COST_MONEY, game.INTERVIEW_PREP_COST_MONEY)}
+        self.lost = (int(np.searchsorted(e, 0, side="right")), int(np.searchsorted(g.money, 0, side="right")))
+        self.e_apply = g.energy_map(lambda x: x - game.APPLY_COST_ENERGY)
+        self.e_network = g.energy_map(lambda x: x - game.NETWORK_COST_ENERGY)
+        self.e_train = g.energy_map(lambda x: x - game.TRAIN_COST_ENERGY)
+        self.e_prep = g.energy_map(lambda x: x - game.INTERVIEW_PREP_COST_ENERGY)
+        self.e_rest = g.energy_map(lambda x: min(12, x + g.rest_gain))
+        self.e_selfcare = g.energy_map(lambda x: x + game.SELF_CARE_GAIN_ENERGY)
+        self.e_gig = g.energy_map(lambda x: max(0, x - game.TEMP_GIG_ENERGY_COST))
+        self.c_plus = {d: g.conf_map(lambda x, d=d: x + d) for d in range(4)}
+        self.c_rest = g.conf_map(lambda x: game.clamp(x + 1, 0, 99))
+
+        # Rejection: confidence hit by resilience, then counters move on.
+        # After a callback the streak resets first, so it lands on 1.
+        # Indexed as [conf, rk] so one gather covers the whole (C, RK) block.
+        self.c_reject = np.stack([g.conf_map(lambda x, k=k: max(game.CONFIDENCE_FLOOR, x - rejection_loss(k)))
+                                  for k, _ in g.rk], axis=1)
+        self.rk_reject = np.array([g.rk_index(k + 1, s + 1) for k, s in g.rk])
+        self.rk_reject_after_cb = np.array([g.rk_index(k + 1, 1) for k, _ in g.rk])
+        self.rk_callback = np.array([g.rk_index(k, 0) for k, _ in g.rk])
+
+        size = len(g.money)
+        self.m_selfcare = _money_matrix(_money_kernel(-game.SELF_CARE_COST_MONEY), size)
+        self.m_prep = _money_matrix(_money_kernel(-game.INTERVIEW_PREP_COST_MONEY), size)
+        self.m_contract = _money_matrix(_money_kernel(0, 200, 500), size)
+        self.t_selfcare, self.t_prep, self.t_contract = map(_targets, (self.m_selfcare, self.m_prep, self.m_contract))
+        self._wrap_matrices: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._odds()
+
+    def _odds(self):
+        """Apply outcome odds over (conf, rk, warm, prep, mentor) from game.odds_table()."""
+        g = self.g
+        table = game.odds_table()
+        odds = np.array(table.entries).reshape(table.shape + (3,))
+        conf = np.minimum(g.conf, table.conf_max)
+        pity = np.array([s >= PITY_STREAK for _, s in g.rk], dtype=int)
+        # (C, WARM, PREP, MENTOR, pity, emotion, 3) -> (C, RK, WARM, PREP, MENTOR, emotion, 3)
+        odds = np.moveaxis(odds[conf][:, g.match_count][:, :, :, :, pity], 4, 1)
+        callback, offer, dream = np.moveaxis(odds, -1, 0)
+        contract = np.minimum(dream + offer, 1.0) - dream
+        reject = 1.0 - dream - contract
+        # Average over the recruiter emotion, then lay out per (C, RK) cell as a
+        # (4, WARM * PREP * MENTOR) matrix: rows weight a win (1), a paid
+        # contract, a rejection after a callback and no callback.
+        weights = [callback * dream, callback * contract, callback * reject, 1 - callback]
+        self.w_apply = np.stack([w.mean(axis=-1).reshape(len(g.conf) * len(g.rk), 8) for w in weights],
+                                axis=1).astype(np.float32)
+
+    def post(self, cont: np.ndarray) -> np.ndarray:
+        """Value right after an action: loss check, then victory, then ``cont``.
+
+        The contracts axis gets one extra slot (index PORTFOLIO_TARGET) worth 1.
+        """
+        won = np.ones(cont.shape[:N] + (1,) + cont.shape[N + 1:], dtype=cont.dtype)
+        return _unless(np.concatenate([cont, won], axis=N), 0.0, *self.lost)
+
+    def q_values(self, post: np.ndarray):
+        """Yield each action's value over the grid, in game.ACTIONS order.
+
+        A generator so callers can fold a running max without holding all six.
+        """
+        g = self.g
+        n = g.n_contracts
+        stay = np.ascontiguousarray(post[:, :, :, :, :n])
+
+        # apply: flags clear; the mentor flag may come back on a rejection
+        a = _take(post[:, :, :, :, :, 0, 0, :], self.e_apply, E)
+        rej = 0.75 * a[:, :, :, :, :n, 0] + 0.25 * a[:, :, :, :, :n, 1]
+        r0 = rej[:, :, self.c_reject, self.rk_reject]
+        r1 = rej[:, :, self.c_reject, self.rk_reject_after_cb]
+        paid = _money_expect(a[:, :, :, :, 1:, 0], self.m_contract)[:, :, self.c_plus[2][:, None], self.rk_callback]
+        terms = np.stack([np.ones_like(paid), paid, r1, r0], axis=-1).transpose(2, 3, 0, 1, 4, 5)
+        q = np.matmul(terms.reshape(self.w_apply.shape[0], -1, 4), self.w_apply)
+        q = np.ascontiguousarray(q.reshape(terms.shape[:5] + (2, 2, 2)).transpose(2, 3, 0, 1, 4, 5, 6, 7))
+        yield _unless(q, stay, self.tired[game.APPLY_COST_ENERGY])
+
+        # network: warm intro with NETWORK_WARM_INTRO_CHANCE
+        b = _take(stay, self.e_network, E)[:, :, self.c_plus[1]]
+        warm = np.broadcast_to(b[:, :, :, :, :, 1:2], b.shape)
+        q = game.NETWORK_WARM_INTRO_CHANCE * warm + (1 - game.NETWORK_WARM_INTRO_CHANCE) * b
+        yield _unless(q, stay, self.tired[game.NETWORK_COST_ENERGY])
+
+        # train: skills never change an outcome (see Grid), only energy/confidence do
+        q = _take(stay, self.e_train, E)[:, :, self.c_plus[1]]
+        yield _unless(q, stay, self.tired[game.TRAIN_COST_ENERGY])
+
+        yield _take(stay, self.e_rest, E)[:, :, self.c_rest]
+
+        s = _money_expect(_take(stay, self.e_selfcare, E), self.m_selfcare)
+        q = s[:, :, self.c_plus[game.SELF_CARE_GAIN_CONF]]
+        yield _unless(q, stay, 0, self.broke[game.SELF_CARE_COST_MONEY])
+
+        # prep: only the prep-on slice is ever reached
+        p = _money_expect(_take(stay[:, :, :, :, :, :, 1:2], self.e_prep, E), self.m_prep)
+        yield _unless(np.repeat(p, 2, axis=PREP), stay, self.tired[game.INTERVIEW_PREP_COST_ENERGY],
+                      self.broke[game.INTERVIEW_PREP_COST_MONEY])
+
+    def reach(self, mask: np.ndarray, choice: np.ndarray, week: int, day: int) -> np.ndarray:
+        """States the next weekday can start in, from ``mask`` playing ``choice``.
+
+        The forward image of q_values() (and wrap() after a Friday) with the
+        outcome odds dropped, so it may hold a few states play never reaches
+        but never misses one. Won and lost runs drop out. Works on the list of
+        reachable cells, which stays a small part of the grid.
+        """
+        g = self.g
+        n = g.n_contracts
+        flat = np.flatnonzero(mask)
+        cells = np.stack(np.unravel_index(flat, g.shape), axis=1).astype(np.int16)
+        act = choice.ravel()[flat]
+        energy, money = g.energy[cells[:, E]], g.money[cells[:, M]]
+        can = np.stack([energy >= game.APPLY_COST_ENERGY, energy >= game.NETWORK_COST_ENERGY,
+                        energy >= game.TRAIN_COST_ENERGY, np.ones(len(cells), dtype=bool),
+                        money >= game.SELF_CARE_COST_MONEY,
+                        (money >= game.INTERVIEW_PREP_COST_MONEY) & (energy >= game.INTERVIEW_PREP_COST_ENERGY)])
+        ok = can[act, np.arange(len(cells))]
+        moved = [cells[~ok]]  # an action that can't be taken leaves the state as it was
+        taken = [cells[ok & (act == a)] for a in range(len(game.ACTIONS))]
+        either = np.array([[0, 1], [0, 1]])
+        top = len(g.conf) - 1
+        c_top = np.arange(len(g.conf))
+        c_top[-1] = self.c_reject[-1].min()  # a capped confidence loses at least this much
+
+        a = _fan(taken[0], E, *_capped(self.e_apply))
+        a[:, WARM] = a[:, PREP] = 0
+        for rk_next in (self.rk_reject, self.rk_reject_after_cb):
+            r = a.copy()
+            r[:, C] = np.where(a[:, C] == top, top, self.c_reject[a[:, C], a[:, RK]])
+            r[:, RK] = rk_next[a[:, RK]]
+            moved.append(_fan(_fan(r, C, *_capped(c_top)), MENTOR, either))
+        paid = a[a[:, N] < n - 1]
+        paid[:, N] += 1
+        paid[:, C] = self.c_plus[2][paid[:, C]]
+        paid[:, RK] = self.rk_callback[paid[:, RK]]
+        paid[:, MENTOR] = 0
+        moved.append(_fan(paid, M, *self.t_contract))
+
+        b = _fan(taken[1], E, *_capped(self.e_network))
+        b[:, C] = self.c_plus[1][b[:, C]]
+        moved.append(_fan(b, WARM, np.array([[0, 1], [1, 1]])))
+        x = _fan(taken[2], E, *_capped(self.e_train))
+        x[:, C] = self.c_plus[1][x[:, C]]
+        moved.append(x)
+        x = taken[3]  # rest sets energy outright, capped or not
+        x[:, E] = self.e_rest[x[:, E]]
+        x[:, C] = self.c_rest[x[:, C]]
+        moved.append(x)
+        s = taken[4]
+        s[:, E] = self.e_selfcare[s[:, E]]
+        s[:, C] = self.c_plus[game.SELF_CARE_GAIN_CONF][s[:, C]]
+        moved.append(_fan(s, M, *self.t_selfcare))
+        p = _fan(taken[5], E, *_capped(self.e_prep))
+        p[:, PREP] = 1
+        moved.append(_fan(p, M, *self.t_prep))
+
+        cells = np.concatenate(moved)
+        out = np.zeros(g.shape, dtype=bool)
+        out.ravel()[np.ravel_multi_index(tuple(cells.T), g.shape)] = True
+        _unless(out, False, *self.lost)
+        if day < 5:
+            return out
+
+        # The weekend fans every state out over dozens of money buckets, which
+        # is cheaper done over the whole grid.
+        m_bill, m_gig, m_news = self.wrap_matrices(self.shift(week))
+        gig = _money_spread(_spread(out, self.e_gig, E), m_gig)
+        nxt = _money_spread(out, m_bill) | gig | _spread(gig, self.c_plus[1], C)
+        news = _money_spread(out, m_news)
+        lo, hi = game.SMALL_GOOD_NEWS_CONF
+        for d in range(lo, hi + 1):
+            nxt |= _spread(news, self.c_plus[d], C)
+        return nxt
+
+    def shift(self, week: int) -> int:
+        """Fixed money change over weekend_wrap() of week ``week``: bills, rent, benefit."""
+        g = self.g
+        shift = -g.bills
+        if week % game.RENT_CYCLE_WEEKS == 0:
+            shift -= g.rent
+        if week - 1 < game.UNEMPLOY_WEEKS_MAX:
+            shift += g.benefit
+        return shift
+
+    def wrap_matrices(self, shift: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Money matrices for the surprise bill, temp gig and good news after a fixed ``shift``."""
+        if shift not in self._wrap_matrices:
+            size = len(self.g.money)
+            self._wrap_matrices[shift] = tuple(_money_matrix(_money_kernel(shift, lo, hi), size) for lo, hi in (
+                (-game.SURPRISE_BILL_RANGE[1], -game.SURPRISE_BILL_RANGE[0]),
+                game.TEMP_GIG_MONEY_REWARD, game.SMALL_GOOD_NEWS_MONEY))
+        return self._wrap_matrices[shift]
+
+    def wrap(self, v: np.ndarray, week: int) -> np.ndarray:
+        """Expected value over weekend_wrap() of week ``week``; ``v`` is next Monday's value."""
+        m_bill, m_gig, m_news = self.wrap_matrices(self.shift(week))
+        bill = _money_expect(v, m_bill)
+        gig = _money_expect(_take(v, self.e_gig, E), m_gig)
+        gig = 0.75 * gig + 0.25 * gig[:, :, self.c_plus[1]]
+        news = _money_expect(v, m_news)
+        lo, hi = game.SMALL_GOOD_NEWS_CONF
+        news = sum(news[:, :, self.c_plus[d]] for d in range(lo, hi + 1)) / (hi - lo + 1)
+        return 0.15 * bill + 0.35 * gig + 0.50 * news
+
+
+@dataclass
+class PolicyTable:
+    """Best action per (week, day, grid state), zlib-compressed per weekday.
+
+    States no run can be in hold 0; only the week-cap tables, which repeat
+    for every later week, are filled in everywhere.
+    """
+    age: str
+    grid_shape: Tuple[int, ...]
+    week_cap: int
+    days: Dict[Tuple[int, int], bytes]
+    _last: Optional[Tuple[Tuple[int, int], np.ndarray]] = field(default=None, repr=False)
+
+    def day_table(self, week: int, day: int) -> np.ndarray:
+        key = (min(week, self.week_cap), day)
+        if self._last is None or self._last[0] != key:  # a run walks weekdays in order
+            raw = zlib.decompress(self.days[key])
+            self._last = (key, np.frombuffer(raw, dtype=np.uint8).reshape(self.grid_shape))
+        return self._last[1]
+
+    def action(self, week: int, day: int, index: Tuple[int, ...]) -> str:
+        return game.ACTIONS[self.day_table(week, day)[index]]
+
+    def nbytes(self) -> int:
+        return sum(len(b) for b in self.days.values())
+
+
+@dataclass
+class Solution:
+    age: str
+    grid: Grid
+    win_prob: float
+    random_win_prob: float
+    policy: PolicyTable
+
+    def play(self, player: game.Player, rng=None) -> str:
+        """Policy callable for game.simulate_run(): the table's action for ``player``."""
+        return self.policy.action(player.week, player.day, self.grid.index(player))
+
+
+def random_value(age: str, *, week_cap: int = WEEK_CAP, conf_cap: int = RANDOM_CONF_CAP,
+                 energy_cap: int = ENERGY_CAP) -> float:
+    """Win probability of uniform-random play from the start of a run."""
+    g = Grid(age, conf_cap=conf_cap, energy_cap=energy_cap)
+    st = Stepper(g)
+    rand = np.zeros(g.shape, dtype=np.float32)
+    for week in range(week_cap, 0, -1):
+        for day in range(5, 0, -1):
+            cont = st.wrap(rand, week) if day == 5 else rand
+            rand = sum(st.q_values(st.post(cont))) / len(game.ACTIONS)
+    return float(rand[g.start_index()])
+
+
+def solve(age: str, *, week_cap: int = WEEK_CAP, conf_cap: int = CONF_CAP,
+          energy_cap: int = ENERGY_CAP, with_random: bool = False,
+          random_conf_cap: int = RANDOM_CONF_CAP) -> Solution:
+    """Optimal win probability and policy from the start of a run.
+
+    Runs that reach ``week_cap`` without a win count as not won. With
+    ``with_random`` the uniform-random policy is evaluated too, by
+    random_value() on a grid whose confidence reaches ``random_conf_cap``
+    (about as much work again). A forward pass afterwards blanks every
+    policy entry no run can reach, which keeps the tables small.
+    """
+    g = Grid(age, conf_cap=conf_cap, energy_cap=energy_cap)
+    st = Stepper(g)
+    best = np.zeros(g.shape, dtype=np.float32)
+    days = {}
+    for week in range(week_cap, 0, -1):
+        for day in range(5, 0, -1):
+            cont = st.wrap(best, week) if day == 5 else best
+            choice = np.zeros(g.shape, dtype=np.uint8)
+            for a, q in enumerate(st.q_values(st.post(cont))):
+                if a == 0:
+                    best = q
+                    continue
+                better = q > best
+                np.copyto(choice, a, where=better)
+                np.maximum(best, q, out=best)
+            days[(week, day)] = zlib.compress(choice.tobytes(), 1)
+    start = g.start_index()
+
+    # Only store choices for states a run can be in; the rest of each table is
+    # zero, which compresses to almost nothing. Past the week cap the last
+    # week's tables repeat, so they stay whole.
+    mask = np.zeros(g.shape, dtype=bool)
+    mask[start] = True
+    for week in range(1, week_cap + 1):
+        for day in range(1, 6):
+            choice = np.frombuffer(zlib.decompress(days[(week, day)]), dtype=np.uint8).reshape(g.shape)
+            if week < week_cap:
+                choice, mask = np.where(mask, choice, 0).astype(np.uint8), st.reach(mask, choice, week, day)
+            days[(week, day)] = zlib.compress(choice.tobytes(), 6)
+    rand = (random_value(age, week_cap=week_cap, conf_cap=random_conf_cap, energy_cap=energy_cap)
+            if with_random else float("nan"))
+    return Solution(age, g, float(best[start]), rand, PolicyTable(age, g.shape, week_cap, days))
+
+
+def export_policies(solutions: List[Solution], path: str):
+    """Save every age bracket's policy as one compressed .npz lookup table."""
+    arrays = {}
+    for sol in solutions:
+        for (week, day), blob in sol.policy.days.items():
+            arrays[f"{sol.age}/w{week:02d}d{day}"] = np.frombuffer(blob, dtype=np.uint8)
+        arrays[f"{sol.age}/shape"] = np.array(sol.policy.grid_shape)
+        arrays[f"{sol.age}/energy"] = sol.grid.energy
+        arrays[f"{sol.age}/money"] = sol.grid.money
+        arrays[f"{sol.age}/conf"] = sol.grid.conf
+        arrays[f"{sol.age}/rk"] = np.array(sol.grid.rk)
+    arrays["actions"] = np.array(game.ACTIONS)
+    np.savez_compressed(path, **arrays)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Solve for optimal play per age bracket.")
+    ap.add_argument("--week-cap", type=int, default=WEEK_CAP)
+    ap.add_argument("--conf-cap", type=int, default=CONF_CAP)
+    ap.add_argument("--random", action="store_true", help="also evaluate uniform-random play")
+    ap.add_argument("--random-conf-cap", type=int, default=RANDOM_CONF_CAP,
+                    help="confidence cap of the grid random play is evaluated on")
+    ap.add_argument("--export", metavar="FILE", help="write the policy lookup table (.npz)")
+    args = ap.parse_args()
+
+    solutions = []
+    print(f"{'Age':<6} {'Optimal':>8} {'Random':>8} {'Policy':>9} {'Time':>6}   (same for every industry)")
+    for age in AGES:
+        t0 = time.perf_counter()
+        sol = solve(age, week_cap=args.week_cap, conf_cap=args.conf_cap, with_random=args.random,
+                    random_conf_cap=args.random_conf_cap)
+        solutions.append(sol)
+        rand = f"{sol.random_win_prob:8.1%}" if args.random else f"{'—':>8}"
+        print(f"{age:<6} {sol.win_prob:8.1%} {rand} "
+              f"{sol.policy.nbytes() / 1024:7.0f}KB {time.perf_counter() - t0:5.1f}s")
+    if args.export:
+        export_policies(solutions, args.export)
+        print(f"Policy table written to {args.export}")
+
+
+if __name__ == "__main__":
+    main()
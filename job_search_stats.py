@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — streaming run statistics (v0.5.1e Gentle Mode rules)
+# A constant-memory sink for headless runs: feed it RunResults one at a time
+# and it keeps outcome counts, mean/variance and quantile sketches of weeks
+# survived and final money, grouped by age bracket and industry. Sinks from
+# separate processes add together exactly, in any order. job_search_batch.py
+# reports through it:
+#
+#   python job_search_batch.py --runs 20000 --age all --industry all
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+QUANTILE_ALPHA = 0.01  # sketch relative error: quantiles land within 1% of the true value
+
+
+@dataclass
+class Moments:
+    """Count, mean and variance of an integer stream.
+
+    Sums are kept as Python ints rather than a running float mean, so adding
+    values or merging partials never rounds and the order never matters.
+    """
+    n: int = 0
+    total: int = 0
+    total_sq: int = 0
+
+    def add(self, x: int):
+        self.n += 1
+        self.total += x
+        self.total_sq += x * x
+
+    def __add__(self, other: "Moments") -> "Moments":
+        return Moments(self.n + other.n, self.total + other.total, self.total_sq + other.total_sq)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.n if self.n else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), computed exactly before the final division."""
+        if self.n < 2:
+            return 0.0
+        return (self.n * self.total_sq - self.total * self.total) / (self.n * (self.n - 1))
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch (DDSketch) with relative error ``alpha``.
+
+    Values fall into buckets whose bounds grow by a factor of gamma, so memory
+    follows the range of values seen, not how many. Merging adds bucket counts,
+    which is exact; sketches must share the same ``alpha`` to merge.
+    """
+    __slots__ = ("alpha", "_gamma", "_log_gamma", "pos", "neg", "zero", "count")
+
+    def __init__(self, alpha: float = QUANTILE_ALPHA):
+        self.alpha = alpha
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self.pos: Counter = Counter()  # bucket index → count, for x > 0
+        self.neg: Counter = Counter()  # same, keyed by the bucket of -x
+        self.zero = 0
+        self.count = 0
+
+    def _bucket(self, x: float) -> int:
+        return math.ceil(math.log(x) / self._log_gamma)
+
+    def _value(self, i: int) -> float:
+        return 2 * self._gamma ** i / (self._gamma + 1)
+
+    def add(self, x: float):
+        self.count += 1
+        if x > 0:
+            self.pos[self._bucket(x)] += 1
+        elif x < 0:
+            self.neg[self._bucket(-x)] += 1
+        else:
+            self.zero += 1
+
+    def merge(self, other: "QuantileSketch"):
+        if other.alpha != self.alpha:
+            raise ValueError(f"can't merge sketches with alpha {self.alpha} and {other.alpha}")
+        self.pos.update(other.pos)
+        self.neg.update(other.neg)
+        self.zero += other.zero
+        self.count += other.count
+
+    def __add__(self, other: "QuantileSketch") -> "QuantileSketch":
+        out = QuantileSketch(self.alpha)
+        out.merge(self)
+        out.merge(other)
+        return out
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile ``q`` in [0, 1]; NaN if the sketch is empty."""
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for i in sorted(self.neg, reverse=True):
+            seen += self.neg[i]
+            if seen > rank:
+                return -self._value(i)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for i in sorted(self.pos):
+            seen += self.pos[i]
+            if seen > rank:
+                return self._value(i)
+        return self._value(max(self.pos))
+
+
+def wilson_interval(wins: int, runs: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a win rate (95% by default).
+
+    Unlike the normal approximation it keeps some width at 0 or ``runs``
+    wins, so a handful of runs that all went one way isn't read as certain.
+    """
+    if not runs:
+        return 0.0, 1.0
+    p = wins / runs
+    mid = (p + z * z / (2 * runs)) / (1 + z * z / runs)
+    half = z * math.sqrt(p * (1 - p) / runs + z * z / (4 * runs * runs)) / (1 + z * z / runs)
+    return mid - half, mid + half
+
+
+@dataclass
+class RunStats:
+    """Everything kept about one group of runs; ``a + b`` merges two groups."""
+    runs: int = 0
+    paths: Counter = field(default_factory=Counter)
+    win_reasons: Counter = field(default_factory=Counter)
+    loss_reasons: Counter = field(default_factory=Counter)
+    weeks: Moments = field(default_factory=Moments)
+    money: Moments = field(default_factory=Moments)
+    weeks_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    money_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def add(self, result: game.RunResult):
+        self.runs += 1
+        self.paths[result.path] += 1
+        if result.win_reason:
+            self.win_reasons[result.win_reason] += 1
+        if result.loss_reason:
+            self.loss_reasons[result.loss_reason] += 1
+        self.weeks.add(result.week)
+        self.money.add(result.money)
+        self.weeks_sketch.add(result.week)
+        self.money_sketch.add(result.money)
+
+    def __add__(self, other: "RunStats") -> "RunStats":
+        return RunStats(
+            runs=self.runs + other.runs,
+            paths=self.paths + other.paths,
+            win_reasons=self.win_reasons + other.win_reasons,
+            loss_reasons=self.loss_reasons + other.loss_reasons,
+            weeks=self.weeks + other.weeks,
+            money=self.money + other.money,
+            weeks_sketch=self.weeks_sketch + other.weeks_sketch,
+            money_sketch=self.money_sketch + other.money_sketch,
+        )
+
+    @property
+    def win_rate(self) -> float:
+        return sum(self.win_reasons.values()) / self.runs if self.runs else 0.0
+
+    def median_week(self) -> int:
+        return round(self.weeks_sketch.quantile(0.5)) if self.runs else 0
+
+
+class StatsSink:
+    """RunStats per (age bracket, industry); ``a + b`` merges two sinks.
+
+    ``copies`` maps a group to the group its RunStats were copied from rather
+    than played (see job_search_batch.share_industries()); such a group adds
+    nothing to ``played``.
+    """
+
+    def __init__(self, groups: Optional[Dict[Tuple[str, str], RunStats]] = None,
+                 copies: Optional[Dict[Tuple[str, str], Tuple[str, str]]] = None):
+        self.groups: Dict[Tuple[str, str], RunStats] = groups or {}
+        self.copies: Dict[Tuple[str, str], Tuple[str, str]] = copies or {}
+
+    def add(self, result: game.RunResult):
+        key = (result.age_bracket, result.industry)
+        stats = self.groups.get(key)
+        if stats is None:
+            stats = self.groups[key] = RunStats()
+        stats.add(result)
+
+    def extend(self, results: Iterable[game.RunResult]):
+        for result in results:
+            self.add(result)
+
+    def __add__(self, other: "StatsSink") -> "StatsSink":
+        groups: Dict[Tuple[str, str], RunStats] = {}
+        for sink in (self, other):
+            for key, stats in sink.groups.items():
+                groups[key] = groups.get(key, RunStats()) + stats
+        return StatsSink(groups, {**self.copies, **other.copies})
+
+    @property
+    def runs(self) -> int:
+        return sum(s.runs for s in self.groups.values())
+
+    @property
+    def played(self) -> int:
+        """Runs actually played, leaving out copied groups."""
+        return sum(s.runs for key, s in self.groups.items() if key not in self.copies)
+
+    def total(self, age: Optional[str] = None, industry: Optional[str] = None) -> RunStats:
+        """Merge the groups matching ``age``/``industry`` (None matches any)."""
+        out = RunStats()
+        for (a, ind), stats in self.groups.items():
+            if age in (None, a) and industry in (None, ind):
+                out = out + stats
+        return out
+
+    def report(self) -> str:
+        rows = [f"{'Group':<18} {'Runs':>8} {'Win':>6}  {'Weeks mean±sd':>13}  {'p50':>4} {'p90':>4}  "
+                f"{'Money mean':>10} {'p10':>7} {'p50':>7} {'p90':>7}"]
+        keys = sorted(self.groups)
+        if len(keys) > 1:
+            keys.append(None)
+        for key in keys:
+            s = self.groups[key] if key else self.total()
+            ws, ms = s.weeks_sketch, s.money_sketch
+            label = "/".join(key) if key else "All"
+            if key in self.copies:
+                label += "*"
+            rows.append(f"{label:<18} {s.runs:>8,} {s.win_rate:6.1%}  {s.weeks.mean:>7.1f}±{s.weeks.stdev:<5.1f}  "
+                        f"{ws.quantile(0.5):>4.0f} {ws.quantile(0.9):>4.0f}  {s.money.mean:>10,.0f} "
+                        f"{ms.quantile(0.1):>7,.0f} {ms.quantile(0.5):>7,.0f} {ms.quantile(0.9):>7,.0f}")
+        if self.copies:
+            rows.append("* same runs as an interchangeable industry's, relabelled")
+        return "\n".join(rows)
+
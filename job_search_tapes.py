@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — random tapes for common-random-number experiments
+# Pre-generates every uniform draw a run can use, one memory-mapped .npy tape
+# per subsystem, indexed by (run, weekday, slot). The scalar and vectorized
+# engines both read the tapes by index instead of drawing, so every tunable
+# variant played over the same tapes sees exactly the same dice — a draw
+# belongs to a day, not to a position in a stream — and worker processes share
+# one page-cached copy of the files.
+#
+#   python job_search_tapes.py make tapes --runs 1000000 --weeks 16
+#   python job_search_tapes.py check tapes --runs 20000 --age Mid
+
+import argparse
+import json
+import os
+import random
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+import job_search_vec as vec
+
+# Subsystem → (step, draws per step). "day" tapes have a row per weekday,
+# "week" tapes a row per weekend wrap, "run" tapes one row per run.
+SUBSYSTEMS = {
+    "setup": ("run", 2),    # age bracket skill pick (Late's shuffle uses both)
+    "policy": ("day", 1),   # random play's pick
+    "emotion": ("day", 1),  # recruiter mood on apply
+    "apply": ("day", 3),    # callback roll, dream/offer roll, contract pay
+    "train": ("day", 1),    # which tag gets trained
+    "network": ("day", 1),  # warm intro roll
+    "mentor": ("day", 1),   # mentor boost roll on a rejection
+    "events": ("week", 3),  # event roll, then that event's two amounts/rolls
+}
+DAYS_PER_WEEK = 5
+TAPE_FORMAT = 1
+# Draws are stored as uint16 and read as (x + 0.5) / 65536: strictly inside
+# (0, 1), fine-grained enough for every odds comparison, and half the size
+# of float32 tapes.
+SCALE = 1 / 65536
+CHUNK_RUNS = 65_536  # runs generated per write, to keep memory flat
+DEFAULT_WEEKS = 16   # random play never outlasts ~13 weeks
+
+
+def make_tapes(directory: str, runs: int, *, weeks: int = DEFAULT_WEEKS, seed: int = 0):
+    """Write one tape per subsystem for ``runs`` runs of up to ``weeks`` weeks."""
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    steps = {"run": (), "day": (weeks * DAYS_PER_WEEK,), "week": (weeks,)}
+    for name, (step, width) in SUBSYSTEMS.items():
+        shape = (runs,) + steps[step] + (width,)
+        tape = np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+",
+                                         dtype=np.uint16, shape=shape)
+        for lo in range(0, runs, CHUNK_RUNS):
+            hi = min(lo + CHUNK_RUNS, runs)
+            tape[lo:hi] = rng.integers(0, 65536, (hi - lo,) + shape[1:], dtype=np.uint16)
+        tape.flush()
+        del tape
+    with open(os.path.join(directory, "tapes.json"), "w", encoding="utf-8") as f:
+        json.dump({"format": TAPE_FORMAT, "runs": runs, "weeks": weeks, "seed": seed}, f)
+
+
+def _uniform(x) -> np.ndarray:
+    return (np.asarray(x, dtype=np.float64) + 0.5) * SCALE
+
+
+class TapeStream:
+    """One subsystem's draws for one run; seek() to a step, then read in order.
+
+    ``u`` holds every subsystem's draws for the run back to back; this stream's
+    start at ``base``. Offers the slice of the random.Random API the rules use,
+    mapping a uniform u to an integer as floor(u * n), the same as TapeDice.
+    """
+    __slots__ = ("u", "base", "width", "pos")
+
+    def __init__(self, u: list, base: int, width: int):
+        self.u = u
+        self.base = base
+        self.width = width
+        self.pos = base
+
+    def seek(self, step: int):
+        self.pos = self.base + step * self.width
+
+    def random(self) -> float:
+        v = self.u[self.pos]
+        self.pos += 1
+        return v
+
+    def randrange(self, n: int) -> int:
+        return int(self.random() * n)
+
+    def randint(self, a: int, b: int) -> int:
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, x: list):
+        # Fisher–Yates in random.shuffle's order
+        for i in reversed(range(1, len(x))):
+            j = int(self.random() * (i + 1))
+            x[i], x[j] = x[j], x[i]
+
+
+class TapeRNG:
+    """Stands in for game.RunRNG: one TapeStream per subsystem of tape row ``run``."""
+    __slots__ = ("seed",) + tuple(SUBSYSTEMS) + ("_days", "_flavor")
+
+    def __init__(self, tapes: "Tapes", run: int):
+        self.seed = run
+        # One conversion per run rather than one per subsystem: it's most of the setup cost
+        rows = [tapes.rows[name][run].ravel() for name in SUBSYSTEMS]
+        u = _uniform(np.concatenate(rows)).tolist()
+        base = 0
+        for (name, (_, width)), row in zip(SUBSYSTEMS.items(), rows):
+            setattr(self, name, TapeStream(u, base, width))
+            base += len(row)
+        self._days = [getattr(self, name) for name, (step, _) in SUBSYSTEMS.items() if step == "day"]
+        self._flavor = None
+
+    def at(self, week: int, day: int):
+        d = (week - 1) * DAYS_PER_WEEK + day - 1
+        for stream in self._days:
+            stream.seek(d)
+        self.events.seek(week - 1)
+
+    @property
+    def flavor(self) -> random.Random:
+        # Text only, so it isn't taped
+        if self._flavor is None:
+            self._flavor = random.Random(f"tape/{self.seed}/flavor")
+        return self._flavor
+
+
+class TapeDice:
+    """Stands in for job_search_vec.GenDice: lane ``i`` reads tape row ``start + run``."""
+    def __init__(self, tapes: "Tapes", start: int = 0):
+        self.tapes = tapes
+        self.start = start
+
+    def random(self, name: str, s: vec.VecState, idx: np.ndarray, slot: int = 0) -> np.ndarray:
+        step, _ = SUBSYSTEMS[name]
+        tape = self.tapes.rows[name]
+        runs = s.run[idx] + self.start
+        if step == "run":
+            return _uniform(tape[runs, slot])
+        if step == "week":
+            pos = s.week[idx] - 1
+        else:
+            pos = (s.week[idx] - 1) * DAYS_PER_WEEK + s.day[idx] - 1
+        # Finished lanes still get a policy pick; clamp them onto the tape
+        pos = np.minimum(pos, tape.shape[1] - 1)
+        return _uniform(tape[runs, pos, slot])
+
+    def integers(self, name: str, s: vec.VecState, idx: np.ndarray, lo: int, hi: int, slot: int = 0,
+                 dtype=np.int64) -> np.ndarray:
+        return (lo + np.floor(self.random(name, s, idx, slot) * (hi - lo))).astype(dtype)
+
+
+class Tapes:
+    """A directory written by make_tapes(), memory-mapped read-only."""
+    def __init__(self, directory: str):
+        with open(os.path.join(directory, "tapes.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != TAPE_FORMAT:
+            raise ValueError(f"unsupported tape format: {meta.get('format')!r}")
+        self.directory = directory
+        self.runs = meta["runs"]
+        self.weeks = meta["weeks"]
+        self.arrays: Dict[str, np.ndarray] = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in SUBSYSTEMS}
+        # Plain ndarray views of the same pages: indexing np.memmap is ~10x slower
+        self.rows = {name: tape.view(np.ndarray) for name, tape in self.arrays.items()}
+
+    def rng(self, run: int) -> TapeRNG:
+        if not 0 <= run < self.runs:
+            raise IndexError(f"run {run} is outside the tapes (0..{self.runs - 1})")
+        return TapeRNG(self, run)
+
+    def simulate_run(self, run: int, policy=None, age: str = "Young", industry: str = "Tech", *,
+                     max_weeks: Optional[int] = None) -> game.RunResult:
+        """game.simulate_run() on tape row ``run``; runs stop at the tape's last week."""
+        weeks = min(max_weeks or self.weeks, self.weeks)
+        return game.simulate_run(policy, run, age, industry, max_weeks=weeks, rng=self.rng(run))
+
+    def simulate_vec(self, n_runs: int, start: int = 0, age="Young", industry="Tech", policy=None, *,
+                     max_weeks: Optional[int] = None) -> vec.VecResult:
+        """vec.simulate_vec() on tape rows ``start``..``start + n_runs - 1``."""
+        if start + n_runs > self.runs:
+            raise IndexError(f"runs {start}..{start + n_runs - 1} go past the tapes ({self.runs} runs)")
+        weeks = min(max_weeks or self.weeks, self.weeks)
+        return vec.simulate_vec(n_runs, None, age, industry, policy, max_weeks=weeks,
+                                dice=TapeDice(self, start))
+
+
+_open: Dict[str, Tapes] = {}
+
+
+def open_tapes(directory: str) -> Tapes:
+    """Tapes for ``directory``, opened once per process."""
+    if directory not in _open:
+        _open[directory] = Tapes(directory)
+    return _open[directory]
+
+
+def check(tapes: Tapes, runs: int, age: str, industry: str) -> int:
+    """Play the same tape rows on both engines; every run must end identically."""
+    runs = min(runs, tapes.runs)
+    t0 = time.perf_counter()
+    scalar = [tapes.simulate_run(i, age=age, industry=industry) for i in range(runs)]
+    t_scalar = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    res = tapes.simulate_vec(runs, age=age, industry=industry)
+    t_vec = time.perf_counter() - t0
+
+    fields = ("week", "day", "energy", "money", "confidence", "contracts")
+    bad = [i for i, r in enumerate(scalar)
+           if r.path != vec.PATHS[res.outcome[i]] or any(getattr(r, f) != getattr(res, f)[i] for f in fields)]
+    print(f"{runs:,} tape runs ({age}/{industry}): scalar {runs / t_scalar:,.0f} runs/s, "
+          f"vectorized {runs / t_vec:,.0f} runs/s")
+    print(f"Win rate {sum(r.won for r in scalar) / runs:.1%}; engines differ on {len(bad)} runs")
+    if bad:
+        i = bad[0]
+        print(f"  first: run {i}: scalar {scalar[i].path} week {scalar[i].week} ${scalar[i].money}, "
+              f"vectorized {vec.PATHS[res.outcome[i]]} week {res.week[i]} ${res.money[i]}")
+        return 1
+    return 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Pre-generate random tapes for common-random-number runs.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_make = sub.add_parser("make", help="write tapes into a directory")
+    p_make.add_argument("directory")
+    p_make.add_argument("--runs", type=int, default=100_000)
+    p_make.add_argument("--weeks", type=int, default=DEFAULT_WEEKS, help="longest run the tapes cover")
+    p_make.add_argument("--seed", type=int, default=0)
+    p_check = sub.add_parser("check", help="play tapes on the scalar and vectorized engines and compare")
+    p_check.add_argument("directory")
+    p_check.add_argument("--runs", type=int, default=10_000)
+    p_check.add_argument("--age", choices=vec.AGES, default="Young")
+    p_check.add_argument("--industry", choices=vec.INDUSTRY_NAMES, default="Tech")
+    args = ap.parse_args()
+
+    if args.cmd == "make":
+        t0 = time.perf_counter()
+        make_tapes(args.directory, args.runs, weeks=args.weeks, seed=args.seed)
+        size = sum(os.path.getsize(os.path.join(args.directory, f"{n}.npy")) for n in SUBSYSTEMS)
+        print(f"Wrote {args.runs:,} runs × {args.weeks} weeks of tapes to {args.directory} "
+              f"({size / 2**20:,.0f} MiB) in {time.perf_counter() - t0:.1f}s")
+        return
+    raise SystemExit(check(Tapes(args.directory), args.runs, args.age, args.industry))
+
+
+if __name__ == "__main__":
+    main()
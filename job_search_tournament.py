@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — bot tournament (v0.5.1e Gentle Mode rules)
+# Plays every bot policy on the same seeds and the same age/industry grid
+# through job_search_batch.py, then ranks them by win rate. Outcome dice come
+# from each run's own streams and a bot only draws from the policy stream, so
+# on a given seed every bot faces the same recruiter moods and weekend events
+# for as long as their picks line up.
+#
+# Bots see a read-only PlayerView, never the Player the engine plays.
+#
+#   python job_search_tournament.py --runs 20000 --age all --industry all
+#   python job_search_tournament.py --bots always-apply,prep-then-apply --workers 8
+
+import argparse
+import math
+import time
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, List, Optional
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+from job_search_batch import simulate_batch
+from job_search_stats import RunStats
+
+Z = 1.96  # 95% intervals
+
+
+class PlayerView:
+    """Read-only window onto a Player: same field names, no assignment.
+
+    Skill levels come back as a tuple, and only the Player's query methods
+    are reachable; clone() hands out a separate Player to experiment on.
+    """
+    __slots__ = ("_player",)
+    FIELDS = frozenset(f.name for f in fields(game.Player))
+    METHODS = frozenset(("any_stat_empty", "industry_skill_match", "trained_tags", "skill", "clone",
+                         "status_line"))
+
+    def __init__(self, player: game.Player):
+        object.__setattr__(self, "_player", player)
+
+    def __getattr__(self, name: str):
+        if name == "skills":
+            return tuple(self._player.skills)
+        if name in self.FIELDS or name in self.METHODS:
+            return getattr(self._player, name)
+        raise AttributeError(f"PlayerView has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"PlayerView is read-only (tried to set {name!r})")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"PlayerView is read-only (tried to delete {name!r})")
+
+
+class Viewed:
+    """Adapts ``bot(view, rng)`` to simulate_run()'s ``policy(player, rng)``; picklable for the pool."""
+
+    def __init__(self, bot: Callable):
+        self.bot = bot
+
+    def __call__(self, player: game.Player, rng) -> str:
+        return self.bot(PlayerView(player), rng)
+
+
+# -----------------------------
+# Bots
+# -----------------------------
+# Module-level so worker processes can unpickle them.
+
+def always_apply(p: PlayerView, rng) -> str:
+    """Apply every day it leaves some energy (hitting 0 ends the run), otherwise rest."""
+    return "apply" if p.energy > game.APPLY_COST_ENERGY else "rest"
+
+
+def network_then_apply(p: PlayerView, rng) -> str:
+    """Network until a warm intro lands, then apply with it; rest when low on energy."""
+    if p.energy <= max(game.APPLY_COST_ENERGY, game.NETWORK_COST_ENERGY):
+        return "rest"
+    return "apply" if p.warm_intro else "network"
+
+
+def prep_then_apply(p: PlayerView, rng) -> str:
+    """Prep before each apply while it leaves $200 in the bank; rest when low on energy."""
+    if p.energy <= game.APPLY_COST_ENERGY:
+        return "rest"
+    if (not p.interview_prep_active and p.energy > game.INTERVIEW_PREP_COST_ENERGY + game.APPLY_COST_ENERGY
+            and p.money >= game.INTERVIEW_PREP_COST_MONEY + 200):
+        return "prep"
+    return "apply"
+
+
+def rest_when_tired(p: PlayerView, rng) -> str:
+    """Random play, except rest whenever energy is at most 2."""
+    return "rest" if p.energy <= 2 else rng.choice(game.ACTIONS)
+
+
+def random_bot(p: PlayerView, rng) -> str:
+    return rng.choice(game.ACTIONS)
+
+
+BOTS: Dict[str, Callable] = {
+    "random": random_bot,
+    "always-apply": always_apply,
+    "network-then-apply": network_then_apply,
+    "prep-then-apply": prep_then_apply,
+    "rest-when-tired": rest_when_tired,
+}
+
+
+@dataclass
+class Entry:
+    bot: str
+    stats: RunStats
+    seconds: float
+    played: int  # runs actually played; fewer than stats.runs when industries were shared
+
+    @property
+    def margin(self) -> float:
+        """95% half-width of the win rate."""
+        p, n = self.stats.win_rate, self.played
+        return Z * math.sqrt(p * (1 - p) / n) if n else 0.0
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.played / self.seconds if self.seconds else 0.0
+
+
+def tournament(bots: Dict[str, Callable], runs: int, workers: Optional[int] = None, *, seed: int = 0,
+               age: str = "all", industry: str = "all") -> List[Entry]:
+    """Play ``runs`` runs per bot on the same seeds and groups; best win rate first.
+
+    Each bot is ``bot(view, rng)`` with a PlayerView and the run's policy
+    stream, returning a key of game.ACTIONS.
+    """
+    entries = []
+    for name, bot in bots.items():
+        t0 = time.perf_counter()
+        sink = simulate_batch(runs, workers, seed=seed, age=age, industry=industry, policy=Viewed(bot))
+        entries.append(Entry(name, sink.total(), time.perf_counter() - t0, sink.played))
+    entries.sort(key=lambda e: -e.stats.win_rate)
+    return entries
+
+
+def leaderboard(entries: List[Entry]) -> str:
+    rows = [f"{'#':>2}  {'Bot':<20} {'Win':>6} {'±95%':>6} {'Runs/s':>8}  Win paths"]
+    for rank, e in enumerate(entries, 1):
+        s = e.stats
+        paths = ", ".join(f"{p} {n / s.runs:.1%}" for p, n in s.paths.most_common()
+                          if p not in ("Loss", "Unfinished"))
+        rows.append(f"{rank:>2}  {e.bot:<20} {s.win_rate:6.1%} {e.margin:6.1%} {e.runs_per_second:>8,.0f}  {paths}")
+    return "\n".join(rows)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Rank bot policies on identical seeds.")
+    ap.add_argument("--runs", type=int, default=20_000, help="runs per bot")
+    ap.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--age", choices=list(game.AGE_BALANCE) + ["all"], default="all")
+    ap.add_argument("--industry", choices=list(game.INDUSTRIES) + ["all"], default="all")
+    ap.add_argument("--bots", default=",".join(BOTS), help=f"comma-separated, from: {', '.join(BOTS)}")
+    args = ap.parse_args()
+    names = [b.strip() for b in args.bots.split(",") if b.strip()]
+    unknown = [b for b in names if b not in BOTS]
+    if unknown:
+        ap.error(f"unknown bot(s): {', '.join(unknown)}")
+
+    print(f"{args.runs:,} runs per bot ({args.age}/{args.industry}, seed {args.seed})")
+    print(leaderboard(tournament({b: BOTS[b] for b in names}, args.runs, args.workers, seed=args.seed,
+                                 age=args.age, industry=args.industry)))
+
+
+if __name__ == "__main__":
+    main()
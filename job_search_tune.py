@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — balance tuner (v0.5.1e Gentle Mode rules)
+# Searches the tunables for values that put each age bracket's random-play win
+# rate inside a target band. Every candidate is scored on the same seeds
+# (common random numbers), and runs stop early once the confidence interval
+# shows a candidate is clearly in or clearly out of band.
+#
+#   python job_search_tune.py --target Young=32:35 --target Mid=32:35 --target Late=32:35
+
+import argparse
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+import job_search_vec as vec
+from job_search_stats import wilson_interval
+
+AGES = vec.AGES
+
+# Runs added per evaluation stage for one age bracket. A candidate advances to
+# the next stage only while its interval still straddles a band edge.
+STAGES = (4_000, 16_000, 64_000, 256_000)
+Z = 1.96  # 95% intervals
+
+# The README's Gentle Mode target
+DEFAULT_BAND = (0.32, 0.35)
+
+
+@dataclass
+class Tunable:
+    """One knob: a path into the game module (global name, then dict keys)."""
+    path: Tuple[str, ...]
+    step: float
+    lo: float
+    hi: float
+    min_step: float
+
+    @property
+    def name(self) -> str:
+        return ".".join(self.path)
+
+    @property
+    def integer(self) -> bool:
+        return isinstance(self.get(), int)
+
+    @property
+    def ages(self) -> Tuple[str, ...]:
+        """Age brackets this knob moves; all of them for a global."""
+        return tuple(a for a in AGES if a in self.path) or AGES
+
+    def get(self):
+        v = getattr(game, self.path[0])
+        for key in self.path[1:]:
+            v = v[key]
+        return v
+
+    def set(self, value):
+        if len(self.path) == 1:
+            setattr(game, self.path[0], value)
+            return
+        d = getattr(game, self.path[0])
+        for key in self.path[1:-1]:
+            d = d[key]
+        d[self.path[-1]] = value
+
+    def clamp(self, value):
+        value = min(self.hi, max(self.lo, value))
+        return int(round(value)) if self.integer else round(value, 4)
+
+
+def _per_age(table: str, key: Optional[str], step, lo, hi, min_step) -> List[Tunable]:
+    return [Tunable((table, age) + ((key,) if key else ()), step, lo, hi, min_step) for age in AGES]
+
+
+# AGE_BALANCE's "offer_bonus" is left out: no rule reads it.
+TUNABLES = (
+    [Tunable(("BASE_CALLBACK_ODDS",), 0.04, 0.05, 0.60, 0.005),
+     Tunable(("BASE_OFFER_ODDS",), 0.04, 0.05, 0.70, 0.005),
+     Tunable(("REST_GAIN_ENERGY",), 2, 2, 10, 1)]
+    + _per_age("AGE_BALANCE", "rest_bonus", 1, 0, 4, 1)
+    + _per_age("AGE_BALANCE", "rent_mult", 0.08, 0.50, 1.50, 0.01)
+    + _per_age("AGE_BALANCE", "unemp_mult", 0.10, 0.50, 2.00, 0.01)
+    + _per_age("RENT_BY_AGE", None, 100, 200, 2000, 10)
+)
+
+
+@contextmanager
+def overrides(values: Dict[str, float], tunables: Iterable[Tunable] = TUNABLES):
+    """Temporarily set tunables by name on the game module."""
+    by_name = {t.name: t for t in tunables}
+    saved = {name: by_name[name].get() for name in values}
+    try:
+        for name, v in values.items():
+            by_name[name].set(v)
+        game.refresh_odds()
+        yield
+    finally:
+        for name, v in saved.items():
+            by_name[name].set(v)
+        game.refresh_odds()
+
+
+@dataclass
+class Estimate:
+    wins: int = 0
+    runs: int = 0
+
+    @property
+    def rate(self) -> float:
+        return self.wins / self.runs if self.runs else 0.0
+
+    def interval(self, z: float = Z) -> Tuple[float, float]:
+        """Wilson score interval for the win rate."""
+        return wilson_interval(self.wins, self.runs, z)
+
+    def miss(self, band: Tuple[float, float]) -> float:
+        """How far the interval reaches past the band (0 once confirmed).
+
+        Scoring the interval rather than the point estimate keeps an in-band
+        but unconfirmed bracket pulling toward the band's middle.
+        """
+        lo, hi = self.interval()
+        return max(band[0] - lo, hi - band[1], 0.0)
+
+    def settled(self, band: Tuple[float, float]) -> bool:
+        """True once the interval sits wholly inside or wholly outside the band."""
+        lo, hi = self.interval()
+        return (band[0] <= lo and hi <= band[1]) or hi < band[0] or lo > band[1]
+
+    def confirmed(self, band: Tuple[float, float]) -> bool:
+        lo, hi = self.interval()
+        return band[0] <= lo and hi <= band[1]
+
+
+def estimate(age: str, band: Tuple[float, float], *, seed: int = 0, stages=STAGES) -> Estimate:
+    """Win rate of random play under the current tunables, stopping early once settled.
+
+    Stage ``i`` for an age always uses the same seed, so every candidate is
+    played on the same dice.
+    """
+    est = Estimate()
+    for i, n in enumerate(stages):
+        result = vec.simulate_vec(n, seed=[seed, AGES.index(age), i], age=age)
+        est.wins += int(result.won.sum())
+        est.runs += n
+        if est.settled(band):
+            break
+    return est
+
+
+def _score(ests: Dict[str, Estimate], targets: Dict[str, Tuple[float, float]]) -> float:
+    return sum(ests[a].miss(band) for a, band in targets.items())
+
+
+def tune(targets: Dict[str, Tuple[float, float]], tunables: List[Tunable] = TUNABLES, *,
+         seed: int = 0, max_rounds: int = 60, log=print) -> Tuple[Dict[str, float], Dict[str, Estimate]]:
+    """Coordinate search: move whichever knob cuts the total miss most, halving steps when none does.
+
+    Returns the chosen values (by tunable name) and the estimates they reached.
+    The game module is left as it was.
+    """
+    values = {t.name: t.get() for t in tunables}
+    steps = {t.name: t.step for t in tunables}
+
+    def evaluate(vals, ages):
+        with overrides(vals, tunables):
+            return {a: estimate(a, targets[a], seed=seed) for a in ages}
+
+    ests = evaluate(values, targets)
+    for rnd in range(1, max_rounds + 1):
+        if all(ests[a].confirmed(band) for a, band in targets.items()):
+            break
+        best, best_score = None, _score(ests, targets)
+        for t in tunables:
+            ages = [a for a in t.ages if a in targets]
+            if all(ests[a].confirmed(targets[a]) for a in ages):
+                continue
+            for sign in (1, -1):
+                v = t.clamp(values[t.name] + sign * steps[t.name])
+                if v == values[t.name]:
+                    continue
+                cand = dict(ests, **evaluate(dict(values, **{t.name: v}), ages))
+                score = _score(cand, targets)
+                if score < best_score:
+                    best, best_score = (t.name, v, cand), score
+        if best is None:
+            shrinkable = [t for t in tunables if steps[t.name] > t.min_step]
+            if not shrinkable:
+                break
+            for t in shrinkable:
+                steps[t.name] = max(t.min_step, steps[t.name] / 2)
+            continue
+        name, v, ests = best
+        log(f"round {rnd:2d}: {name} {values[name]} → {v}  (miss {best_score:.2%})")
+        values[name] = v
+    # Final word on each bracket at full precision
+    ests = evaluate(values, targets)
+    return values, ests
+
+
+def tunables_block(values: Dict[str, float], tunables: List[Tunable] = TUNABLES) -> str:
+    """Source for every game constant the values touch, ready to paste over the originals."""
+    out = []
+    with overrides(values, tunables):
+        for top in dict.fromkeys(t.path[0] for t in tunables):
+            v = getattr(game, top)
+            if not isinstance(v, dict):
+                out.append(f"{top} = {v!r}")
+                continue
+            out.append(f"{top} = {{")
+            for key, item in v.items():
+                if isinstance(item, dict):
+                    body = ", ".join(f'"{k}": {x!r}' for k, x in item.items())
+                    out.append(f'    "{key}": {{{body}}},')
+                else:
+                    out.append(f'    "{key}": {item!r},')
+            out.append("}")
+    return "\n".join(out)
+
+
+def _band(text: str) -> Tuple[str, Tuple[float, float]]:
+    age, _, rng = text.partition("=")
+    lo, _, hi = rng.partition(":")
+    if age not in AGES or not hi:
+        raise argparse.ArgumentTypeError(f"expected AGE=LO:HI in percent, e.g. Young=32:35 (got {text!r})")
+    return age, (float(lo) / 100, float(hi) / 100)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Tune balance constants toward target win-rate bands.")
+    ap.add_argument("--target", type=_band, action="append", metavar="AGE=LO:HI",
+                    help="win-rate band in percent; repeat per age (default: every age 32:35)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--max-rounds", type=int, default=60)
+    args = ap.parse_args()
+    targets = dict(args.target) if args.target else {a: DEFAULT_BAND for a in AGES}
+
+    t0 = time.perf_counter()
+    values, ests = tune(targets, seed=args.seed, max_rounds=args.max_rounds)
+    print(f"\nSearch took {time.perf_counter() - t0:.1f}s")
+    for age, band in targets.items():
+        e = ests[age]
+        lo, hi = e.interval()
+        status = "in band" if e.confirmed(band) else "NOT confirmed"
+        print(f"  {age:<6} {e.rate:6.2%}  95% CI {lo:.2%}–{hi:.2%}  ({e.runs:,} runs)  "
+              f"target {band[0]:.0%}–{band[1]:.0%}: {status}")
+    print("\n# --- tunables (paste over the originals) ---")
+    print(tunables_block(values))
+
+
+if __name__ == "__main__":
+    main()
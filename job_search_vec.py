@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# Job Search Roguelike — vectorized Monte Carlo kernel (v0.5.1e Gentle Mode rules)
+# Steps thousands of runs per weekday in lockstep with NumPy arrays instead of
+# one Player object at a time. Rules mirror the game script one-to-one; tunables
+# are read from it on every call, so edited knobs are picked up immediately.
+#
+# Throughput: 1M random-play runs at about 720–840k runs/s on one core, i.e.
+# 75–90x the scalar simulate_run() loop (8–11k runs/s), not the 100x first
+# aimed for. No single hotspot is left: a day is a few dozen array passes
+# (dice draws, lane gathers, masked writes) that each cost about the same.
+#
+#   python job_search_vec.py --runs 1000000 --age Mid --industry Tech
+
+import argparse
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+import job_search_roguelike_v05_1e_gentle_mode_tuned_title_exitfix_fixed as game
+
+AGES = ("Young", "Mid", "Late")
+INDUSTRY_NAMES = tuple(game.INDUSTRIES)
+TAGS_PER_INDUSTRY = len(next(iter(game.INDUSTRIES.values()))["skills"])
+
+# Outcome codes; labels match RunResult.path so scalar and batch stats line up
+RUNNING, DREAM, FREELANCE, CONSULTANT, LOSS = range(5)
+PATHS = ("Unfinished", "Landed Dream Job", "Sustainable Freelance Career", "Consultant Victory", "Loss")
+
+# Re-compact the lane arrays once fewer than this share of lanes is still playing
+COMPACT_BELOW = 0.7
+
+
+class VecState:
+    """Struct-of-arrays Player: one lane per run.
+
+    ``skills`` holds only the run's own industry tags (sorted by name): those
+    are the only skills new_player() and act_train() ever raise, so the other
+    columns of Player.skills are always zero and can't change any rule.
+    """
+    FIELDS = ("run", "age", "industry", "week", "day", "turns", "energy", "money", "confidence",
+              "resilience", "unemployed_weeks_paid", "contracts", "interview_prep_active",
+              "warm_intro", "mentor_boost", "consecutive_rejections", "skills", "outcome")
+
+    def __init__(self, **arrays):
+        for name in self.FIELDS:
+            setattr(self, name, arrays[name])
+
+    def __len__(self):
+        return len(self.run)
+
+    @classmethod
+    def new(cls, ages: np.ndarray, industries: np.ndarray, dice: "GenDice") -> "VecState":
+        """Vectorized new_player(): base stats plus the age bracket trade-offs."""
+        n = len(ages)
+        lanes = np.arange(n)
+        skills = np.ones((n, TAGS_PER_INDUSTRY), dtype=np.int16)
+        mid, late = ages == 1, ages == 2
+        s = cls(
+            run=lanes,
+            age=ages.astype(np.int8),
+            industry=industries.astype(np.int8),
+            week=np.ones(n, np.int16),
+            day=np.ones(n, np.int16),
+            turns=np.zeros(n, np.int16),
+            energy=np.full(n, 10, np.int16),
+            money=np.where(late, 500, 400).astype(np.int32),
+            confidence=np.select([mid, late], [11, 12], 10).astype(np.int16),
+            resilience=np.zeros(n, np.float64),
+            unemployed_weeks_paid=np.zeros(n, np.int16),
+            contracts=np.zeros(n, np.int16),
+            interview_prep_active=np.zeros(n, bool),
+            warm_intro=np.zeros(n, bool),
+            mentor_boost=np.zeros(n, bool),
+            consecutive_rejections=np.zeros(n, np.int16),
+            skills=skills,
+            outcome=np.zeros(n, np.int8),
+        )
+        # Mid: +1 to one random tag. Late: shuffle then +1 to the first two,
+        # i.e. every tag but one random leftover.
+        pick = dice.integers("setup", s, lanes, 0, TAGS_PER_INDUSTRY)
+        skills[lanes[mid], pick[mid]] += 1
+        skills[late] += 1
+        skills[lanes[late], pick[late]] -= 1
+        return s
+
+    def take(self, lanes: np.ndarray) -> "VecState":
+        return VecState(**{name: getattr(self, name).take(lanes, axis=0) for name in self.FIELDS})
+
+
+class AgeTables:
+    """Per-bracket knobs from AGE_BALANCE/BILLS_BY_AGE/RENT_BY_AGE, indexed by age code,
+    plus the game's apply odds table.
+
+    Built once per batch from the live tunables, with the same int() rounding
+    as weekly_costs().
+    """
+    def __init__(self):
+        bal = [game.AGE_BALANCE[a] for a in AGES]
+        self.rest_gain = np.array([game.REST_GAIN_ENERGY + b["rest_bonus"] for b in bal], np.int16)
+        self.bills = np.array([int(game.BILLS_BY_AGE[a] * b["rent_mult"]) for a, b in zip(AGES, bal)], np.int32)
+        self.rent = np.array([int(game.RENT_BY_AGE[a] * b["rent_mult"]) for a, b in zip(AGES, bal)], np.int32)
+        self.benefit = np.array([int(game.UNEMPLOY_BENEFIT * b["unemp_mult"]) for b in bal], np.int32)
+        self.emotion_mods = np.array([e[1] for e in game.RECRUITER_EMOTIONS])
+        odds = game.odds_table()
+        self.odds = np.array(odds.entries)  # (entries, 3): callback, offer, dream
+        self.odds_shape = odds.shape
+        # One contiguous column per outcome: gathering three 1-D arrays is far
+        # cheaper than gathering rows of the (entries, 3) table
+        self.callback_odds, self.offer_odds, self.dream_odds = self.odds.T.copy()
+
+
+class GenDice:
+    """Fresh draws from a NumPy Generator for the lanes ``idx``.
+
+    ``name`` and ``slot`` say which subsystem a draw belongs to; they're ignored
+    here, but TapeDice (job_search_tapes.py) reads that tape instead, so the
+    rules can run on pre-generated numbers without knowing it.
+    """
+    def __init__(self, rng: np.random.Generator):
+        self.rng = rng
+
+    def random(self, name: str, s: VecState, idx: np.ndarray, slot: int = 0) -> np.ndarray:
+        return self.rng.random(len(idx))
+
+    def integers(self, name: str, s: VecState, idx: np.ndarray, lo: int, hi: int, slot: int = 0,
+                 dtype=np.int64) -> np.ndarray:
+        """Integers in [lo, hi)."""
+        return self.rng.integers(lo, hi, len(idx), dtype=dtype)
+
+
+# Every rule below takes ``m``, the mask of lanes doing it today; finished runs
+# and lanes on other actions are masked out. Rules that roll dice narrow the
+# mask to lane indexes first so they only draw numbers for the lanes involved.
+# Lane subsets are picked with idx.compress(hit) and flags set with putmask():
+# boolean indexing branches per element and is several times slower on the
+# coin-flip masks a roll produces.
+
+def rejection_hit(s: VecState, idx: np.ndarray, dice: GenDice):
+    res = s.resilience[idx]
+    loss = np.maximum(1, np.trunc(game.REJECTION_CONFIDENCE_LOSS - res)).astype(np.int16)
+    s.confidence[idx] = np.maximum(game.CONFIDENCE_FLOOR, s.confidence[idx] - loss)
+    s.resilience[idx] = res + game.RESILIENCE_GAIN_ON_REJECT
+    s.consecutive_rejections[idx] += 1
+    s.mentor_boost[idx.compress(dice.random("mentor", s, idx) < 0.25)] = True
+
+
+def apply_flow(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    idx = np.flatnonzero(m & (s.energy >= game.APPLY_COST_ENERGY))
+    s.energy[idx] -= game.APPLY_COST_ENERGY
+    emotion = dice.integers("emotion", s, idx, 0, len(t.emotion_mods))
+
+    # Same layout as OddsTable.index(), spelled out: ravel_multi_index() and a
+    # row-wise sum over the skill columns were most of this function's time
+    conf_max, n_match = t.odds_shape[:2]
+    skills = s.skills.take(idx, axis=0)
+    match = (skills[:, 0] > 0).astype(np.int32)
+    for k in range(1, skills.shape[1]):
+        match += skills[:, k] > 0
+    cell = np.minimum(s.confidence.take(idx), conf_max - 1).astype(np.int32) * n_match + match
+    for flag in (s.warm_intro, s.interview_prep_active, s.mentor_boost):
+        cell = cell * 2 + flag.take(idx)
+    cell = (cell * 2 + (s.consecutive_rejections.take(idx) >= 3)) * len(t.emotion_mods) + emotion
+    callback_odds = t.callback_odds.take(cell)
+    offer_odds = t.offer_odds.take(cell)
+    dream_odds = t.dream_odds.take(cell)
+
+    s.warm_intro[idx] = False
+    s.interview_prep_active[idx] = False
+    s.mentor_boost[idx] = False
+
+    callback = dice.random("apply", s, idx, 0) < callback_odds
+    s.consecutive_rejections[idx.compress(callback)] = 0
+    r = dice.random("apply", s, idx, 1)
+    dream = callback & (r < dream_odds)
+    contract = callback & ~dream & (r < dream_odds + offer_odds)
+
+    s.outcome[idx.compress(dream)] = DREAM
+    won = idx.compress(contract)
+    s.contracts[won] += 1
+    s.money[won] += dice.integers("apply", s, won, 200, 501, 2).astype(np.int32)
+    s.confidence[won] += 2
+    rejection_hit(s, idx.compress(~dream & ~contract), dice)
+
+
+def act_network(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    idx = np.flatnonzero(m & (s.energy >= game.NETWORK_COST_ENERGY))
+    s.energy[idx] -= game.NETWORK_COST_ENERGY
+    s.confidence[idx] += 1
+    s.warm_intro[idx.compress(dice.random("network", s, idx) < game.NETWORK_WARM_INTRO_CHANCE)] = True
+
+
+def act_train(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    idx = np.flatnonzero(m & (s.energy >= game.TRAIN_COST_ENERGY))
+    s.energy[idx] -= game.TRAIN_COST_ENERGY
+    tag = dice.integers("train", s, idx, 0, TAGS_PER_INDUSTRY)
+    # skills is always C-contiguous (built by new() or take()), so this is a view
+    s.skills.reshape(-1)[idx * TAGS_PER_INDUSTRY + tag] += game.TRAIN_GAIN_SKILL
+    s.confidence[idx] += 1
+
+
+def act_rest(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    idx = np.flatnonzero(m)
+    s.energy[idx] = np.minimum(12, s.energy[idx] + t.rest_gain.take(s.age[idx]))
+    s.confidence[idx] = np.clip(s.confidence[idx] + 1, 0, 99)
+
+
+def act_selfcare(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    ok = m & (s.money >= game.SELF_CARE_COST_MONEY)
+    s.money -= ok * np.int32(game.SELF_CARE_COST_MONEY)
+    s.energy += ok * np.int16(game.SELF_CARE_GAIN_ENERGY)
+    s.confidence += ok * np.int16(game.SELF_CARE_GAIN_CONF)
+
+
+def act_interview_prep(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    ok = m & (s.money >= game.INTERVIEW_PREP_COST_MONEY) & (s.energy >= game.INTERVIEW_PREP_COST_ENERGY)
+    s.money -= ok * np.int32(game.INTERVIEW_PREP_COST_MONEY)
+    s.energy -= ok * np.int16(game.INTERVIEW_PREP_COST_ENERGY)
+    s.interview_prep_active |= ok
+
+
+# Same order as game.ACTIONS, so action codes are indexes into it
+ACTION_FUNCS = (apply_flow, act_network, act_train, act_rest, act_selfcare, act_interview_prep)
+
+
+def weekly_costs(s: VecState, m: np.ndarray, t: AgeTables):
+    idx = np.flatnonzero(m)
+    age = s.age[idx]
+    money = s.money[idx] - t.bills.take(age)
+    money -= np.where(s.week[idx] % game.RENT_CYCLE_WEEKS == 0, t.rent.take(age), 0)
+    paid = s.unemployed_weeks_paid[idx] < game.UNEMPLOY_WEEKS_MAX
+    s.money[idx] = money + np.where(paid, t.benefit.take(age), 0)
+    s.unemployed_weeks_paid[idx] += paid.astype(np.int16)
+
+
+def random_weekly_event(s: VecState, m: np.ndarray, dice: GenDice):
+    idx = np.flatnonzero(m)
+    roll = dice.random("events", s, idx, 0)
+    bill = idx.compress(roll < 0.15)
+    gig = idx.compress((roll >= 0.15) & (roll < 0.50))
+    news = idx.compress(roll >= 0.50)
+    lo, hi = game.SURPRISE_BILL_RANGE
+    s.money[bill] -= dice.integers("events", s, bill, lo, hi + 1, 1).astype(np.int32)
+    lo, hi = game.TEMP_GIG_MONEY_REWARD
+    s.money[gig] += dice.integers("events", s, gig, lo, hi + 1, 1).astype(np.int32)
+    s.energy[gig] = np.maximum(0, s.energy[gig] - game.TEMP_GIG_ENERGY_COST)
+    s.confidence[gig] += (dice.random("events", s, gig, 2) < 0.25).astype(np.int16)
+    lo, hi = game.SMALL_GOOD_NEWS_MONEY
+    s.money[news] += dice.integers("events", s, news, lo, hi + 1, 1).astype(np.int32)
+    lo, hi = game.SMALL_GOOD_NEWS_CONF
+    s.confidence[news] += dice.integers("events", s, news, lo, hi + 1, 2).astype(np.int16)
+
+
+def weekend_wrap(s: VecState, m: np.ndarray, dice: GenDice, t: AgeTables):
+    weekly_costs(s, m, t)
+    random_weekly_event(s, m, dice)
+    s.week += m
+    np.putmask(s.day, m, 1)
+
+
+def check_loss(s: VecState, m: np.ndarray):
+    out = (s.energy <= 0) | (s.confidence <= 0) | (s.money <= 0)
+    np.putmask(s.outcome, m & out, LOSS)
+
+
+def check_victory_conditions(s: VecState, m: np.ndarray):
+    freelance = m & (s.contracts >= game.PORTFOLIO_TARGET)
+    np.putmask(s.outcome, freelance, FREELANCE)
+    # Cheap stat gates first; trained tags are only counted for the few lanes past them
+    gate = m & ~freelance & (s.confidence >= 16) & (s.money >= 1500)
+    if gate.any():
+        idx = np.flatnonzero(gate)
+        s.outcome[idx.compress((s.skills[idx] >= 2).sum(axis=1) >= 4)] = CONSULTANT
+
+
+def take_turn(s: VecState, actions: np.ndarray, dice: GenDice, t: AgeTables):
+    """Vectorized game.take_turn(). Lanes with action -1 are finished and sit out."""
+    for code, fn in enumerate(ACTION_FUNCS):
+        m = actions == code
+        if m.any():
+            fn(s, m, dice, t)
+    acted = actions >= 0
+    s.turns += acted
+    # A Dream Job offer ends the run before the loss check can overrule it
+    playing = acted & (s.outcome == RUNNING)
+    check_loss(s, playing)
+    playing &= s.outcome == RUNNING
+    check_victory_conditions(s, playing)
+    playing &= s.outcome == RUNNING
+    s.day += playing
+    wrap = playing & (s.day > 5)
+    if wrap.any():
+        weekend_wrap(s, wrap, dice, t)
+
+
+def random_policy(s: VecState, dice: GenDice) -> np.ndarray:
+    return dice.integers("policy", s, np.arange(len(s)), 0, len(game.ACTIONS), dtype=np.int8)
+
+
+@dataclass
+class VecResult:
+    age: np.ndarray
+    industry: np.ndarray
+    outcome: np.ndarray
+    week: np.ndarray
+    day: np.ndarray
+    turns: np.ndarray
+    energy: np.ndarray
+    money: np.ndarray
+    confidence: np.ndarray
+    contracts: np.ndarray
+
+    def __len__(self):
+        return len(self.outcome)
+
+    @property
+    def won(self) -> np.ndarray:
+        return (self.outcome != RUNNING) & (self.outcome != LOSS)
+
+    def counts(self) -> Counter:
+        """Runs per outcome label (same labels as RunResult.path)."""
+        codes = np.bincount(self.outcome, minlength=len(PATHS))
+        return Counter({PATHS[k]: int(c) for k, c in enumerate(codes) if c})
+
+
+def _codes(value, names, n: int) -> np.ndarray:
+    if isinstance(value, str):
+        return np.full(n, names.index(value), np.int64)
+    return np.asarray([names.index(v) if isinstance(v, str) else v for v in value], np.int64)
+
+
+def simulate_vec(n_runs: int, seed: Optional[int] = None, age="Young", industry="Tech",
+                 policy=None, *, max_weeks: int = game.MAX_SIM_WEEKS, dice=None) -> VecResult:
+    """Play ``n_runs`` headless runs in lockstep; vectorized simulate_run().
+
+    ``age``/``industry`` take one name for every run or a per-run sequence of
+    names or codes. ``policy(state, dice)`` returns an action code per lane.
+    ``dice`` defaults to GenDice over default_rng(seed); pass a TapeDice to
+    play pre-generated tapes instead.
+    """
+    policy = policy or random_policy
+    dice = dice or GenDice(np.random.default_rng(seed))
+    tables = AgeTables()
+    s = VecState.new(_codes(age, AGES, n_runs), _codes(industry, INDUSTRY_NAMES, n_runs), dice)
+    out = {name: getattr(s, name).copy() for name in VecResult.__dataclass_fields__}
+
+    while len(s):
+        live = (s.outcome == RUNNING) & (s.week <= max_weeks)
+        if live.mean() < COMPACT_BELOW:
+            done = np.flatnonzero(~live)
+            for name in out:
+                out[name][s.run[done]] = getattr(s, name)[done]
+            s = s.take(np.flatnonzero(live))
+            live = np.ones(len(s), bool)
+            continue
+        actions = policy(s, dice)
+        np.putmask(actions, ~live, -1)
+        take_turn(s, actions, dice, tables)
+    return VecResult(**out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Vectorized Monte Carlo batch of headless runs.")
+    ap.add_argument("--runs", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--age", choices=AGES, default="Young")
+    ap.add_argument("--industry", choices=INDUSTRY_NAMES, default="Tech")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    res = simulate_vec(args.runs, args.seed, args.age, args.industry)
+    dt = time.perf_counter() - t0
+    print(f"{args.runs:,} runs ({args.age}/{args.industry}) in {dt:.2f}s — {args.runs / dt:,.0f} runs/s")
+    for path, count in res.counts().most_common():
+        print(f"  {path:<30} {count / args.runs:6.1%}")
+
+
+if __name__ == "__main__":
+    main()